@@ -23,6 +23,8 @@ from algorithms.dijkstra import DijkstraVisualizer
 from algorithms.astar import AStarVisualizer
 from algorithms.greedy import GreedyVisualizer
 from utils.batch_tester import BatchTester
+from utils.connectivity import DynamicConnectivity
+from utils.grid import Grid
 from analysis.statistical_analysis import StatisticalAnalyzer
 from analysis.graph_generator import GraphGenerator
 
@@ -68,7 +70,7 @@ class UnifiedPathfindingApp:
 
         # State
         grid_size = self.single_grid_size.get()
-        self.single_grid = [[0 for _ in range(grid_size)] for _ in range(grid_size)]
+        self.single_grid = Grid([[0 for _ in range(grid_size)] for _ in range(grid_size)])
         self.single_start = (2, 2)
         self.single_end = (grid_size-3, grid_size-3)
         self.single_grid[self.single_start[0]][self.single_start[1]] = 2
@@ -159,6 +161,7 @@ class UnifiedPathfindingApp:
                 font=("Arial", 9, "italic"), fg="#666").pack()
 
         self.generate_single_obstacles()
+        self.single_connectivity = DynamicConnectivity(self.single_grid)
         self.draw_single_grid()
         self.single_canvas.bind("<Button-1>", self.single_mouse_down)
         self.single_canvas.bind("<B1-Motion>", self.single_mouse_drag)
@@ -204,20 +207,27 @@ class UnifiedPathfindingApp:
         self.single_path = []
         algo_name = self.single_algorithm.get()
         self.single_canvas_title.config(text=f"{algo_name} Algorithm")
+
+        # Reject impossible queries without running a search
+        if not self.single_connectivity.connected(self.single_start, self.single_end):
+            self.single_stats.config(text="No path possible!")
+            self.single_running = False
+            self.draw_single_grid()
+            return
+
         self.single_stats.config(text="Computing...")
         self.root.update()
 
         # Run algorithm to completion FIRST (get true performance data)
         self.single_visualizer = self.algorithm_map[algo_name](self.single_grid, self.single_start, self.single_end)
 
-        # Record execution history
+        # Record expansion order (one cell per settled node, path at the end)
         self.single_execution_history = []
-        while self.single_visualizer.step():
-            self.single_execution_history.append(self.single_visualizer.get_visited().copy())
-
-        # Get final state
-        self.single_execution_history.append(self.single_visualizer.get_visited().copy())
-        self.single_path = self.single_visualizer.get_path()
+        for event in self.single_visualizer.iter_events():
+            if event.path is None:
+                self.single_execution_history.append(event.cell)
+            else:
+                self.single_path = event.path
         stats = self.single_visualizer.get_stats()
 
         # Display final stats
@@ -250,9 +260,11 @@ class UnifiedPathfindingApp:
         # Advance replay by 'speed' steps
         self.single_replay_index += speed
 
-        # Update visited set based on replay index
-        if self.single_replay_index < len(self.single_execution_history):
-            self.single_visited = self.single_execution_history[self.single_replay_index]
+        # Add the cells settled since the last frame
+        history = self.single_execution_history
+        shown = len(self.single_visited)
+        if self.single_replay_index < len(history):
+            self.single_visited.update(history[shown:self.single_replay_index])
             # Don't show path during replay - only exploration
             saved_path = self.single_path
             self.single_path = []
@@ -260,7 +272,7 @@ class UnifiedPathfindingApp:
             self.single_path = saved_path
         else:
             # Replay finished - NOW show final state with path
-            self.single_visited = self.single_execution_history[-1]
+            self.single_visited.update(history[shown:])
             self.draw_single_grid()
             self.single_running = False
             self.single_paused = False
@@ -305,12 +317,13 @@ class UnifiedPathfindingApp:
             return
         # Regenerate grid with new size
         grid_size = self.single_grid_size.get()
-        self.single_grid = [[0 for _ in range(grid_size)] for _ in range(grid_size)]
+        self.single_grid = Grid([[0 for _ in range(grid_size)] for _ in range(grid_size)])
         self.single_start = (2, 2)
         self.single_end = (grid_size-3, grid_size-3)
         self.single_grid[self.single_start[0]][self.single_start[1]] = 2
         self.single_grid[self.single_end[0]][self.single_end[1]] = 3
         self.generate_single_obstacles()
+        self.single_connectivity = DynamicConnectivity(self.single_grid)
         self.reset_single()
 
     def single_mouse_down(self, event):
@@ -342,6 +355,8 @@ class UnifiedPathfindingApp:
             self.single_grid[cell[0]][cell[1]] = 3
         self.single_visited = set()
         self.single_path = []
+        reachable = self.single_connectivity.connected(self.single_start, self.single_end)
+        self.single_stats.config(text="Ready" if reachable else "No path possible!")
         self.draw_single_grid()
 
     def single_mouse_up(self, event):
@@ -504,15 +519,14 @@ class UnifiedPathfindingApp:
             else:
                 viz = GreedyVisualizer(self.triple_grid, self.triple_start, self.triple_end)
 
-            # Record execution history (every visited cell in order)
+            # Record expansion order (every settled cell in order)
             history = []
-            while viz.step():
-                history.append(viz.get_visited().copy())
-
-            # Get final state
-            history.append(viz.get_visited().copy())
+            for event in viz.iter_events():
+                if event.path is None:
+                    history.append(event.cell)
+                else:
+                    self.triple_path[algo_name] = event.path
             self.triple_execution_history[algo_name] = history
-            self.triple_path[algo_name] = viz.get_path()
             self.triple_stats[algo_name] = viz.get_stats()
 
         # Store paths separately for showing at end
@@ -546,14 +560,16 @@ class UnifiedPathfindingApp:
 
         # Update visited sets for each algorithm based on replay index
         for algo_name, history in self.triple_execution_history.items():
+            visited = self.triple_visited[algo_name]
+            shown = len(visited)
             if self.triple_replay_index < len(history):
-                self.triple_visited[algo_name] = history[self.triple_replay_index]
+                visited.update(history[shown:self.triple_replay_index])
                 self.triple_finished[algo_name] = False
                 # Keep path hidden during replay
                 self.triple_path[algo_name] = []
             else:
                 # Algorithm finished replay - NOW show final state with path
-                self.triple_visited[algo_name] = history[-1]
+                visited.update(history[shown:])
                 self.triple_finished[algo_name] = True
                 # Restore the path for this algorithm
                 self.triple_path[algo_name] = self.triple_final_paths[algo_name]
@@ -6,13 +6,15 @@ With heuristic-guided pathfinding and visualization support
 import heapq
 import time
 
+from algorithms.events import expansion_events
+
 class AStarVisualizer:
     """
     A* Algorithm with visualization capabilities
     Uses Manhattan distance heuristic for grid-based pathfinding
     """
 
-    def __init__(self, grid, start, end):
+    def __init__(self, grid, start, end, graph=None):
         """
         Initialize A* algorithm
 
@@ -20,12 +22,16 @@ class AStarVisualizer:
             grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
             start: (row, col) tuple for start position
             end: (row, col) tuple for end position
+            graph: Optional GridGraph to search instead of the raw grid
         """
         self.grid = grid
         self.start = start
         self.end = end
         self.rows = len(grid)
         self.cols = len(grid[0]) if grid else 0
+        self.graph = graph
+        if graph is not None:
+            graph.prepare_query(start, end)
 
         # Algorithm state
         self.visited = set()
@@ -34,6 +40,7 @@ class AStarVisualizer:
         self.f_score = {start: self.heuristic(start)}  # g + h
         self.pq = [(self.f_score[start], start)]  # Priority queue: (f_score, position)
         self.current = None
+        self.last_pushed = []  # Frontier cells pushed by the last expansion
         self.found_path = False
 
         # Statistics
@@ -63,6 +70,9 @@ class AStarVisualizer:
         Returns:
             List of valid neighbor positions
         """
+        if self.graph is not None:
+            return self.graph.get_neighbors(pos)
+
         row, col = pos
         neighbors = []
 
@@ -103,6 +113,7 @@ class AStarVisualizer:
         self.visited.add(current)
         self.current = current
         self.nodes_explored += 1
+        self.last_pushed = []
 
         # Check if reached goal
         if current == self.end:
@@ -117,8 +128,8 @@ class AStarVisualizer:
             if neighbor in self.visited:
                 continue
 
-            # Calculate new g_score (uniform cost of 1 per move)
-            tentative_g = current_g + 1
+            # Calculate new g_score (uniform cost of 1 per move on the raw grid)
+            tentative_g = current_g + (1 if self.graph is None else self.graph.cost(current, neighbor))
 
             # Update if shorter path found
             if neighbor not in self.g_score or tentative_g < self.g_score[neighbor]:
@@ -127,9 +138,19 @@ class AStarVisualizer:
                 self.f_score[neighbor] = f_score
                 self.parent[neighbor] = current
                 heapq.heappush(self.pq, (f_score, neighbor))
+                self.last_pushed.append(neighbor)
 
         return True
 
+    def iter_events(self):
+        """
+        Run to completion, yielding an ExpansionEvent per settled cell
+
+        Returns:
+            Generator of ExpansionEvent tuples (see algorithms.events)
+        """
+        return expansion_events(self)
+
     def get_visited(self):
         """Get set of all visited cells"""
         return self.visited.copy()
@@ -154,6 +175,9 @@ class AStarVisualizer:
         path.append(self.start)
         path.reverse()
 
+        if self.graph is not None:
+            return self.graph.expand_path(path)
+
         return path
 
     def get_stats(self):
@@ -6,13 +6,20 @@ Searches from both start and goal simultaneously
 import heapq
 import time
 
+from algorithms.events import expansion_events
+
 class BidirectionalVisualizer:
     """
     Bidirectional Search Algorithm with visualization
     Searches from both start and end, meeting in the middle
+
+    On the raw grid every step costs 1, so the first cell settled by both
+    searches is on a shortest path. With a weighted graph the search keeps
+    the cheapest meeting seen so far and stops only once the two queue
+    minimums add up to at least its cost.
     """
 
-    def __init__(self, grid, start, end):
+    def __init__(self, grid, start, end, graph=None):
         """
         Initialize Bidirectional Search
 
@@ -20,12 +27,16 @@ class BidirectionalVisualizer:
             grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
             start: (row, col) tuple for start position
             end: (row, col) tuple for end position
+            graph: Optional GridGraph to search instead of the raw grid
         """
         self.grid = grid
         self.start = start
         self.end = end
         self.rows = len(grid)
         self.cols = len(grid[0]) if grid else 0
+        self.graph = graph
+        if graph is not None:
+            graph.prepare_query(start, end)
 
         # Forward search (from start)
         self.forward_visited = set()
@@ -39,9 +50,12 @@ class BidirectionalVisualizer:
         self.backward_distance = {end: 0}
         self.backward_pq = [(0, end)]
 
-        # Meeting point
+        # Meeting point (and its path cost, for weighted graphs)
         self.meeting_point = None
+        self.meeting_cost = float('inf')
         self.found_path = False
+        if graph is not None and start == end:
+            self._meet(start)
 
         # Statistics
         self.nodes_explored = 0
@@ -51,6 +65,8 @@ class BidirectionalVisualizer:
         # For visualization - combine both visited sets
         self.current_forward = None
         self.current_backward = None
+        self.current = None    # Cell settled by the last step, in either direction
+        self.last_pushed = []  # Frontier cells pushed by the last expansion
 
         # Alternate direction flag (True = forward, False = backward)
         self.do_forward = True
@@ -65,6 +81,9 @@ class BidirectionalVisualizer:
         Returns:
             List of valid neighbor positions
         """
+        if self.graph is not None:
+            return self.graph.get_neighbors(pos)
+
         row, col = pos
         neighbors = []
 
@@ -88,6 +107,14 @@ class BidirectionalVisualizer:
         Returns:
             True if algorithm should continue, False if complete
         """
+        # Weighted graph: no unsettled route can beat the best meeting
+        if self.graph is not None and self.meeting_point is not None and (
+                not self.forward_pq or not self.backward_pq or
+                self.forward_pq[0][0] + self.backward_pq[0][0] >= self.meeting_cost):
+            self.found_path = True
+            self.end_time = time.time()
+            return False
+
         # Check if both queues are empty
         if not self.forward_pq and not self.backward_pq:
             self.end_time = time.time()
@@ -133,10 +160,12 @@ class BidirectionalVisualizer:
 
         self.forward_visited.add(current)
         self.current_forward = current
+        self.current = current
         self.nodes_explored += 1
+        self.last_pushed = []
 
-        # Check if we've met the backward search
-        if current in self.backward_visited:
+        # Check if we've met the backward search (unit costs only)
+        if self.graph is None and current in self.backward_visited:
             self.meeting_point = current
             self.found_path = True
             self.end_time = time.time()
@@ -147,12 +176,17 @@ class BidirectionalVisualizer:
             if neighbor in self.forward_visited:
                 continue
 
-            new_distance = self.forward_distance[current] + 1
+            step_cost = 1 if self.graph is None else self.graph.cost(current, neighbor)
+            new_distance = self.forward_distance[current] + step_cost
 
             if neighbor not in self.forward_distance or new_distance < self.forward_distance[neighbor]:
                 self.forward_distance[neighbor] = new_distance
                 self.forward_parent[neighbor] = current
                 heapq.heappush(self.forward_pq, (new_distance, neighbor))
+                self.last_pushed.append(neighbor)
+
+                if self.graph is not None and neighbor in self.backward_distance:
+                    self._meet(neighbor)
 
         return False
 
@@ -173,10 +207,12 @@ class BidirectionalVisualizer:
 
         self.backward_visited.add(current)
         self.current_backward = current
+        self.current = current
         self.nodes_explored += 1
+        self.last_pushed = []
 
-        # Check if we've met the forward search
-        if current in self.forward_visited:
+        # Check if we've met the forward search (unit costs only)
+        if self.graph is None and current in self.forward_visited:
             self.meeting_point = current
             self.found_path = True
             self.end_time = time.time()
@@ -187,15 +223,36 @@ class BidirectionalVisualizer:
             if neighbor in self.backward_visited:
                 continue
 
-            new_distance = self.backward_distance[current] + 1
+            step_cost = 1 if self.graph is None else self.graph.cost(current, neighbor)
+            new_distance = self.backward_distance[current] + step_cost
 
             if neighbor not in self.backward_distance or new_distance < self.backward_distance[neighbor]:
                 self.backward_distance[neighbor] = new_distance
                 self.backward_parent[neighbor] = current
                 heapq.heappush(self.backward_pq, (new_distance, neighbor))
+                self.last_pushed.append(neighbor)
+
+                if self.graph is not None and neighbor in self.forward_distance:
+                    self._meet(neighbor)
 
         return False
 
+    def _meet(self, node):
+        """Record a route through a node reached by both searches if cheaper"""
+        cost = self.forward_distance[node] + self.backward_distance[node]
+        if cost < self.meeting_cost:
+            self.meeting_cost = cost
+            self.meeting_point = node
+
+    def iter_events(self):
+        """
+        Run to completion, yielding an ExpansionEvent per settled cell
+
+        Returns:
+            Generator of ExpansionEvent tuples (see algorithms.events)
+        """
+        return expansion_events(self)
+
     def get_visited(self):
         """Get set of all visited cells from both searches"""
         return self.forward_visited.union(self.backward_visited)
@@ -227,7 +284,12 @@ class BidirectionalVisualizer:
             current = self.backward_parent[current]
 
         # Combine paths (meeting point appears once - in forward_path)
-        return forward_path + backward_path
+        path = forward_path + backward_path
+
+        if self.graph is not None:
+            return self.graph.expand_path(path)
+
+        return path
 
     def get_stats(self):
         """
@@ -0,0 +1,478 @@
+"""
+Block A* Algorithm Implementation
+Expands fixed-size blocks of the grid at once using a precomputed
+local distance database (LDDB)
+"""
+
+import heapq
+import os
+import time
+from collections import deque
+
+import numpy as np
+
+# LDDB tables are generated once per block size and persisted here
+DEFAULT_LDDB_DIR = os.path.join('data', 'lddb')
+
+# Marker for "no path inside the block" in the uint8 distance table
+UNREACHABLE = 255
+
+# Loaded databases, keyed by (block_size, path)
+_LDDB_CACHE = {}
+
+
+class LocalDistanceDatabase:
+    """
+    Boundary-to-boundary distances inside a block for every obstacle pattern
+
+    A pattern is the block's obstacle layout packed into an integer: bit
+    (i * block_size + j) is set when in-block cell (i, j) is blocked.
+    table[pattern][a][b] is the 4-directional distance from boundary cell a
+    to boundary cell b without leaving the block (UNREACHABLE if none).
+    """
+
+    MAX_BLOCK_SIZE = 4  # 2^16 patterns; 5x5 would need 2^25
+
+    def __init__(self, block_size, table):
+        """
+        Initialize database
+
+        Args:
+            block_size: Side length of a block
+            table: uint8 array of shape (patterns, boundary, boundary)
+        """
+        self.block_size = block_size
+        self.table = table
+        self.boundary = self.boundary_cells(block_size)
+        self.boundary_index = {cell: i for i, cell in enumerate(self.boundary)}
+        self._rows = {}
+
+    @staticmethod
+    def boundary_cells(block_size):
+        """
+        List the in-block offsets that lie on the block's border
+
+        Args:
+            block_size: Side length of a block
+
+        Returns:
+            List of (i, j) offsets in row-major order
+        """
+        last = block_size - 1
+        return [(i, j) for i in range(block_size) for j in range(block_size)
+                if i in (0, last) or j in (0, last)]
+
+    @classmethod
+    def build(cls, block_size=4):
+        """
+        Compute the database for every obstacle pattern
+
+        Runs Floyd-Warshall over all patterns at once, so a 4x4 database
+        (65,536 patterns) takes about a second.
+
+        Args:
+            block_size: Side length of a block (2 to 4)
+
+        Returns:
+            LocalDistanceDatabase instance
+        """
+        if not 2 <= block_size <= cls.MAX_BLOCK_SIZE:
+            raise ValueError(f"block_size must be between 2 and {cls.MAX_BLOCK_SIZE}")
+
+        n = block_size * block_size
+        inf = 2 * n  # Larger than any in-block distance, small enough for int16
+        patterns = np.arange(1 << n, dtype=np.int64)
+        free = ((patterns[:, None] >> np.arange(n)) & 1) == 0
+
+        dist = np.full((len(patterns), n, n), inf, dtype=np.int16)
+        for i in range(n):
+            dist[:, i, i] = np.where(free[:, i], 0, inf)
+            row, col = divmod(i, block_size)
+            for dr, dc in ((1, 0), (0, 1)):
+                r, c = row + dr, col + dc
+                if r < block_size and c < block_size:
+                    j = r * block_size + c
+                    step = np.where(free[:, i] & free[:, j], 1, inf)
+                    dist[:, i, j] = step
+                    dist[:, j, i] = step
+
+        for k in range(n):
+            np.minimum(dist, dist[:, :, k:k + 1] + dist[:, k:k + 1, :], out=dist)
+
+        boundary = [i * block_size + j for i, j in cls.boundary_cells(block_size)]
+        table = dist[:, boundary][:, :, boundary]
+        table = np.where(table >= inf, UNREACHABLE, table).astype(np.uint8)
+
+        return cls(block_size, table)
+
+    @classmethod
+    def load_or_build(cls, block_size=4, path=None):
+        """
+        Load the database from disk, building and saving it on first use
+
+        Args:
+            block_size: Side length of a block
+            path: .npy file location (defaults to data/lddb/lddb_NxN.npy)
+
+        Returns:
+            LocalDistanceDatabase instance
+        """
+        if path is None:
+            path = os.path.join(DEFAULT_LDDB_DIR, f"lddb_{block_size}x{block_size}.npy")
+
+        key = (block_size, os.path.abspath(path))
+        if key in _LDDB_CACHE:
+            return _LDDB_CACHE[key]
+
+        if os.path.exists(path):
+            lddb = cls(block_size, np.load(path))
+        else:
+            lddb = cls.build(block_size)
+            lddb.save(path)
+
+        _LDDB_CACHE[key] = lddb
+        return lddb
+
+    def save(self, path):
+        """Save the distance table to a .npy file"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        np.save(path, self.table)
+
+    def distances(self, pattern):
+        """
+        Get the boundary distance matrix for one obstacle pattern
+
+        Args:
+            pattern: Packed obstacle bitmask
+
+        Returns:
+            List of lists indexed [from boundary][to boundary]
+        """
+        rows = self._rows.get(pattern)
+        if rows is None:
+            rows = self.table[pattern].tolist()
+            self._rows[pattern] = rows
+        return rows
+
+
+class BlockAStarVisualizer:
+    """
+    Block A* with visualization capabilities
+    Each step expands a whole block, relaxing its boundary cells through the
+    LDDB instead of expanding the cells one at a time. Paths are optimal.
+    """
+
+    def __init__(self, grid, start, end, block_size=4, lddb=None):
+        """
+        Initialize Block A*
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+            start: (row, col) tuple for start position
+            end: (row, col) tuple for end position
+            block_size: Side length of a block (2 to 4)
+            lddb: Optional LocalDistanceDatabase (loaded from disk if omitted)
+        """
+        self.grid = grid
+        self.start = start
+        self.end = end
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+        self.block_size = block_size
+        self.lddb = lddb if lddb is not None else LocalDistanceDatabase.load_or_build(block_size)
+
+        # For each boundary offset, the step that leaves the block
+        last = block_size - 1
+        self.exits = []
+        for i, j in self.lddb.boundary:
+            steps = []
+            if i == 0:
+                steps.append((-1, 0))
+            if i == last:
+                steps.append((1, 0))
+            if j == 0:
+                steps.append((0, -1))
+            if j == last:
+                steps.append((0, 1))
+            self.exits.append(steps)
+
+        # Algorithm state
+        self.g_score = {}       # Boundary cell -> best known cost
+        self.parent = {}        # Boundary cell -> previous waypoint
+        self.pending = {}       # Block -> boundary cells improved since last expansion
+        self.block_key = {}     # Block -> current priority (min g + h of pending cells)
+        self.pq = []            # Priority queue: (key, counter, block)
+        self.counter = 0
+        self.expanded_blocks = set()
+        self.patterns = {}
+        self.current = None
+        self.found_path = False
+
+        # Best complete route found so far
+        self.best_cost = float('inf')
+        self.goal_parent = None
+
+        # Statistics
+        self.nodes_explored = 0
+        self.start_time = time.time()
+        self.end_time = None
+
+        self.goal_block = self.block_of(end)
+        self.goal_distance = {}
+        if self.is_free(start) and self.is_free(end):
+            self._initialize()
+
+    def heuristic(self, pos):
+        """Manhattan distance heuristic (admissible for grid-based pathfinding)"""
+        return abs(pos[0] - self.end[0]) + abs(pos[1] - self.end[1])
+
+    def is_free(self, pos):
+        """Check whether a cell is inside the grid and not an obstacle"""
+        return (0 <= pos[0] < self.rows and 0 <= pos[1] < self.cols
+                and self.grid[pos[0]][pos[1]] != 1)
+
+    def block_of(self, pos):
+        """Get the (block_row, block_col) containing a cell"""
+        return (pos[0] // self.block_size, pos[1] // self.block_size)
+
+    def pattern_of(self, block):
+        """
+        Get the packed obstacle pattern of a block
+
+        Cells outside the grid count as obstacles.
+
+        Args:
+            block: (block_row, block_col) tuple
+
+        Returns:
+            Integer bitmask usable as an LDDB index
+        """
+        pattern = self.patterns.get(block)
+        if pattern is None:
+            pattern = 0
+            r0, c0 = block[0] * self.block_size, block[1] * self.block_size
+            for i in range(self.block_size):
+                for j in range(self.block_size):
+                    if not self.is_free((r0 + i, c0 + j)):
+                        pattern |= 1 << (i * self.block_size + j)
+            self.patterns[block] = pattern
+        return pattern
+
+    def _local_search(self, source, target=None):
+        """
+        BFS from a cell without leaving its block
+
+        Args:
+            source: (row, col) start of the search
+            target: Optional cell to stop at
+
+        Returns:
+            Tuple of (distance dict, parent dict)
+        """
+        block = self.block_of(source)
+        distance = {source: 0}
+        parent = {}
+        queue = deque([source])
+
+        while queue:
+            current = queue.popleft()
+            if current == target:
+                break
+            for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                neighbor = (current[0] + dr, current[1] + dc)
+                if (neighbor not in distance and self.block_of(neighbor) == block
+                        and self.is_free(neighbor)):
+                    distance[neighbor] = distance[current] + 1
+                    parent[neighbor] = current
+                    queue.append(neighbor)
+
+        return distance, parent
+
+    def _initialize(self):
+        """Seed the search from the start cell and precompute goal-block exits"""
+        block_size = self.block_size
+
+        # Distances from every boundary cell of the goal block to the goal
+        distance, _ = self._local_search(self.end)
+        for (r, c), d in distance.items():
+            if (r % block_size, c % block_size) in self.lddb.boundary_index:
+                self.goal_distance[(r, c)] = d
+
+        # Start and goal in the same block: the in-block route is a candidate
+        distance, _ = self._local_search(self.start)
+        if self.end in distance:
+            self.best_cost = distance[self.end]
+            self.goal_parent = self.start
+
+        # Boundary cells of the start block are reached through in-block paths
+        for (r, c), d in distance.items():
+            if (r % block_size, c % block_size) in self.lddb.boundary_index:
+                self._relax((r, c), d, self.start if (r, c) != self.start else None)
+
+    def _relax(self, cell, cost, via):
+        """
+        Record a route to a boundary cell if it improves on the best known
+
+        Args:
+            cell: Boundary cell reached
+            cost: Route cost
+            via: Previous waypoint (None for the start cell itself)
+
+        Returns:
+            True if the cell's cost improved
+        """
+        if cost >= self.g_score.get(cell, float('inf')):
+            return False
+
+        self.g_score[cell] = cost
+        if via is not None:
+            self.parent[cell] = via
+
+        block = self.block_of(cell)
+        self.pending.setdefault(block, set()).add(cell)
+
+        key = cost + self.heuristic(cell)
+        if key < self.block_key.get(block, float('inf')):
+            self.block_key[block] = key
+            self.counter += 1
+            heapq.heappush(self.pq, (key, self.counter, block))
+
+        if block == self.goal_block and cell in self.goal_distance:
+            total = cost + self.goal_distance[cell]
+            if total < self.best_cost:
+                self.best_cost = total
+                self.goal_parent = cell
+
+        return True
+
+    def step(self):
+        """
+        Execute one step of Block A* (expand one block)
+
+        Returns:
+            True if algorithm should continue, False if complete
+        """
+        # Pop the best block that still has pending updates
+        while self.pq:
+            key, _, block = self.pq[0]
+            if block in self.pending and key == self.block_key[block]:
+                break
+            heapq.heappop(self.pq)
+
+        # Finished once no pending block can improve on the best route
+        if not self.pq or self.pq[0][0] >= self.best_cost:
+            self.found_path = self.best_cost < float('inf')
+            self.end_time = time.time()
+            return False
+
+        key, _, block = heapq.heappop(self.pq)
+        ingress = self.pending.pop(block)
+        del self.block_key[block]
+
+        self.current = block
+        self.expanded_blocks.add(block)
+        self.nodes_explored += 1
+
+        block_size = self.block_size
+        r0, c0 = block[0] * block_size, block[1] * block_size
+        boundary = self.lddb.boundary
+        index = self.lddb.boundary_index
+        table = self.lddb.distances(self.pattern_of(block))
+
+        # Relax every boundary cell of the block from the updated ingress cells
+        improved = set(ingress)
+        for cell in ingress:
+            cell_g = self.g_score[cell]
+            row = table[index[(cell[0] - r0, cell[1] - c0)]]
+            for b, d in enumerate(row):
+                if d == UNREACHABLE or d == 0:
+                    continue
+                target = (r0 + boundary[b][0], c0 + boundary[b][1])
+                if cell_g + d < self.g_score.get(target, float('inf')):
+                    self.g_score[target] = cell_g + d
+                    self.parent[target] = cell
+                    improved.add(target)
+                    if target in self.goal_distance:
+                        total = cell_g + d + self.goal_distance[target]
+                        if total < self.best_cost:
+                            self.best_cost = total
+                            self.goal_parent = target
+
+        # Push improvements across the block border into neighboring blocks
+        for cell in improved:
+            cell_g = self.g_score[cell]
+            for dr, dc in self.exits[index[(cell[0] - r0, cell[1] - c0)]]:
+                neighbor = (cell[0] + dr, cell[1] + dc)
+                if self.is_free(neighbor):
+                    self._relax(neighbor, cell_g + 1, cell)
+
+        return True
+
+    def get_visited(self):
+        """Get set of all free cells in expanded blocks"""
+        visited = set()
+        for block in self.expanded_blocks:
+            r0, c0 = block[0] * self.block_size, block[1] * self.block_size
+            for i in range(self.block_size):
+                for j in range(self.block_size):
+                    if self.is_free((r0 + i, c0 + j)):
+                        visited.add((r0 + i, c0 + j))
+        return visited
+
+    def get_path(self):
+        """
+        Reconstruct path from start to end
+
+        Boundary waypoints are joined by in-block BFS wherever they are not
+        adjacent, which reproduces the LDDB distances exactly.
+
+        Returns:
+            List of positions forming the path, or empty list if no path
+        """
+        if not self.found_path:
+            return []
+
+        waypoints = [self.end]
+        current = self.goal_parent
+        while current is not None:
+            waypoints.append(current)
+            current = self.parent.get(current)
+        if waypoints[-1] != self.start:
+            waypoints.append(self.start)
+        waypoints.reverse()
+
+        path = [waypoints[0]]
+        for a, b in zip(waypoints, waypoints[1:]):
+            if a == b:
+                continue
+            if abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1:
+                path.append(b)
+                continue
+            _, parent = self._local_search(a, b)
+            segment = []
+            current = b
+            while current != a:
+                segment.append(current)
+                current = parent[current]
+            path.extend(reversed(segment))
+
+        return path
+
+    def get_stats(self):
+        """
+        Get algorithm performance statistics
+
+        Returns:
+            Dictionary with performance metrics
+        """
+        path = self.get_path()
+        time_ms = (self.end_time - self.start_time) * 1000 if self.end_time else 0
+
+        return {
+            'nodes_explored': self.nodes_explored,
+            'path_length': len(path) if path else 0,
+            'time_ms': time_ms,
+            'found_path': self.found_path
+        }
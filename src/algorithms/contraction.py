@@ -0,0 +1,438 @@
+"""
+Contraction Hierarchies
+Contracts free cells one by one (adding shortcuts that preserve shortest
+distances) and answers queries with a bidirectional search that only
+moves up the hierarchy
+"""
+
+import heapq
+import os
+import time
+
+import numpy as np
+
+from utils.grid import grid_hash
+from utils.map_generator import MapGenerator
+
+# Edges that are original grid moves have no middle node
+NO_MIDDLE = -1
+
+# Witness searches give up after settling this many nodes; a missed
+# witness only costs an unnecessary shortcut, never correctness
+WITNESS_SETTLE_LIMIT = 64
+
+
+class ContractionHierarchy:
+    """
+    Contraction hierarchy of a 4-directional unit-cost grid
+
+    Nodes are the free cells in row-major order. The graph is undirected,
+    so the upward graph doubles as the downward graph of the reverse
+    search. It is stored as CSR arrays: the upward edges of node v are
+    targets/weights/middles[offsets[v]:offsets[v + 1]], where middle is the
+    contracted node a shortcut bypasses.
+    """
+
+    def __init__(self, shape, cells, rank, offsets, targets, weights, middles, map_hash):
+        """
+        Initialize from the CSR arrays (see build() and load())
+
+        Args:
+            shape: (rows, cols) of the map
+            cells: Flat cell index of each node
+            rank: Contraction order of each node (higher = more important)
+            offsets: CSR row offsets, length nodes + 1
+            targets: Upward edge targets
+            weights: Upward edge weights
+            middles: Bypassed node of each shortcut, NO_MIDDLE for grid moves
+            map_hash: Zobrist hash of the map the hierarchy was built for
+        """
+        self.rows, self.cols = (int(n) for n in shape)
+        self.cells = np.asarray(cells, dtype=np.int32)
+        self.rank = np.asarray(rank, dtype=np.int32)
+        self.offsets = np.asarray(offsets, dtype=np.int32)
+        self.targets = np.asarray(targets, dtype=np.int32)
+        self.weights = np.asarray(weights, dtype=np.int32)
+        self.middles = np.asarray(middles, dtype=np.int32)
+        self.map_hash = int(map_hash)
+
+        # Python lists for the query loops
+        node_of = np.full(self.rows * self.cols, -1, dtype=np.int32)
+        node_of[self.cells] = np.arange(len(self.cells), dtype=np.int32)
+        self.node_of = node_of.tolist()
+        self.cell_list = self.cells.tolist()
+        self.rank_list = self.rank.tolist()
+        offsets, targets = self.offsets.tolist(), self.targets.tolist()
+        weights, middles = self.weights.tolist(), self.middles.tolist()
+        self.up = [list(zip(targets[offsets[v]:offsets[v + 1]], weights[offsets[v]:offsets[v + 1]],
+                            middles[offsets[v]:offsets[v + 1]]))
+                   for v in range(len(self.cells))]
+
+    @classmethod
+    def build(cls, grid):
+        """
+        Contract every free cell
+
+        Nodes are taken from a lazily updated priority queue ordered by edge
+        difference (shortcuts added minus edges removed) plus the number of
+        already contracted neighbors, which keeps the hierarchy balanced.
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+
+        Returns:
+            ContractionHierarchy instance
+        """
+        free = np.asarray(grid) != 1
+        rows, cols = free.shape
+        cells = np.flatnonzero(free)
+        node_of = np.full(rows * cols, -1, dtype=np.int64)
+        node_of[cells] = np.arange(len(cells))
+        node_of = node_of.tolist()
+
+        # adjacency[v][u] = (weight, middle) over uncontracted nodes
+        adjacency = []
+        for cell in cells.tolist():
+            row, col = divmod(cell, cols)
+            edges = {}
+            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                r, c = row + dr, col + dc
+                if 0 <= r < rows and 0 <= c < cols and node_of[r * cols + c] != -1:
+                    edges[node_of[r * cols + c]] = (1, NO_MIDDLE)
+            adjacency.append(edges)
+
+        count = len(cells)
+        contracted = [False] * count
+        contracted_neighbors = [0] * count
+        rank = [0] * count
+        up = [None] * count
+
+        def priority(v):
+            shortcuts = cls._shortcuts(adjacency, v)
+            return len(shortcuts) - len(adjacency[v]) + contracted_neighbors[v]
+
+        queue = [(priority(v), v) for v in range(count)]
+        heapq.heapify(queue)
+        order = 0
+
+        while queue:
+            _, v = heapq.heappop(queue)
+            if contracted[v]:
+                continue
+
+            # Lazy update: re-queue if the node got less attractive
+            shortcuts = cls._shortcuts(adjacency, v)
+            current = len(shortcuts) - len(adjacency[v]) + contracted_neighbors[v]
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, v))
+                continue
+
+            up[v] = [(u, weight, middle) for u, (weight, middle) in adjacency[v].items()]
+            contracted[v] = True
+            rank[v] = order
+            order += 1
+
+            for u in adjacency[v]:
+                del adjacency[u][v]
+                contracted_neighbors[u] += 1
+            adjacency[v] = {}
+            for u, w, weight in shortcuts:
+                if w not in adjacency[u] or weight < adjacency[u][w][0]:
+                    adjacency[u][w] = (weight, v)
+                    adjacency[w][u] = (weight, v)
+
+        offsets = np.zeros(count + 1, dtype=np.int32)
+        offsets[1:] = np.cumsum([len(edges) for edges in up])
+        flat = [edge for edges in up for edge in edges]
+        targets, weights, middles = (zip(*flat) if flat else ((), (), ()))
+
+        return cls((rows, cols), cells, rank, offsets, targets, weights, middles, grid_hash(grid))
+
+    @staticmethod
+    def _shortcuts(adjacency, v):
+        """
+        Shortcuts needed to contract v
+
+        Args:
+            adjacency: Adjacency dicts of the remaining graph
+            v: Node to contract
+
+        Returns:
+            List of (u, w, weight) with u < w
+        """
+        neighbors = adjacency[v]
+        shortcuts = []
+        for u, (weight_u, _) in neighbors.items():
+            targets = {w: weight_u + weight_w for w, (weight_w, _) in neighbors.items() if w > u}
+            if not targets:
+                continue
+
+            # Local Dijkstra from u that avoids v, bounded by the longest via-v distance
+            limit = max(targets.values())
+            distance = {u: 0}
+            heap = [(0, u)]
+            settled = 0
+            while heap and settled < WITNESS_SETTLE_LIMIT:
+                dist, node = heapq.heappop(heap)
+                if dist > distance[node]:
+                    continue
+                if dist > limit:
+                    break
+                settled += 1
+                for neighbor, (weight, _) in adjacency[node].items():
+                    if neighbor == v:
+                        continue
+                    new_distance = dist + weight
+                    if new_distance < distance.get(neighbor, new_distance + 1):
+                        distance[neighbor] = new_distance
+                        heapq.heappush(heap, (new_distance, neighbor))
+
+            for w, via in targets.items():
+                if distance.get(w, via + 1) > via:
+                    shortcuts.append((u, w, via))
+
+        return shortcuts
+
+    @staticmethod
+    def sidecar_path(map_path):
+        """Where the hierarchy of a map file is stored"""
+        return os.path.splitext(map_path)[0] + '.ch.npz'
+
+    @classmethod
+    def for_map_file(cls, map_path):
+        """
+        Load the hierarchy stored next to a map file, building it if missing
+        or stale
+
+        Args:
+            map_path: Map saved with MapGenerator.save_map
+
+        Returns:
+            ContractionHierarchy instance
+        """
+        grid = MapGenerator.load_map(map_path)
+        path = cls.sidecar_path(map_path)
+        if os.path.exists(path):
+            hierarchy = cls.load(path)
+            if hierarchy.map_hash == grid_hash(grid):
+                return hierarchy
+
+        hierarchy = cls.build(grid)
+        hierarchy.save(path)
+        return hierarchy
+
+    @classmethod
+    def for_grid(cls, grid):
+        """
+        Get the hierarchy for a grid, reusing the cached one on a Grid
+
+        Args:
+            grid: 2D list or utils.grid.Grid
+
+        Returns:
+            ContractionHierarchy instance
+        """
+        if hasattr(grid, 'cached'):
+            return grid.cached('contraction_hierarchy', lambda: cls.build(grid))
+        return cls.build(grid)
+
+    def save(self, path):
+        """Write the CSR arrays to a .npz file"""
+        np.savez_compressed(path, shape=np.array([self.rows, self.cols]), cells=self.cells,
+                            rank=self.rank, offsets=self.offsets, targets=self.targets,
+                            weights=self.weights, middles=self.middles,
+                            map_hash=np.array(self.map_hash, dtype=np.uint64))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a hierarchy written by save()
+
+        Args:
+            path: .npz file path
+
+        Returns:
+            ContractionHierarchy instance
+        """
+        with np.load(path) as data:
+            return cls(data['shape'], data['cells'], data['rank'], data['offsets'], data['targets'],
+                       data['weights'], data['middles'], int(data['map_hash']))
+
+    def edge_count(self):
+        """Number of upward edges (grid moves plus shortcuts)"""
+        return len(self.targets)
+
+    def shortcut_count(self):
+        """Number of shortcut edges"""
+        return int((self.middles != NO_MIDDLE).sum())
+
+    def unpack(self, a, b):
+        """
+        Expand an edge into the original grid moves
+
+        Args:
+            a: Node id
+            b: Node id adjacent to a in the hierarchy
+
+        Returns:
+            List of node ids from a to b (inclusive)
+        """
+        nodes = [a]
+        stack = [(a, b)]
+        while stack:
+            u, w = stack.pop()
+            low, high = (u, w) if self.rank_list[u] < self.rank_list[w] else (w, u)
+            middle = next(m for target, _, m in self.up[low] if target == high)
+            if middle == NO_MIDDLE:
+                nodes.append(w)
+            else:
+                # Unpack u-middle first, so push it last
+                stack.append((middle, w))
+                stack.append((u, middle))
+        return nodes
+
+
+class ContractionHierarchyVisualizer:
+    """
+    Contraction Hierarchies query with visualization capabilities
+    Forward and backward searches alternate, each following upward edges
+    only, and stop once their queue cannot beat the best meeting point.
+    Paths are optimal.
+    """
+
+    def __init__(self, grid, start, end, hierarchy=None):
+        """
+        Initialize query
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+            start: (row, col) tuple for start position
+            end: (row, col) tuple for end position
+            hierarchy: Prebuilt ContractionHierarchy (built and cached on a
+                       Grid when omitted)
+        """
+        self.grid = grid
+        self.start = start
+        self.end = end
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+
+        # Statistics (time_ms includes building a missing hierarchy)
+        self.nodes_explored = 0
+        self.start_time = time.time()
+        self.end_time = None
+
+        self.hierarchy = hierarchy or ContractionHierarchy.for_grid(grid)
+
+        node_of = self.hierarchy.node_of
+        source = node_of[start[0] * self.cols + start[1]]
+        target = node_of[end[0] * self.cols + end[1]]
+
+        # Index 0 = forward search, 1 = backward search
+        self.distance = [{}, {}]
+        self.parent = [{}, {}]
+        self.settled = [set(), set()]
+        self.queues = [[], []]
+        if source != -1 and target != -1:
+            self.distance = [{source: 0}, {target: 0}]
+            self.queues = [[(0, source)], [(0, target)]]
+
+        self.side = 0
+        self.best = float('inf')
+        self.meeting = None
+        self.current = None
+        self.found_path = False
+
+    def _active(self, side):
+        """Check whether a search direction can still improve the result"""
+        queue = self.queues[side]
+        return bool(queue) and queue[0][0] < self.best
+
+    def step(self):
+        """
+        Settle one node in the forward or backward search
+
+        Returns:
+            True if algorithm should continue, False if complete
+        """
+        if not self._active(self.side):
+            self.side = 1 - self.side
+            if not self._active(self.side):
+                self.found_path = self.meeting is not None
+                self.end_time = time.time()
+                return False
+
+        side = self.side
+        dist, node = heapq.heappop(self.queues[side])
+        self.side = 1 - side
+        if node in self.settled[side]:
+            return True
+
+        self.settled[side].add(node)
+        self.current = divmod(self.hierarchy.cell_list[node], self.cols)
+        self.nodes_explored += 1
+
+        other = self.distance[1 - side].get(node)
+        if other is not None and dist + other < self.best:
+            self.best = dist + other
+            self.meeting = node
+
+        distance = self.distance[side]
+        for neighbor, weight, _ in self.hierarchy.up[node]:
+            new_distance = dist + weight
+            if new_distance < distance.get(neighbor, new_distance + 1):
+                distance[neighbor] = new_distance
+                self.parent[side][neighbor] = node
+                heapq.heappush(self.queues[side], (new_distance, neighbor))
+
+        return True
+
+    def get_visited(self):
+        """Get set of cells settled by either search"""
+        cols = self.cols
+        cell_list = self.hierarchy.cell_list
+        return {divmod(cell_list[node], cols) for node in self.settled[0] | self.settled[1]}
+
+    def get_path(self):
+        """
+        Reconstruct and unpack the path from start to end
+
+        Returns:
+            List of positions forming the path, or empty list if no path
+        """
+        if not self.found_path:
+            return []
+
+        # Hierarchy path: start ... meeting ... end
+        forward = [self.meeting]
+        while forward[-1] in self.parent[0]:
+            forward.append(self.parent[0][forward[-1]])
+        forward.reverse()
+        backward = [self.meeting]
+        while backward[-1] in self.parent[1]:
+            backward.append(self.parent[1][backward[-1]])
+        nodes = forward + backward[1:]
+
+        path = [nodes[0]]
+        for a, b in zip(nodes, nodes[1:]):
+            path.extend(self.hierarchy.unpack(a, b)[1:])
+
+        cell_list = self.hierarchy.cell_list
+        return [divmod(cell_list[node], self.cols) for node in path]
+
+    def get_stats(self):
+        """
+        Get algorithm performance statistics
+
+        Returns:
+            Dictionary with performance metrics
+        """
+        path = self.get_path()
+        time_ms = (self.end_time - self.start_time) * 1000 if self.end_time else 0
+
+        return {
+            'nodes_explored': self.nodes_explored,
+            'path_length': len(path) if path else 0,
+            'time_ms': time_ms,
+            'found_path': self.found_path
+        }
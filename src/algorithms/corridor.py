@@ -0,0 +1,229 @@
+"""
+Coarse-to-Fine Corridor Search
+Solves a downsampled grid first, then runs the fine A* only inside a
+corridor around the coarse path, widening it when the fine search fails
+"""
+
+import time
+
+import numpy as np
+
+from algorithms.astar import AStarVisualizer
+from algorithms.grid_graph import GridGraph
+
+
+class CoarseGraph(GridGraph):
+    """
+    Downsampled grid where each coarse cell covers factor x factor cells
+
+    A coarse cell is passable if it contains a free cell, and two coarse
+    cells are linked if some free cell pair crosses their shared border, so
+    every fine route has a coarse counterpart.
+    """
+
+    def __init__(self, grid, factor):
+        """
+        Build the coarse grid
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+            factor: Downsampling factor (e.g. 4 or 8)
+        """
+        rows = len(grid)
+        cols = len(grid[0]) if grid else 0
+        coarse_rows = -(-rows // factor)
+        coarse_cols = -(-cols // factor)
+
+        free = np.zeros((coarse_rows * factor, coarse_cols * factor), dtype=bool)
+        free[:rows, :cols] = np.asarray(grid) != 1
+
+        blocks = free.reshape(coarse_rows, factor, coarse_cols, factor)
+        passable = blocks.any(axis=(1, 3))
+
+        # Link between coarse columns C and C+1 / rows R and R+1
+        crossing = free[:, factor - 1:-1:factor] & free[:, factor::factor]
+        self.right_link = crossing.reshape(coarse_rows, factor, coarse_cols - 1).any(axis=1).tolist()
+        crossing = free[factor - 1:-1:factor, :] & free[factor::factor, :]
+        self.down_link = crossing.reshape(coarse_rows - 1, coarse_cols, factor).any(axis=2).tolist()
+
+        super().__init__(np.where(passable, 0, 1).tolist())
+        self.factor = factor
+
+    def get_neighbors(self, pos):
+        """
+        Get linked neighboring coarse cells
+
+        Args:
+            pos: (row, col) coarse tuple
+
+        Returns:
+            List of neighbor positions
+        """
+        row, col = pos
+        neighbors = []
+        if row > 0 and self.down_link[row - 1][col]:
+            neighbors.append((row - 1, col))
+        if row < self.rows - 1 and self.down_link[row][col]:
+            neighbors.append((row + 1, col))
+        if col > 0 and self.right_link[row][col - 1]:
+            neighbors.append((row, col - 1))
+        if col < self.cols - 1 and self.right_link[row][col]:
+            neighbors.append((row, col + 1))
+        return neighbors
+
+
+class CorridorGraph(GridGraph):
+    """Grid graph restricted to cells whose coarse cell is in an allowed set"""
+
+    def __init__(self, grid, factor, allowed):
+        """
+        Initialize graph
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+            factor: Downsampling factor used for the coarse grid
+            allowed: Set of (row, col) coarse cells the search may enter
+        """
+        super().__init__(grid)
+        self.factor = factor
+        self.allowed = allowed
+
+    def get_neighbors(self, pos):
+        """Get valid neighbors inside the corridor"""
+        factor = self.factor
+        return [n for n in super().get_neighbors(pos)
+                if (n[0] // factor, n[1] // factor) in self.allowed]
+
+
+class CorridorAStarVisualizer:
+    """
+    Multi-resolution A* with visualization capabilities
+    Each step advances either the coarse search or the current fine search.
+    Paths are valid but may be slightly longer than optimal when the best
+    route leaves the corridor.
+    """
+
+    def __init__(self, grid, start, end, factor=4, radius=2):
+        """
+        Initialize corridor search
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+            start: (row, col) tuple for start position
+            end: (row, col) tuple for end position
+            factor: Downsampling factor (e.g. 4 or 8)
+            radius: Initial corridor half-width in coarse cells (0 keeps
+                    the first corridor to the coarse path itself)
+        """
+        self.grid = grid
+        self.start = start
+        self.end = end
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+        self.factor = factor
+        self.radius = radius
+
+        # Statistics
+        self.nodes_explored = 0
+        self.coarse_nodes = 0
+        self.fine_attempts = 0
+        self.start_time = time.time()
+        self.end_time = None
+
+        self.coarse = CoarseGraph(grid, factor)
+        self.coarse_path = []
+        self.corridor = None
+        self.phase = 'coarse'
+        self.search = AStarVisualizer(self.coarse.grid, self.to_coarse(start), self.to_coarse(end),
+                                      graph=self.coarse)
+        self.current = None
+        self.found_path = False
+
+    def to_coarse(self, pos):
+        """Coarse cell containing a fine cell"""
+        return (pos[0] // self.factor, pos[1] // self.factor)
+
+    def _start_fine_search(self):
+        """Start a fine A* inside the corridor for the current radius"""
+        if self.radius >= max(self.coarse.rows, self.coarse.cols):
+            # Corridor covers the whole map: plain A*
+            self.corridor = None
+            graph = None
+        else:
+            self.corridor = set()
+            for row, col in self.coarse_path:
+                for r in range(row - self.radius, row + self.radius + 1):
+                    for c in range(col - self.radius, col + self.radius + 1):
+                        self.corridor.add((r, c))
+            graph = CorridorGraph(self.grid, self.factor, self.corridor)
+
+        self.fine_attempts += 1
+        self.phase = 'fine'
+        self.search = AStarVisualizer(self.grid, self.start, self.end, graph=graph)
+
+    def step(self):
+        """
+        Execute one step of the current search phase
+
+        Returns:
+            True if algorithm should continue, False if complete
+        """
+        explored = self.search.nodes_explored
+        running = self.search.step()
+        self.nodes_explored += self.search.nodes_explored - explored
+        self.current = self.search.current
+        if running:
+            return True
+
+        if self.phase == 'coarse':
+            self.coarse_nodes = self.search.nodes_explored
+            if not self.search.found_path:
+                # No coarse route means no fine route either
+                self.end_time = time.time()
+                return False
+            self.coarse_path = self.search.get_path()
+            self._start_fine_search()
+            return True
+
+        if self.search.found_path or self.corridor is None:
+            self.found_path = self.search.found_path
+            self.end_time = time.time()
+            return False
+
+        # Fine search failed inside the corridor: widen and retry (from 1 if
+        # the corridor was just the coarse path)
+        self.radius = max(1, self.radius * 2)
+        self._start_fine_search()
+        return True
+
+    def get_visited(self):
+        """Get set of cells visited by the current fine search"""
+        return self.search.get_visited() if self.phase == 'fine' else set()
+
+    def get_path(self):
+        """
+        Get path from start to end
+
+        Returns:
+            List of positions forming the path, or empty list if no path
+        """
+        return self.search.get_path() if self.found_path else []
+
+    def get_stats(self):
+        """
+        Get algorithm performance statistics
+
+        Returns:
+            Dictionary with performance metrics
+        """
+        path = self.get_path()
+        time_ms = (self.end_time - self.start_time) * 1000 if self.end_time else 0
+
+        return {
+            'nodes_explored': self.nodes_explored,
+            'coarse_nodes': self.coarse_nodes,
+            'fine_attempts': self.fine_attempts,
+            'path_length': len(path) if path else 0,
+            'time_ms': time_ms,
+            'found_path': self.found_path
+        }
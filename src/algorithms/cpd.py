@@ -0,0 +1,421 @@
+"""
+Compressed Path Database (CPD)
+Stores the optimal first move from every free cell towards every other
+free cell, run-length encoded, so paths are read off by table lookups
+without any search
+"""
+
+import os
+import struct
+import time
+
+import numpy as np
+from scipy import ndimage
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import shortest_path
+
+from utils.aligned_file import layout, map_arrays, write_arrays
+from utils.shared_grid import pool_map, worker_state
+
+# Same order as the visualizers' neighbor loop: up, down, left, right
+MOVES = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+# File header: magic, format version, padding, rows, cols, nodes, runs
+HEADER = struct.Struct('<4sHHIIII')
+MAGIC = b'CPDB'
+VERSION = 1
+
+
+def _dfs_order(blocked):
+    """
+    Free cells in DFS preorder
+
+    Cells that are close in this order tend to share first moves, which
+    makes the run-length encoded rows short.
+
+    Args:
+        blocked: 2D boolean array of obstacles
+
+    Returns:
+        int32 array of flat cell indices
+    """
+    rows, cols = blocked.shape
+    flat_blocked = blocked.ravel().tolist()
+    seen = list(flat_blocked)
+    order = []
+
+    for root in range(rows * cols):
+        if seen[root]:
+            continue
+        seen[root] = True
+        stack = [root]
+        while stack:
+            index = stack.pop()
+            order.append(index)
+            row, col = divmod(index, cols)
+            # Reversed so the first move in MOVES is visited first
+            for dr, dc in reversed(MOVES):
+                r, c = row + dr, col + dc
+                if 0 <= r < rows and 0 <= c < cols and not seen[r * cols + c]:
+                    seen[r * cols + c] = True
+                    stack.append(r * cols + c)
+
+    return np.array(order, dtype=np.int32)
+
+
+def _layout(blocked):
+    """
+    Node numbering and adjacency of a map
+
+    Args:
+        blocked: 2D boolean array of obstacles
+
+    Returns:
+        Tuple of (cells, position, adjacency) where cells[node] is the flat
+        cell index, position[cell] the node (-1 for obstacles) and adjacency
+        a sparse unit-weight graph over nodes
+    """
+    rows, cols = blocked.shape
+    cells = _dfs_order(blocked)
+    position = np.full(rows * cols, -1, dtype=np.int32)
+    position[cells] = np.arange(len(cells), dtype=np.int32)
+
+    free = ~blocked
+    grid_position = position.reshape(rows, cols)
+    right = free[:, :-1] & free[:, 1:]
+    down = free[:-1, :] & free[1:, :]
+    heads = np.concatenate([grid_position[:, :-1][right], grid_position[:-1, :][down]])
+    tails = np.concatenate([grid_position[:, 1:][right], grid_position[1:, :][down]])
+    adjacency = csr_matrix((np.ones(2 * len(heads), dtype=np.int8),
+                            (np.concatenate([heads, tails]), np.concatenate([tails, heads]))),
+                           shape=(len(cells), len(cells)))
+
+    return cells, position, adjacency
+
+
+def _encode_rows(blocked, cells, adjacency, sources):
+    """
+    Compressed first-move rows for a batch of source nodes
+
+    A BFS predecessor tree per source gives the cell before each target;
+    pointer jumping turns that into the child of the source the target
+    hangs under, i.e. the first move. Targets without a first move (the
+    source itself, other components) copy their neighbor's move, which
+    only lengthens runs.
+
+    Args:
+        blocked: 2D boolean array of obstacles
+        cells: Flat cell index of each node
+        adjacency: Sparse unit-weight node graph
+        sources: List of source nodes
+
+    Returns:
+        List of (run_starts, run_moves) array pairs, one per source
+    """
+    cols = blocked.shape[1]
+    count = len(cells)
+    nodes = np.arange(count)
+    _, predecessors = shortest_path(adjacency, unweighted=True, indices=sources,
+                                    return_predecessors=True)
+
+    rows = []
+    for source, pred in zip(sources, predecessors):
+        # Climb towards the source until reaching one of its children
+        up = np.where((pred == source) | (pred < 0), nodes, pred)
+        while True:
+            jumped = up[up]
+            if np.array_equal(jumped, up):
+                break
+            up = jumped
+
+        moves = np.full(count, -1, dtype=np.int8)
+        reachable = (pred >= 0)
+        delta = cells[up[reachable]] - cells[source]
+        codes = np.select([delta == -cols, delta == cols, delta == -1, delta == 1], [0, 1, 2, 3])
+        moves[reachable] = codes
+
+        # Wildcards take the move before them (or after, at the row start)
+        known = np.flatnonzero(moves >= 0)
+        if len(known) == 0:
+            rows.append((np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.uint8)))
+            continue
+        fill = np.where(moves >= 0, nodes, 0)
+        np.maximum.accumulate(fill, out=fill)
+        fill[:known[0]] = known[0]
+        moves = moves[fill]
+
+        starts = np.flatnonzero(np.concatenate(([True], moves[1:] != moves[:-1])))
+        rows.append((starts.astype(np.int32), moves[starts].astype(np.uint8)))
+
+    return rows
+
+
+def _setup_worker(shared):
+    """Pool worker setup: node layout of the shared grid"""
+    blocked = shared.array.astype(bool)
+    cells, _, adjacency = _layout(blocked)
+    return {'layout': (blocked, cells, adjacency)}
+
+
+def _pool_task(sources):
+    """Pool entry point: compressed rows for one chunk of source nodes"""
+    return _encode_rows(*worker_state['layout'], sources)
+
+
+class CompressedPathDatabase:
+    """
+    Run-length encoded first-move table of one map
+
+    Nodes are free cells in DFS order. Row s is a list of runs over target
+    nodes: run k covers targets run_starts[k] up to the next run start and
+    stores the move index (into MOVES) to take from s. Rows are
+    concatenated; row s spans runs row_offsets[s]:row_offsets[s + 1].
+    """
+
+    def __init__(self, rows, cols, position, cells, component, row_offsets, run_starts, run_moves):
+        """
+        Initialize from the table arrays (see build() and load())
+
+        Args:
+            rows: Map height
+            cols: Map width
+            position: Node of each flat cell index, -1 for obstacles
+            cells: Flat cell index of each node
+            component: Connected component of each node
+            row_offsets: int64 run offsets per source node, length nodes + 1
+            run_starts: First target node of each run
+            run_moves: Move index of each run
+        """
+        self.rows = rows
+        self.cols = cols
+        self.position = position
+        self.cells = cells
+        self.component = component
+        self.row_offsets = row_offsets
+        self.run_starts = run_starts
+        self.run_moves = run_moves
+
+    @classmethod
+    def build(cls, grid, num_workers=None, chunk_size=64):
+        """
+        Compute every first-move row
+
+        Costs one BFS per free cell; intended for small and medium maps.
+        Source chunks are processed by a pool sharing the grid read-only.
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+            num_workers: Pool size (defaults to CPU count; 1 runs in-process)
+            chunk_size: Source cells per pool task
+
+        Returns:
+            CompressedPathDatabase instance
+        """
+        blocked = np.asarray(grid) == 1
+        rows, cols = blocked.shape
+        cells, position, adjacency = _layout(blocked)
+        sources = list(range(len(cells)))
+        chunks = [sources[i:i + chunk_size] for i in range(0, len(sources), chunk_size)]
+        num_workers = max(1, min(num_workers or os.cpu_count() or 1, len(chunks)))
+
+        if num_workers == 1:
+            results = [_encode_rows(blocked, cells, adjacency, chunk) for chunk in chunks]
+        else:
+            results = pool_map(grid, _pool_task, chunks, num_workers, setup=_setup_worker)
+
+        encoded = [row for chunk_rows in results for row in chunk_rows]
+        row_offsets = np.zeros(len(cells) + 1, dtype=np.int64)
+        row_offsets[1:] = np.cumsum([len(starts) for starts, _ in encoded])
+        run_starts = np.concatenate([starts for starts, _ in encoded]) if encoded else np.zeros(0, np.int32)
+        run_moves = np.concatenate([moves for _, moves in encoded]) if encoded else np.zeros(0, np.uint8)
+
+        labels, _ = ndimage.label(~blocked)
+        component = labels.ravel()[cells].astype(np.int32)
+
+        return cls(rows, cols, position, cells, component, row_offsets,
+                   run_starts.astype(np.int32), run_moves.astype(np.uint8))
+
+    @classmethod
+    def for_grid(cls, grid):
+        """
+        Get the database for a grid, reusing the cached one on a Grid
+
+        Args:
+            grid: 2D list or utils.grid.Grid
+
+        Returns:
+            CompressedPathDatabase instance
+        """
+        if hasattr(grid, 'cached'):
+            return grid.cached('cpd', lambda: cls.build(grid))
+        return cls.build(grid)
+
+    @staticmethod
+    def _offsets(rows, cols, nodes, runs):
+        """Byte offset of each array in the file (8-byte aligned)"""
+        return layout(HEADER.size, [('row_offsets', np.int64, nodes + 1),
+                                    ('position', np.int32, rows * cols),
+                                    ('cells', np.int32, nodes),
+                                    ('component', np.int32, nodes),
+                                    ('run_starts', np.int32, runs),
+                                    ('run_moves', np.uint8, runs)])
+
+    def save(self, path):
+        """Write the tables to a memory-mappable binary file"""
+        nodes, runs = len(self.cells), len(self.run_starts)
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, 0, self.rows, self.cols, nodes, runs))
+            offsets = self._offsets(self.rows, self.cols, nodes, runs)
+            write_arrays(f, offsets, {name: getattr(self, name) for name in offsets})
+
+    @classmethod
+    def load(cls, path):
+        """
+        Memory-map a file written by save()
+
+        Only the rows that queries touch are paged in.
+
+        Args:
+            path: File path
+
+        Returns:
+            CompressedPathDatabase instance
+        """
+        with open(path, 'rb') as f:
+            magic, version, _, rows, cols, nodes, runs = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a compressed path database")
+
+        return cls(rows, cols, **map_arrays(path, cls._offsets(rows, cols, nodes, runs)))
+
+    def run_count(self):
+        """Total number of runs (the compressed table size)"""
+        return len(self.run_starts)
+
+    def first_move(self, start, end):
+        """
+        Look up the first move of an optimal path
+
+        Args:
+            start: (row, col) tuple
+            end: (row, col) tuple
+
+        Returns:
+            (dr, dc) tuple, or None if end is unreachable or equal to start
+        """
+        source = int(self.position[start[0] * self.cols + start[1]])
+        target = int(self.position[end[0] * self.cols + end[1]])
+        if source < 0 or target < 0 or source == target:
+            return None
+        if self.component[source] != self.component[target]:
+            return None
+
+        low, high = int(self.row_offsets[source]), int(self.row_offsets[source + 1])
+        run = low + int(np.searchsorted(self.run_starts[low:high], target, side='right')) - 1
+        return MOVES[self.run_moves[run]]
+
+    def path(self, start, end):
+        """
+        Read a full path off the table
+
+        Args:
+            start: (row, col) tuple
+            end: (row, col) tuple
+
+        Returns:
+            List of positions forming the path, or empty list if no path
+        """
+        if start != end and self.first_move(start, end) is None:
+            return []
+
+        path = [start]
+        while path[-1] != end:
+            dr, dc = self.first_move(path[-1], end)
+            path.append((path[-1][0] + dr, path[-1][1] + dc))
+        return path
+
+
+class CPDVisualizer:
+    """
+    Compressed path database lookup with visualization capabilities
+    Each step reads one first move from the table; there is no search, so
+    only the path cells are ever visited. Paths are optimal.
+    """
+
+    def __init__(self, grid, start, end, cpd=None):
+        """
+        Initialize lookup
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+            start: (row, col) tuple for start position
+            end: (row, col) tuple for end position
+            cpd: Prebuilt CompressedPathDatabase (built and cached on a Grid
+                 when omitted)
+        """
+        self.grid = grid
+        self.start = start
+        self.end = end
+
+        # Statistics (time_ms includes building a missing database)
+        self.nodes_explored = 0
+        self.start_time = time.time()
+        self.end_time = None
+
+        self.cpd = cpd or CompressedPathDatabase.for_grid(grid)
+
+        self.path = [start]
+        self.current = start
+        self.found_path = False
+
+    def step(self):
+        """
+        Follow one table entry
+
+        Returns:
+            True if algorithm should continue, False if complete
+        """
+        self.nodes_explored += 1
+        if self.current == self.end:
+            self.found_path = True
+            self.end_time = time.time()
+            return False
+
+        move = self.cpd.first_move(self.current, self.end)
+        if move is None:
+            self.end_time = time.time()
+            return False
+
+        self.current = (self.current[0] + move[0], self.current[1] + move[1])
+        self.path.append(self.current)
+        return True
+
+    def get_visited(self):
+        """Get set of cells looked up so far"""
+        return set(self.path)
+
+    def get_path(self):
+        """
+        Get path from start to end
+
+        Returns:
+            List of positions forming the path, or empty list if no path
+        """
+        return list(self.path) if self.found_path else []
+
+    def get_stats(self):
+        """
+        Get algorithm performance statistics
+
+        Returns:
+            Dictionary with performance metrics
+        """
+        path = self.get_path()
+        time_ms = (self.end_time - self.start_time) * 1000 if self.end_time else 0
+
+        return {
+            'nodes_explored': self.nodes_explored,
+            'path_length': len(path) if path else 0,
+            'time_ms': time_ms,
+            'found_path': self.found_path
+        }
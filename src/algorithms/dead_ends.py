@@ -0,0 +1,207 @@
+"""
+Dead-End and Swamp Detection
+Finds regions that a shortest path can only enter and leave through a
+single cell, so searches can skip them unless an endpoint lies inside
+"""
+
+from collections import deque
+
+from algorithms.grid_graph import GridGraph
+
+# Cell classification
+OPEN = 0
+DEAD_END = 1   # Removed by repeatedly peeling cells with at most one free neighbor
+SWAMP = 2      # Behind an articulation cell (e.g. an enclosed room with one doorway)
+
+
+class DeadEndAnalysis:
+    """
+    Per-map classification of skippable cells
+
+    Every region is a DFS subtree hanging off an articulation cell: any
+    route that enters it has to come back out through that same cell, so a
+    shortest path between two cells outside the region never enters it.
+    Regions nest, and each cell records its innermost region, which is
+    enough to decide whether it can be skipped for a given query.
+    """
+
+    def __init__(self, grid):
+        """
+        Run the analysis
+
+        Args:
+            grid: 2D list (or Grid) where 0=empty, 1=obstacle, 2=start, 3=end
+        """
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+        size = self.rows * self.cols
+        self.free = [grid[i // self.cols][i % self.cols] != 1 for i in range(size)]
+
+        self.kind = [OPEN] * size
+        self.discovery = [-1] * size    # DFS preorder number
+        self.subtree_size = [0] * size
+        self.region = [-1] * size       # Root cell of the innermost region
+
+        self._peel_dead_ends()
+        self._find_regions()
+
+    @classmethod
+    def for_grid(cls, grid):
+        """
+        Get the analysis for a grid, reusing the cached one on a Grid
+
+        Args:
+            grid: 2D list or utils.grid.Grid
+
+        Returns:
+            DeadEndAnalysis instance
+        """
+        if hasattr(grid, 'cached'):
+            return grid.cached('dead_ends', lambda: cls(grid))
+        return cls(grid)
+
+    def _adjacent(self, index):
+        """Free 4-directional neighbors of a flat cell index"""
+        row, col = divmod(index, self.cols)
+        neighbors = []
+        if row > 0 and self.free[index - self.cols]:
+            neighbors.append(index - self.cols)
+        if row < self.rows - 1 and self.free[index + self.cols]:
+            neighbors.append(index + self.cols)
+        if col > 0 and self.free[index - 1]:
+            neighbors.append(index - 1)
+        if col < self.cols - 1 and self.free[index + 1]:
+            neighbors.append(index + 1)
+        return neighbors
+
+    def _peel_dead_ends(self):
+        """Mark cells removed by repeatedly deleting free cells of degree <= 1"""
+        size = self.rows * self.cols
+        degree = [len(self._adjacent(i)) if self.free[i] else 0 for i in range(size)]
+        queue = deque(i for i in range(size) if self.free[i] and degree[i] <= 1)
+
+        while queue:
+            index = queue.popleft()
+            if self.kind[index] == DEAD_END:
+                continue
+            self.kind[index] = DEAD_END
+            for neighbor in self._adjacent(index):
+                if self.kind[neighbor] != DEAD_END:
+                    degree[neighbor] -= 1
+                    if degree[neighbor] == 1:
+                        queue.append(neighbor)
+
+    def _find_regions(self):
+        """Iterative Tarjan DFS: articulation subtrees become regions"""
+        size = self.rows * self.cols
+        low = [0] * size
+        parent = [-1] * size
+        is_region_root = [False] * size
+        order = []
+        counter = 0
+
+        # Root each component at a non-dead-end cell when there is one, so
+        # dead-end branches always hang below an articulation cell
+        roots = [i for i in range(size) if self.free[i] and self.kind[i] != DEAD_END]
+        roots += [i for i in range(size) if self.free[i] and self.kind[i] == DEAD_END]
+
+        for root in roots:
+            if self.discovery[root] != -1:
+                continue
+
+            self.discovery[root] = low[root] = counter
+            counter += 1
+            order.append(root)
+            stack = [(root, iter(self._adjacent(root)))]
+
+            while stack:
+                node, neighbors = stack[-1]
+                advanced = False
+                for neighbor in neighbors:
+                    if self.discovery[neighbor] == -1:
+                        parent[neighbor] = node
+                        self.discovery[neighbor] = low[neighbor] = counter
+                        counter += 1
+                        order.append(neighbor)
+                        stack.append((neighbor, iter(self._adjacent(neighbor))))
+                        advanced = True
+                        break
+                    if neighbor != parent[node]:
+                        low[node] = min(low[node], self.discovery[neighbor])
+                if advanced:
+                    continue
+
+                stack.pop()
+                self.subtree_size[node] += 1
+                up = parent[node]
+                if up != -1:
+                    low[up] = min(low[up], low[node])
+                    self.subtree_size[up] += self.subtree_size[node]
+                    if low[node] >= self.discovery[up]:
+                        is_region_root[node] = True
+
+        # Preorder pass: innermost region of each cell
+        for index in order:
+            if is_region_root[index]:
+                self.region[index] = index
+            elif parent[index] != -1:
+                self.region[index] = self.region[parent[index]]
+
+        for index in order:
+            if self.region[index] != -1 and self.kind[index] == OPEN:
+                self.kind[index] = SWAMP
+
+    def contains(self, region, pos):
+        """Check whether a cell lies inside a region (DFS subtree)"""
+        index = pos[0] * self.cols + pos[1]
+        first = self.discovery[region]
+        return 0 <= index < len(self.discovery) and first <= self.discovery[index] < first + self.subtree_size[region]
+
+    def is_skippable(self, pos, start, end):
+        """
+        Check whether a cell can be ignored for one query
+
+        Args:
+            pos: (row, col) tuple to test
+            start: Query start
+            end: Query end
+
+        Returns:
+            True if no shortest start-end path passes through pos
+        """
+        region = self.region[pos[0] * self.cols + pos[1]]
+        if region == -1:
+            return False
+        return not (self.contains(region, start) or self.contains(region, end))
+
+    def counts(self):
+        """Number of dead-end and swamp cells"""
+        return {'dead_end': self.kind.count(DEAD_END), 'swamp': self.kind.count(SWAMP)}
+
+
+class DeadEndPruningGraph(GridGraph):
+    """
+    Grid graph that skips dead-end and swamp cells not containing an endpoint
+
+    Pass it as ``graph`` to any visualizer. The analysis is cached on a Grid
+    and rebuilt automatically after obstacles change.
+    """
+
+    def prepare_query(self, start, end):
+        """Fetch (or build) the analysis for the current grid contents"""
+        super().prepare_query(start, end)
+        self.analysis = DeadEndAnalysis.for_grid(self.grid)
+
+    def get_neighbors(self, pos):
+        """
+        Get valid neighbors that are not skippable for this query
+
+        Args:
+            pos: (row, col) tuple
+
+        Returns:
+            List of neighbor positions
+        """
+        analysis = self.analysis
+        return [neighbor for neighbor in super().get_neighbors(pos)
+                if not analysis.is_skippable(neighbor, self.start, self.end)]
@@ -6,13 +6,15 @@ With step-by-step visualization support
 import heapq
 import time
 
+from algorithms.events import expansion_events
+
 class DijkstraVisualizer:
     """
     Dijkstra's Algorithm with visualization capabilities
     Explores nodes uniformly from start until reaching goal
     """
 
-    def __init__(self, grid, start, end):
+    def __init__(self, grid, start, end, graph=None):
         """
         Initialize Dijkstra's algorithm
 
@@ -20,12 +22,16 @@ class DijkstraVisualizer:
             grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
             start: (row, col) tuple for start position
             end: (row, col) tuple for end position
+            graph: Optional GridGraph to search instead of the raw grid
         """
         self.grid = grid
         self.start = start
         self.end = end
         self.rows = len(grid)
         self.cols = len(grid[0]) if grid else 0
+        self.graph = graph
+        if graph is not None:
+            graph.prepare_query(start, end)
 
         # Algorithm state
         self.visited = set()
@@ -33,6 +39,7 @@ class DijkstraVisualizer:
         self.distance = {start: 0}
         self.pq = [(0, start)]  # Priority queue: (distance, position)
         self.current = None
+        self.last_pushed = []  # Frontier cells pushed by the last expansion
         self.found_path = False
 
         # Statistics
@@ -50,6 +57,9 @@ class DijkstraVisualizer:
         Returns:
             List of valid neighbor positions
         """
+        if self.graph is not None:
+            return self.graph.get_neighbors(pos)
+
         row, col = pos
         neighbors = []
 
@@ -90,6 +100,7 @@ class DijkstraVisualizer:
         self.visited.add(current)
         self.current = current
         self.nodes_explored += 1
+        self.last_pushed = []
 
         # Check if reached goal
         if current == self.end:
@@ -102,17 +113,27 @@ class DijkstraVisualizer:
             if neighbor in self.visited:
                 continue
 
-            # Calculate new distance (uniform cost of 1 per move)
-            new_distance = dist + 1
+            # Calculate new distance (uniform cost of 1 per move on the raw grid)
+            new_distance = dist + (1 if self.graph is None else self.graph.cost(current, neighbor))
 
             # Update if shorter path found
             if neighbor not in self.distance or new_distance < self.distance[neighbor]:
                 self.distance[neighbor] = new_distance
                 self.parent[neighbor] = current
                 heapq.heappush(self.pq, (new_distance, neighbor))
+                self.last_pushed.append(neighbor)
 
         return True
 
+    def iter_events(self):
+        """
+        Run to completion, yielding an ExpansionEvent per settled cell
+
+        Returns:
+            Generator of ExpansionEvent tuples (see algorithms.events)
+        """
+        return expansion_events(self)
+
     def get_visited(self):
         """Get set of all visited cells"""
         return self.visited.copy()
@@ -137,6 +158,9 @@ class DijkstraVisualizer:
         path.append(self.start)
         path.reverse()
 
+        if self.graph is not None:
+            return self.graph.expand_path(path)
+
         return path
 
     def get_stats(self):
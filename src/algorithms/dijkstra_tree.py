@@ -0,0 +1,130 @@
+"""
+Resumable Dijkstra Tree
+Keeps the settled set and frontier of a Dijkstra search from one start, so
+further goals are answered from the existing tree or by continuing it
+"""
+
+import heapq
+import time
+
+from algorithms.dijkstra import DijkstraVisualizer
+
+
+class DijkstraTree(DijkstraVisualizer):
+    """
+    Dijkstra search that can be retargeted without starting over
+
+    Unlike DijkstraVisualizer, the goal cell is expanded like any other
+    cell, so the frontier stays complete and the search can resume after
+    every query. A goal that is already settled is answered by walking the
+    parent pointers; otherwise step() continues from the current frontier
+    until the new goal is settled.
+    """
+
+    def __init__(self, grid, start, end=None):
+        """
+        Initialize the tree
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+            start: (row, col) tuple for start position
+            end: Optional first goal (see set_goal)
+        """
+        super().__init__(grid, start, end)
+        self.set_goal(end)
+
+    @classmethod
+    def for_grid(cls, grid, start):
+        """
+        Get the tree for a start cell, reusing the one cached on a Grid
+
+        The cache belongs to the grid's current obstacle version, so it is
+        dropped as soon as an obstacle is added or removed.
+
+        Args:
+            grid: 2D list or utils.grid.Grid
+            start: (row, col) tuple for start position
+
+        Returns:
+            DijkstraTree instance
+        """
+        if hasattr(grid, 'cached'):
+            return grid.cached(('dijkstra_tree', start), lambda: cls(grid, start))
+        return cls(grid, start)
+
+    def set_goal(self, end):
+        """
+        Retarget the search; per-query statistics restart here
+
+        Args:
+            end: (row, col) tuple for the new goal, or None to grow the
+                 whole tree
+        """
+        self.end = end
+        self.found_path = end is not None and end in self.visited
+        self.nodes_explored = 0
+        self.start_time = time.time()
+        self.end_time = self.start_time if self.found_path else None
+
+    def step(self):
+        """
+        Settle one more cell
+
+        Returns:
+            True if algorithm should continue, False if complete
+        """
+        if self.found_path:
+            return False
+
+        if not self.pq:
+            self.end_time = time.time()
+            return False
+
+        dist, current = self._pop()
+        if current is None:
+            return True
+
+        self.current = current
+        self.nodes_explored += 1
+
+        if current == self.end:
+            self.found_path = True
+            self.end_time = time.time()
+            return False
+
+        return True
+
+    def _pop(self):
+        """Settle and expand the closest frontier cell (None if stale)"""
+        dist, current = heapq.heappop(self.pq)
+        if current in self.visited:
+            return dist, None
+
+        self.visited.add(current)
+        self.last_pushed = []
+        for neighbor in self.get_neighbors(current):
+            if neighbor in self.visited:
+                continue
+            new_distance = dist + 1
+            if neighbor not in self.distance or new_distance < self.distance[neighbor]:
+                self.distance[neighbor] = new_distance
+                self.parent[neighbor] = current
+                heapq.heappush(self.pq, (new_distance, neighbor))
+                self.last_pushed.append(neighbor)
+
+        return dist, current
+
+    def query(self, end):
+        """
+        Shortest path to a goal, growing the tree only as far as needed
+
+        Args:
+            end: (row, col) tuple for the goal
+
+        Returns:
+            List of positions forming the path, or empty list if no path
+        """
+        self.set_goal(end)
+        while self.step():
+            pass
+        return self.get_path()
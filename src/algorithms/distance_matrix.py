@@ -0,0 +1,133 @@
+"""
+Many-to-Many Distance Matrix
+Computes all pairwise shortest-path distances between K points with one
+breadth-first search per point, fanned out over a process pool
+"""
+
+import os
+from collections import deque
+
+import numpy as np
+
+from utils.shared_grid import pool_map, share_grid, worker_state
+
+
+def _setup_worker(shared, cols):
+    """Pool worker setup: flat view of the shared grid and its width"""
+    return {'blocked': shared.flat_view(), 'cols': cols}
+
+
+def _bfs_row(blocked, cols, source, targets, return_paths):
+    """
+    One-to-all BFS from a source, stopped once every target is settled
+
+    Args:
+        blocked: Flat sequence, truthy for obstacles
+        cols: Grid width
+        source: Flat index of the source cell
+        targets: Flat indices of all K points
+        return_paths: Also rebuild the path to each target
+
+    Returns:
+        Tuple of (distances list, paths list or None)
+    """
+    size = len(blocked)
+    rows = size // cols
+    parent = [-2] * size  # -2 = unseen, -1 = source
+    distance = {source: 0}
+    parent[source] = -1
+
+    remaining = set(targets)
+    remaining.discard(source)
+    queue = deque([source])
+
+    while queue and remaining:
+        index = queue.popleft()
+        next_distance = distance[index] + 1
+        row, col = divmod(index, cols)
+        successors = []
+        if row > 0:
+            successors.append(index - cols)
+        if row < rows - 1:
+            successors.append(index + cols)
+        if col > 0:
+            successors.append(index - 1)
+        if col < cols - 1:
+            successors.append(index + 1)
+
+        for neighbor in successors:
+            if parent[neighbor] != -2 or blocked[neighbor]:
+                continue
+            parent[neighbor] = index
+            distance[neighbor] = next_distance
+            remaining.discard(neighbor)
+            queue.append(neighbor)
+
+    distances = [distance.get(target, -1) for target in targets]
+
+    paths = None
+    if return_paths:
+        paths = []
+        for target, d in zip(targets, distances):
+            if d < 0:
+                paths.append([])
+                continue
+            path = []
+            index = target
+            while index != -1:
+                path.append(divmod(index, cols))
+                index = parent[index]
+            path.reverse()
+            paths.append(path)
+
+    return distances, paths
+
+
+def _pool_task(args):
+    """Pool entry point: BFS from one of the K points"""
+    source, targets, return_paths = args
+    return _bfs_row(worker_state['blocked'], worker_state['cols'],
+                    source, targets, return_paths)
+
+
+def compute_distance_matrix(grid, points, return_paths=False, num_workers=None):
+    """
+    Compute the KxK shortest-path distance matrix between points
+
+    The grid is copied once into shared memory and every pool worker
+    attaches to it read-only, so only point indices and result rows are
+    pickled.
+
+    Args:
+        grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+        points: List of K (row, col) tuples
+        return_paths: Also return the shortest path for every pair
+        num_workers: Pool size (defaults to CPU count; 1 runs in-process)
+
+    Returns:
+        Tuple of (matrix, paths). matrix is an int32 array of shape (K, K)
+        with -1 for unreachable pairs; paths is a K x K nested list of
+        position lists (empty when unreachable), or None.
+    """
+    cols = len(grid[0]) if grid else 0
+    targets = [row * cols + col for row, col in points]
+    num_workers = max(1, min(num_workers or os.cpu_count() or 1, len(points)))
+
+    if num_workers == 1:
+        shared = share_grid(grid)
+        blocked = shared.flat_view()
+        try:
+            results = [_bfs_row(blocked, cols, source, targets, return_paths)
+                       for source in targets]
+        finally:
+            blocked.release()
+            shared.close()
+    else:
+        tasks = [(source, targets, return_paths) for source in targets]
+        results = pool_map(grid, _pool_task, tasks, num_workers,
+                           setup=_setup_worker, setup_args=(cols,))
+
+    matrix = np.array([distances for distances, _ in results], dtype=np.int32).reshape(len(points), len(points))
+    paths = [row_paths for _, row_paths in results] if return_paths else None
+
+    return matrix, paths
@@ -0,0 +1,43 @@
+"""
+Expansion Events
+Compact per-step record of a search run, so consumers can build their own
+view incrementally instead of copying the visited set after every step
+"""
+
+from collections import namedtuple
+
+ExpansionEvent = namedtuple('ExpansionEvent', ['cell', 'pushed', 'path'])
+ExpansionEvent.__doc__ = """
+One event of a search run
+
+Attributes:
+    cell: Cell settled by this step (None for the final event)
+    pushed: Tuple of frontier cells pushed while expanding it
+    path: Final path on the last event, None otherwise
+"""
+
+
+def expansion_events(visualizer):
+    """
+    Run a visualizer to completion, yielding one event per settled cell
+
+    Steps that settle nothing (stale queue entries) produce no event. The
+    last event carries the final path (an empty list if none was found).
+    Works with any visualizer that sets ``current``; ``pushed`` is filled
+    in when the visualizer also records ``last_pushed``.
+
+    Args:
+        visualizer: Freshly constructed visualizer
+
+    Yields:
+        ExpansionEvent tuples
+    """
+    explored = visualizer.nodes_explored
+    running = True
+    while running:
+        running = visualizer.step()
+        if visualizer.nodes_explored != explored:
+            explored = visualizer.nodes_explored
+            yield ExpansionEvent(visualizer.current, tuple(getattr(visualizer, 'last_pushed', ())), None)
+
+    yield ExpansionEvent(None, (), visualizer.get_path())
@@ -0,0 +1,267 @@
+"""
+Goal Bounding
+Precomputes, for every free cell and outgoing direction, the bounding box
+of all cells whose optimal path can start with that move, and prunes
+neighbors whose box does not contain the goal
+"""
+
+import os
+import struct
+from collections import deque
+
+import numpy as np
+
+from algorithms.grid_graph import GridGraph
+from utils.shared_grid import pool_map, worker_state
+
+# Same order as the visualizers' neighbor loop: up, down, left, right
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+# File header: magic, format version, rows, cols
+HEADER = struct.Struct('<4sHII')
+MAGIC = b'GBND'
+VERSION = 1
+
+
+def _setup_worker(shared):
+    """Pool worker setup: neighbor lists of the shared grid"""
+    return {'adjacent': _adjacency(shared.array)}
+
+
+def _empty_boxes(count):
+    """Boxes that contain nothing (min > max)"""
+    boxes = np.empty((count, len(DIRECTIONS), 4), dtype=np.int16)
+    boxes[:, :, 0::2] = np.iinfo(np.int16).max
+    boxes[:, :, 1::2] = -1
+    return boxes
+
+
+def _adjacency(blocked):
+    """
+    Free neighbors of every cell as flat indices
+
+    Args:
+        blocked: 2D boolean array of obstacles
+
+    Returns:
+        List (one entry per cell) of lists of neighbor indices
+    """
+    rows, cols = blocked.shape
+    flat_blocked = blocked.ravel().tolist()
+    adjacent = []
+    for index in range(rows * cols):
+        row, col = divmod(index, cols)
+        adjacent.append([(row + dr) * cols + col + dc for dr, dc in DIRECTIONS
+                         if 0 <= row + dr < rows and 0 <= col + dc < cols
+                         and not flat_blocked[(row + dr) * cols + col + dc]])
+    return adjacent
+
+
+def _boxes_from(blocked, sources, adjacent):
+    """
+    Compute the first-move bounding boxes of a batch of source cells
+
+    BFS from each source propagates a bitmask of every first move that
+    starts some optimal path; a target is added to the box of each move in
+    its mask, so ties never prune an optimal route.
+
+    Args:
+        blocked: 2D boolean array of obstacles
+        sources: List of (row, col) free cells
+        adjacent: Neighbor lists from _adjacency(blocked)
+
+    Returns:
+        int16 array of shape (len(sources), 4, 4) holding
+        [row_min, row_max, col_min, col_max] per direction
+    """
+    rows, cols = blocked.shape
+    boxes = _empty_boxes(len(sources))
+    row_of = np.repeat(np.arange(rows), cols)
+    col_of = np.tile(np.arange(cols), rows)
+    # Direction of a flat index offset (up/down last, so they win if cols == 1)
+    direction_of = {-1: 2, 1: 3, -cols: 0, cols: 1}
+
+    for k, (source_row, source_col) in enumerate(sources):
+        source = source_row * cols + source_col
+        distance = [-1] * (rows * cols)
+        first_moves = [0] * (rows * cols)
+        distance[source] = 0
+        queue = deque()
+
+        for neighbor in adjacent[source]:
+            distance[neighbor] = 1
+            first_moves[neighbor] = 1 << direction_of[neighbor - source]
+            queue.append(neighbor)
+
+        while queue:
+            index = queue.popleft()
+            next_distance = distance[index] + 1
+            moves = first_moves[index]
+            for neighbor in adjacent[index]:
+                if distance[neighbor] == -1:
+                    distance[neighbor] = next_distance
+                    first_moves[neighbor] = moves
+                    queue.append(neighbor)
+                elif distance[neighbor] == next_distance:
+                    first_moves[neighbor] |= moves
+
+        first_moves = np.array(first_moves, dtype=np.uint8)
+        for d in range(len(DIRECTIONS)):
+            mask = (first_moves >> d) & 1 == 1
+            if mask.any():
+                r, c = row_of[mask], col_of[mask]
+                boxes[k, d] = (r.min(), r.max(), c.min(), c.max())
+
+    return boxes
+
+
+def _pool_task(sources):
+    """Pool entry point: boxes for one chunk of source cells"""
+    return _boxes_from(worker_state['blocked'], sources, worker_state['adjacent'])
+
+
+class GoalBounds:
+    """
+    Goal-bounding boxes for every cell and direction of one map
+
+    boxes[row, col, d] is [row_min, row_max, col_min, col_max] of the cells
+    whose optimal path from (row, col) can begin with DIRECTIONS[d].
+    Empty boxes have row_min > row_max.
+    """
+
+    def __init__(self, boxes):
+        """
+        Initialize from a box array
+
+        Args:
+            boxes: int16 array of shape (rows, cols, 4, 4)
+        """
+        self.boxes = boxes
+        self.rows, self.cols = boxes.shape[:2]
+
+    @classmethod
+    def build(cls, grid, num_workers=None, chunk_size=64):
+        """
+        Run the all-sources preprocessing
+
+        Costs one BFS per free cell, so it is intended for maps that are
+        queried many times. Source cells are split into chunks and processed
+        by a pool sharing the grid read-only; the neighbor lists are built
+        once per process, not per chunk.
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+            num_workers: Pool size (defaults to CPU count; 1 runs in-process)
+            chunk_size: Source cells per pool task
+
+        Returns:
+            GoalBounds instance
+        """
+        blocked = np.asarray(grid) == 1
+        rows, cols = blocked.shape
+        sources = [(int(r), int(c)) for r, c in zip(*np.nonzero(~blocked))]
+        chunks = [sources[i:i + chunk_size] for i in range(0, len(sources), chunk_size)]
+        num_workers = max(1, min(num_workers or os.cpu_count() or 1, len(chunks)))
+
+        if num_workers == 1:
+            adjacent = _adjacency(blocked)
+            results = [_boxes_from(blocked, chunk, adjacent) for chunk in chunks]
+        else:
+            results = pool_map(grid, _pool_task, chunks, num_workers, setup=_setup_worker)
+
+        boxes = _empty_boxes(rows * cols).reshape(rows, cols, len(DIRECTIONS), 4)
+        for chunk, chunk_boxes in zip(chunks, results):
+            chunk_rows, chunk_cols = zip(*chunk)
+            boxes[list(chunk_rows), list(chunk_cols)] = chunk_boxes
+
+        return cls(boxes)
+
+    def save(self, path):
+        """Write the boxes to a compact binary file (header + raw int16)"""
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.rows, self.cols))
+            f.write(np.ascontiguousarray(self.boxes, dtype='<i2').tobytes())
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read boxes written by save()
+
+        Args:
+            path: File path
+
+        Returns:
+            GoalBounds instance
+        """
+        with open(path, 'rb') as f:
+            magic, version, rows, cols = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a goal-bounding file")
+            boxes = np.frombuffer(f.read(), dtype='<i2')
+
+        return cls(boxes.reshape(rows, cols, len(DIRECTIONS), 4).astype(np.int16))
+
+    def allowed_moves(self, goal):
+        """
+        Evaluate every box against one goal
+
+        Args:
+            goal: (row, col) tuple
+
+        Returns:
+            Boolean array of shape (rows, cols, 4)
+        """
+        b = self.boxes
+        return ((b[..., 0] <= goal[0]) & (goal[0] <= b[..., 1]) &
+                (b[..., 2] <= goal[1]) & (goal[1] <= b[..., 3]))
+
+
+class GoalBoundingGraph(GridGraph):
+    """
+    Grid graph that drops moves which cannot lead optimally to the goal
+
+    Pass it as ``graph`` to any visualizer. Optimal paths are preserved.
+    """
+
+    def __init__(self, grid, bounds):
+        """
+        Initialize graph
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+            bounds: GoalBounds built for this grid
+        """
+        super().__init__(grid)
+        self.bounds = bounds
+        self.goal = None
+
+    def prepare_query(self, start, end):
+        """Remember the goal; boxes are tested lazily per expanded cell"""
+        super().prepare_query(start, end)
+        self.goal = end
+
+    def get_neighbors(self, pos):
+        """
+        Get neighbors whose first-move box contains the goal
+
+        Args:
+            pos: (row, col) tuple
+
+        Returns:
+            List of valid neighbor positions
+        """
+        row, col = pos
+        goal_row, goal_col = self.goal
+        boxes = self.bounds.boxes[row, col].tolist()
+        neighbors = []
+
+        for d, (dr, dc) in enumerate(DIRECTIONS):
+            row_min, row_max, col_min, col_max = boxes[d]
+            if not (row_min <= goal_row <= row_max and col_min <= goal_col <= col_max):
+                continue
+            new_row, new_col = row + dr, col + dc
+            if 0 <= new_row < self.rows and 0 <= new_col < self.cols:
+                if self.grid[new_row][new_col] != 1:
+                    neighbors.append((new_row, new_col))
+
+        return neighbors
@@ -6,6 +6,8 @@ Uses heuristic-only guidance (no path cost consideration)
 import heapq
 import time
 
+from algorithms.events import expansion_events
+
 class GreedyVisualizer:
     """
     Greedy Best-First Search Algorithm with visualization
@@ -13,7 +15,7 @@ class GreedyVisualizer:
     Fast but NOT guaranteed to find optimal path
     """
 
-    def __init__(self, grid, start, end):
+    def __init__(self, grid, start, end, graph=None):
         """
         Initialize Greedy Best-First Search
 
@@ -21,12 +23,16 @@ class GreedyVisualizer:
             grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
             start: (row, col) tuple for start position
             end: (row, col) tuple for end position
+            graph: Optional GridGraph to search instead of the raw grid
         """
         self.grid = grid
         self.start = start
         self.end = end
         self.rows = len(grid)
         self.cols = len(grid[0]) if grid else 0
+        self.graph = graph
+        if graph is not None:
+            graph.prepare_query(start, end)
 
         # Algorithm state
         self.visited = set()
@@ -35,6 +41,7 @@ class GreedyVisualizer:
         self.h_score = {start: self.heuristic(start)}
         self.pq = [(self.h_score[start], start)]  # Priority queue: (h_score, position)
         self.current = None
+        self.last_pushed = []  # Frontier cells pushed by the last expansion
         self.found_path = False
 
         # Statistics
@@ -64,6 +71,9 @@ class GreedyVisualizer:
         Returns:
             List of valid neighbor positions
         """
+        if self.graph is not None:
+            return self.graph.get_neighbors(pos)
+
         row, col = pos
         neighbors = []
 
@@ -104,6 +114,7 @@ class GreedyVisualizer:
         self.visited.add(current)
         self.current = current
         self.nodes_explored += 1
+        self.last_pushed = []
 
         # Check if reached goal
         if current == self.end:
@@ -125,9 +136,19 @@ class GreedyVisualizer:
                 self.parent[neighbor] = current
                 self.h_score[neighbor] = h_neighbor
                 heapq.heappush(self.pq, (h_neighbor, neighbor))
+                self.last_pushed.append(neighbor)
 
         return True
 
+    def iter_events(self):
+        """
+        Run to completion, yielding an ExpansionEvent per settled cell
+
+        Returns:
+            Generator of ExpansionEvent tuples (see algorithms.events)
+        """
+        return expansion_events(self)
+
     def get_visited(self):
         """Get set of visited cells"""
         return self.visited
@@ -153,6 +174,9 @@ class GreedyVisualizer:
         path.append(self.start)
         path.reverse()
 
+        if self.graph is not None:
+            return self.graph.expand_path(path)
+
         return path
 
     def get_stats(self):
@@ -0,0 +1,75 @@
+"""
+Grid Graph
+Search-space abstraction that the visualizers can run on instead of the
+raw grid (reduced graphs, pruned graphs, ...)
+"""
+
+
+class GridGraph:
+    """
+    Plain 4-directional unit-cost grid graph
+
+    Pass an instance (or a subclass) as the ``graph`` argument of a
+    visualizer to change the space it searches. Subclasses override
+    get_neighbors/cost and, when their edges skip cells, expand_path.
+    """
+
+    def __init__(self, grid):
+        """
+        Initialize graph
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+        """
+        self.grid = grid
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+
+    def prepare_query(self, start, end):
+        """
+        Hook called by a visualizer before it starts searching
+
+        Args:
+            start: (row, col) tuple for start position
+            end: (row, col) tuple for end position
+        """
+        self.start = start
+        self.end = end
+
+    def get_neighbors(self, pos):
+        """
+        Get valid neighboring cells (4-directional)
+
+        Args:
+            pos: (row, col) tuple
+
+        Returns:
+            List of valid neighbor positions
+        """
+        row, col = pos
+        neighbors = []
+
+        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            new_row, new_col = row + dr, col + dc
+
+            if 0 <= new_row < self.rows and 0 <= new_col < self.cols:
+                if self.grid[new_row][new_col] != 1:
+                    neighbors.append((new_row, new_col))
+
+        return neighbors
+
+    def cost(self, a, b):
+        """Cost of the edge from a to b"""
+        return 1
+
+    def expand_path(self, path):
+        """
+        Turn a path over graph nodes into a cell-by-cell grid path
+
+        Args:
+            path: List of graph nodes from start to end
+
+        Returns:
+            List of grid positions
+        """
+        return path
@@ -0,0 +1,307 @@
+"""
+Hash-Distributed A* (HDA*)
+Parallel A* where every cell is owned by one worker process, chosen by
+hashing the cell index
+"""
+
+import heapq
+import multiprocessing
+import os
+import queue
+import time
+
+import numpy as np
+
+from utils.shared_grid import SharedArray, share_grid
+
+UNSEEN = np.iinfo(np.int32).max
+
+
+def owner_of(index, num_workers):
+    """
+    Worker that owns a cell
+
+    Multiplicative hashing spreads neighboring cells across workers so
+    each worker's share of the frontier stays balanced.
+
+    Args:
+        index: Flat cell index (row * cols + col)
+        num_workers: Number of worker processes
+
+    Returns:
+        Worker id in range(num_workers)
+    """
+    return ((index * 2654435761) & 0xFFFFFFFF) % num_workers
+
+
+def _hda_worker(worker_id, num_workers, handles, start, end, cols, inboxes,
+                pending, incumbent, stop, batch_size):
+    """
+    Worker process main loop
+
+    Termination uses a token count held in ``pending``: every busy worker
+    and every message in flight holds one token. A sender adds a token
+    before putting a batch; a busy receiver drops the token of each batch
+    it consumes, while an idle receiver keeps it and becomes busy; a worker
+    drops its own token when it goes idle. pending == 0 therefore means
+    every worker is idle with nothing in flight, which is stable.
+    """
+    arrays = {name: SharedArray.attach(handle) for name, handle in handles.items()}
+    blocked = arrays['blocked'].flat_view()
+    g_score = arrays['g_score'].flat_view()
+    parent = arrays['parent'].flat_view()
+    closed = arrays['closed'].flat_view()
+
+    rows = len(blocked) // cols
+    end_row, end_col = divmod(end, cols)
+    inbox = inboxes[worker_id]
+    outgoing = [[] for _ in range(num_workers)]
+    open_list = []
+    state = {'busy': True, 'best': float('inf'), 'expanded': 0}
+
+    def relax(index, cost, via):
+        if cost >= g_score[index]:
+            return
+        g_score[index] = cost
+        parent[index] = via
+        if index == end:
+            with incumbent.get_lock():
+                if cost < incumbent.value:
+                    incumbent.value = cost
+            state['best'] = min(state['best'], cost)
+            return
+        row, col = divmod(index, cols)
+        heapq.heappush(open_list, (cost + abs(row - end_row) + abs(col - end_col), cost, index))
+
+    def receive(batch):
+        for index, cost, via in batch:
+            relax(index, cost, via)
+        if state['busy']:
+            with pending.get_lock():
+                pending.value -= 1
+        else:
+            state['busy'] = True
+
+    def flush(target):
+        with pending.get_lock():
+            pending.value += 1
+        inboxes[target].put(outgoing[target])
+        outgoing[target] = []
+
+    try:
+        while not stop.is_set():
+            while True:
+                try:
+                    receive(inbox.get_nowait())
+                except queue.Empty:
+                    break
+
+            best = state['best'] = min(state['best'], incumbent.value)
+
+            # Expand a round of nodes that can still beat the incumbent
+            for _ in range(batch_size):
+                if not open_list or open_list[0][0] >= best:
+                    break
+                f, cost, index = heapq.heappop(open_list)
+                if cost > g_score[index]:
+                    continue
+
+                closed[index] = 1
+                state['expanded'] += 1
+                row, col = divmod(index, cols)
+                successors = []
+                if row > 0:
+                    successors.append(index - cols)
+                if row < rows - 1:
+                    successors.append(index + cols)
+                if col > 0:
+                    successors.append(index - 1)
+                if col < cols - 1:
+                    successors.append(index + 1)
+
+                for neighbor in successors:
+                    if blocked[neighbor]:
+                        continue
+                    target = owner_of(neighbor, num_workers)
+                    if target == worker_id:
+                        relax(neighbor, cost + 1, index)
+                    else:
+                        outgoing[target].append((neighbor, cost + 1, index))
+                        if len(outgoing[target]) >= batch_size:
+                            flush(target)
+                best = state['best']
+
+            # Hand partial batches over so other workers are not starved
+            for target in range(num_workers):
+                if outgoing[target]:
+                    flush(target)
+
+            if open_list and open_list[0][0] < state['best']:
+                continue
+
+            # No useful work left: go idle until a batch arrives
+            if state['busy']:
+                state['busy'] = False
+                with pending.get_lock():
+                    pending.value -= 1
+            try:
+                receive(inbox.get(timeout=0.005))
+            except queue.Empty:
+                pass
+    finally:
+        arrays['expanded'].array[worker_id] = state['expanded']
+        for view in (blocked, g_score, parent, closed):
+            view.release()
+        for shared in arrays.values():
+            shared.close()
+
+
+class HDAStarVisualizer:
+    """
+    Hash-Distributed A* across worker processes
+    Returns the same optimal path cost as AStarVisualizer. The search runs
+    in parallel, so a single step() call performs the whole search.
+    """
+
+    def __init__(self, grid, start, end, num_workers=None, batch_size=64):
+        """
+        Initialize HDA*
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+            start: (row, col) tuple for start position
+            end: (row, col) tuple for end position
+            num_workers: Number of worker processes (defaults to CPU count)
+            batch_size: Nodes per message and expansions per round
+        """
+        self.grid = grid
+        self.start = start
+        self.end = end
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+        self.num_workers = max(1, num_workers or os.cpu_count() or 1)
+        self.batch_size = batch_size
+
+        # Results (filled in by step)
+        self.path = []
+        self.visited = set()
+        self.found_path = False
+
+        # Statistics
+        self.nodes_explored = 0
+        self.start_time = time.time()
+        self.end_time = None
+
+    def step(self):
+        """
+        Run the complete parallel search
+
+        Returns:
+            False (the search always completes in one call)
+        """
+        if self.end_time is not None:
+            return False
+
+        cols = self.cols
+        start = self.start[0] * cols + self.start[1]
+        end = self.end[0] * cols + self.end[1]
+        size = self.rows * cols
+
+        arrays = {
+            'blocked': share_grid(self.grid),
+            'g_score': SharedArray.create((size,), np.int32, fill=UNSEEN),
+            'parent': SharedArray.create((size,), np.int32, fill=-1),
+            'closed': SharedArray.create((size,), np.uint8),
+            'expanded': SharedArray.create((self.num_workers,), np.int64),
+        }
+        handles = {name: shared.handle() for name, shared in arrays.items()}
+
+        context = multiprocessing.get_context()
+        inboxes = [context.Queue() for _ in range(self.num_workers)]
+        # One token per (initially busy) worker plus one for the seed message
+        pending = context.Value('q', self.num_workers + 1)
+        incumbent = context.Value('d', float('inf'))
+        stop = context.Event()
+
+        inboxes[owner_of(start, self.num_workers)].put([(start, 0, -1)])
+
+        workers = [context.Process(target=_hda_worker,
+                                   args=(i, self.num_workers, handles, start, end, cols,
+                                         inboxes, pending, incumbent, stop, self.batch_size),
+                                   daemon=True)
+                   for i in range(self.num_workers)]
+        try:
+            for worker in workers:
+                worker.start()
+
+            while pending.value > 0:
+                if any(worker.exitcode not in (None, 0) for worker in workers):
+                    raise RuntimeError("HDA* worker process failed")
+                time.sleep(0.0005)
+
+            stop.set()
+            for worker in workers:
+                worker.join()
+
+            self._collect(arrays, start, end)
+        finally:
+            stop.set()
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+            for shared in arrays.values():
+                shared.close()
+
+        self.end_time = time.time()
+        return False
+
+    def _collect(self, arrays, start, end):
+        """Read the path and statistics out of the shared arrays"""
+        cols = self.cols
+        g_score = arrays['g_score'].array
+        parent = arrays['parent'].array
+
+        self.nodes_explored = int(arrays['expanded'].array.sum())
+        self.visited = {divmod(int(i), cols) for i in np.flatnonzero(arrays['closed'].array)}
+
+        if g_score[end] == UNSEEN:
+            return
+
+        self.found_path = True
+        index = end
+        path = []
+        while index != -1:
+            path.append(divmod(int(index), cols))
+            index = parent[index] if index != start else -1
+        path.reverse()
+        self.path = path
+
+    def get_visited(self):
+        """Get set of all expanded cells"""
+        return set(self.visited)
+
+    def get_path(self):
+        """
+        Get path from start to end
+
+        Returns:
+            List of positions forming the path, or empty list if no path
+        """
+        return list(self.path) if self.found_path else []
+
+    def get_stats(self):
+        """
+        Get algorithm performance statistics
+
+        Returns:
+            Dictionary with performance metrics
+        """
+        path = self.get_path()
+        time_ms = (self.end_time - self.start_time) * 1000 if self.end_time else 0
+
+        return {
+            'nodes_explored': self.nodes_explored,
+            'path_length': len(path) if path else 0,
+            'time_ms': time_ms,
+            'found_path': self.found_path
+        }
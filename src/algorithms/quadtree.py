@@ -0,0 +1,294 @@
+"""
+Quadtree Search Implementation
+Decomposes free space into square leaves and runs A* over the leaves,
+refining the leaf corridor into a cell path at the end. Paths are
+approximate: they can be longer than the optimal path
+"""
+
+import heapq
+import time
+
+import numpy as np
+
+
+class QuadtreeDecomposition:
+    """
+    Region quadtree over the free cells of a grid
+
+    Each leaf is a fully free square (clipped at the grid border). Leaves
+    are built once per map and can be shared between searches.
+    """
+
+    def __init__(self, grid):
+        """
+        Build the decomposition
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+        """
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+
+        blocked = np.asarray(grid, dtype=np.int8).reshape(self.rows, self.cols) == 1
+
+        # Integral image: obstacle count of any rectangle in O(1)
+        self.integral = np.zeros((self.rows + 1, self.cols + 1), dtype=np.int64)
+        self.integral[1:, 1:] = blocked.cumsum(axis=0).cumsum(axis=1)
+
+        self.leaves = []  # (r0, c0, r1, c1) with exclusive r1, c1
+        self.label = np.full((self.rows, self.cols), -1, dtype=np.int32)
+        self._decompose()
+
+        self.neighbors = self._find_neighbors()
+
+    def obstacle_count(self, r0, c0, r1, c1):
+        """Count obstacles in rows r0..r1-1 and columns c0..c1-1"""
+        s = self.integral
+        return int(s[r1, c1] - s[r0, c1] - s[r1, c0] + s[r0, c0])
+
+    def _decompose(self):
+        """Split squares until every region is fully free or fully blocked"""
+        size = 1
+        while size < max(self.rows, self.cols):
+            size *= 2
+
+        stack = [(0, 0, size)]
+        while stack:
+            r0, c0, size = stack.pop()
+            r1, c1 = min(r0 + size, self.rows), min(c0 + size, self.cols)
+            if r0 >= r1 or c0 >= c1:
+                continue
+
+            count = self.obstacle_count(r0, c0, r1, c1)
+            if count == 0:
+                self.label[r0:r1, c0:c1] = len(self.leaves)
+                self.leaves.append((r0, c0, r1, c1))
+            elif count < (r1 - r0) * (c1 - c0):
+                half = size // 2
+                stack.extend([(r0, c0, half), (r0, c0 + half, half),
+                              (r0 + half, c0, half), (r0 + half, c0 + half, half)])
+
+    def _find_neighbors(self):
+        """
+        Find the leaves sharing an edge with each leaf
+
+        Returns:
+            List indexed by leaf of neighboring leaf indices
+        """
+        label = self.label
+        pairs = [np.stack([label[:, :-1].ravel(), label[:, 1:].ravel()]),
+                 np.stack([label[:-1, :].ravel(), label[1:, :].ravel()])]
+        pairs = np.concatenate(pairs, axis=1)
+        pairs = pairs[:, (pairs[0] >= 0) & (pairs[1] >= 0) & (pairs[0] != pairs[1])]
+        pairs = np.concatenate([pairs, pairs[::-1]], axis=1)
+        pairs = np.unique(pairs[0].astype(np.int64) * len(self.leaves) + pairs[1])
+
+        neighbors = [[] for _ in self.leaves]
+        for a, b in zip(*divmod(pairs, len(self.leaves))):
+            neighbors[a].append(int(b))
+        return neighbors
+
+    def leaf_of(self, pos):
+        """Get the leaf index containing a cell (-1 for obstacles)"""
+        return int(self.label[pos[0], pos[1]])
+
+    def center(self, leaf):
+        """Get the center point of a leaf"""
+        r0, c0, r1, c1 = self.leaves[leaf]
+        return ((r0 + r1 - 1) / 2, (c0 + c1 - 1) / 2)
+
+
+class QuadtreeVisualizer:
+    """
+    Quadtree A* with visualization capabilities
+    Searches over free-space leaves instead of cells, then runs a cell-level
+    A* restricted to the leaf corridor.
+
+    Paths are approximate: always valid, but they can be longer than
+    optimal. Leaf-to-leaf costs are measured between leaf centers, so the
+    leaf path may not contain the shortest route, and the refinement only
+    finds the best path inside that corridor. Use AStarVisualizer when
+    exact lengths are needed.
+    """
+
+    def __init__(self, grid, start, end, decomposition=None):
+        """
+        Initialize quadtree search
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+            start: (row, col) tuple for start position
+            end: (row, col) tuple for end position
+            decomposition: Optional prebuilt QuadtreeDecomposition for this grid
+        """
+        self.grid = grid
+        self.start = start
+        self.end = end
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+        self.tree = decomposition if decomposition is not None else QuadtreeDecomposition(grid)
+
+        self.start_leaf = self.tree.leaf_of(start)
+        self.end_leaf = self.tree.leaf_of(end)
+
+        # Algorithm state (over leaves)
+        self.visited = set()
+        self.parent = {}
+        self.g_score = {self.start_leaf: 0}
+        self.pq = []
+        if self.start_leaf >= 0 and self.end_leaf >= 0:
+            self.pq.append((self.heuristic(self.start_leaf), self.start_leaf))
+        self.current = None
+        self.found_path = False
+        self.path = []
+
+        # Statistics
+        self.nodes_explored = 0
+        self.refinement_nodes = 0
+        self.start_time = time.time()
+        self.end_time = None
+
+    def position(self, leaf):
+        """Representative point of a leaf (the endpoint itself for their leaves)"""
+        if leaf == self.start_leaf:
+            return self.start
+        if leaf == self.end_leaf:
+            return self.end
+        return self.tree.center(leaf)
+
+    def heuristic(self, leaf):
+        """Manhattan distance from a leaf's representative point to the goal"""
+        pos = self.position(leaf)
+        return abs(pos[0] - self.end[0]) + abs(pos[1] - self.end[1])
+
+    def step(self):
+        """
+        Execute one step of quadtree A* (expand one leaf)
+
+        Returns:
+            True if algorithm should continue, False if complete
+        """
+        if not self.pq:
+            self.end_time = time.time()
+            return False
+
+        f, current = heapq.heappop(self.pq)
+
+        if current in self.visited:
+            return True
+
+        self.visited.add(current)
+        self.current = current
+        self.nodes_explored += 1
+
+        if current == self.end_leaf:
+            self.path = self._refine()
+            self.found_path = bool(self.path)
+            self.end_time = time.time()
+            return False
+
+        current_g = self.g_score[current]
+        here = self.position(current)
+
+        for neighbor in self.tree.neighbors[current]:
+            if neighbor in self.visited:
+                continue
+
+            there = self.position(neighbor)
+            tentative_g = current_g + abs(here[0] - there[0]) + abs(here[1] - there[1])
+
+            if neighbor not in self.g_score or tentative_g < self.g_score[neighbor]:
+                self.g_score[neighbor] = tentative_g
+                self.parent[neighbor] = current
+                heapq.heappush(self.pq, (tentative_g + self.heuristic(neighbor), neighbor))
+
+        return True
+
+    def _refine(self):
+        """
+        Turn the leaf path into a cell path
+
+        Runs A* over the cells of the leaves on the path and their neighbors.
+
+        Returns:
+            List of positions forming the path, or empty list if none
+        """
+        corridor = set()
+        leaf = self.end_leaf
+        while True:
+            corridor.add(leaf)
+            corridor.update(self.tree.neighbors[leaf])
+            if leaf not in self.parent:
+                break
+            leaf = self.parent[leaf]
+
+        label = self.tree.label
+        end = self.end
+        g_score = {self.start: 0}
+        parent = {}
+        closed = set()
+        pq = [(abs(self.start[0] - end[0]) + abs(self.start[1] - end[1]), self.start)]
+
+        while pq:
+            f, current = heapq.heappop(pq)
+            if current in closed:
+                continue
+            closed.add(current)
+            self.refinement_nodes += 1
+
+            if current == end:
+                path = [end]
+                while path[-1] in parent:
+                    path.append(parent[path[-1]])
+                path.reverse()
+                return path
+
+            row, col = current
+            for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                r, c = row + dr, col + dc
+                if not (0 <= r < self.rows and 0 <= c < self.cols):
+                    continue
+                if int(label[r, c]) not in corridor:
+                    continue
+                tentative_g = g_score[current] + 1
+                if tentative_g < g_score.get((r, c), float('inf')):
+                    g_score[(r, c)] = tentative_g
+                    parent[(r, c)] = current
+                    heapq.heappush(pq, (tentative_g + abs(r - end[0]) + abs(c - end[1]), (r, c)))
+
+        return []
+
+    def get_visited(self):
+        """Get set of all cells in expanded leaves"""
+        visited = set()
+        for leaf in self.visited:
+            r0, c0, r1, c1 = self.tree.leaves[leaf]
+            visited.update((r, c) for r in range(r0, r1) for c in range(c0, c1))
+        return visited
+
+    def get_path(self):
+        """
+        Get the refined path from start to end (possibly longer than optimal)
+
+        Returns:
+            List of positions forming the path, or empty list if no path
+        """
+        return list(self.path) if self.found_path else []
+
+    def get_stats(self):
+        """
+        Get algorithm performance statistics
+
+        Returns:
+            Dictionary with performance metrics
+        """
+        path = self.get_path()
+        time_ms = (self.end_time - self.start_time) * 1000 if self.end_time else 0
+
+        return {
+            'nodes_explored': self.nodes_explored,
+            'refinement_nodes': self.refinement_nodes,
+            'path_length': len(path) if path else 0,
+            'time_ms': time_ms,
+            'found_path': self.found_path
+        }
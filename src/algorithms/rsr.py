@@ -0,0 +1,154 @@
+"""
+Rectangular Symmetry Reduction (RSR)
+Decomposes free space into empty rectangles, prunes their interior cells
+and connects opposite perimeter cells with macro-edges
+"""
+
+from algorithms.grid_graph import GridGraph
+
+
+class RSRGraph(GridGraph):
+    """
+    Symmetry-reduced graph for 4-directional unit-cost grids
+
+    Inside an empty rectangle every monotone route between two perimeter
+    cells has the same cost, so interior cells are removed and each
+    perimeter cell gets a macro-edge straight across to the opposite side.
+    Shortest path lengths are preserved. Pass it as ``graph`` to any
+    visualizer; a start or end inside a rectangle is connected to the four
+    perimeter cells in line with it.
+    """
+
+    def __init__(self, grid):
+        """
+        Build the rectangle decomposition
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+        """
+        super().__init__(grid)
+        self.rects = []  # (r0, c0, r1, c1), all inclusive
+        self.rect_id = [[-1] * self.cols for _ in range(self.rows)]
+        self.query_nodes = set()
+        self._decompose()
+
+    def _decompose(self):
+        """Greedily cover free space with maximal-width, then maximal-height rectangles"""
+        grid = self.grid
+        rect_id = self.rect_id
+
+        for r in range(self.rows):
+            id_row = rect_id[r]
+            grid_row = grid[r]
+            for c in range(self.cols):
+                if id_row[c] != -1 or grid_row[c] == 1:
+                    continue
+
+                # Widen along the row, then grow downwards while the span stays free
+                c1 = c
+                while c1 + 1 < self.cols and id_row[c1 + 1] == -1 and grid_row[c1 + 1] != 1:
+                    c1 += 1
+                r1 = r
+                while r1 + 1 < self.rows and all(grid[r1 + 1][k] != 1 for k in range(c, c1 + 1)):
+                    r1 += 1
+
+                rid = len(self.rects)
+                self.rects.append((r, c, r1, c1))
+                for i in range(r, r1 + 1):
+                    rect_id[i][c:c1 + 1] = [rid] * (c1 - c + 1)
+
+    def is_interior(self, pos):
+        """Check whether a cell is strictly inside its rectangle (pruned)"""
+        rid = self.rect_id[pos[0]][pos[1]]
+        if rid == -1:
+            return False
+        r0, c0, r1, c1 = self.rects[rid]
+        return r0 < pos[0] < r1 and c0 < pos[1] < c1
+
+    def node_count(self):
+        """Number of cells that remain as graph nodes"""
+        return sum(1 for r in range(self.rows) for c in range(self.cols)
+                   if self.grid[r][c] != 1 and not self.is_interior((r, c)))
+
+    def prepare_query(self, start, end):
+        """Re-insert the endpoints if they fall on pruned interior cells"""
+        super().prepare_query(start, end)
+        self.query_nodes = {pos for pos in (start, end) if self.is_interior(pos)}
+
+    def get_neighbors(self, pos):
+        """
+        Get neighbors in the reduced graph
+
+        Args:
+            pos: (row, col) tuple
+
+        Returns:
+            List of neighbor positions (adjacent cells and macro-edge targets)
+        """
+        row, col = pos
+        rid = self.rect_id[row][col]
+        if rid == -1:
+            return super().get_neighbors(pos)
+        r0, c0, r1, c1 = self.rects[rid]
+
+        if pos in self.query_nodes:
+            # Interior endpoint: straight lines to the four sides
+            neighbors = [(r0, col), (r1, col), (row, c0), (row, c1)]
+        else:
+            neighbors = []
+            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                new_row, new_col = row + dr, col + dc
+                if 0 <= new_row < self.rows and 0 <= new_col < self.cols:
+                    if self.grid[new_row][new_col] != 1:
+                        neighbor = (new_row, new_col)
+                        if neighbor in self.query_nodes or not self.is_interior(neighbor):
+                            neighbors.append(neighbor)
+
+            # Macro-edges across rectangles that have an interior
+            if r1 - r0 >= 2 and c1 - c0 >= 2:
+                if row == r0:
+                    neighbors.append((r1, col))
+                elif row == r1:
+                    neighbors.append((r0, col))
+                if col == c0:
+                    neighbors.append((row, c1))
+                elif col == c1:
+                    neighbors.append((row, c0))
+
+        # Endpoints inside this rectangle are reachable in a straight line
+        for node in self.query_nodes:
+            if node != pos and self.rect_id[node[0]][node[1]] == rid:
+                if pos in self.query_nodes or node[0] == row or node[1] == col:
+                    if node not in neighbors:
+                        neighbors.append(node)
+
+        return neighbors
+
+    def cost(self, a, b):
+        """Edges are straight (or L-shaped inside one rectangle), so cost is Manhattan distance"""
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    def expand_path(self, path):
+        """
+        Fill in the cells skipped by macro-edges
+
+        Args:
+            path: List of graph nodes from start to end
+
+        Returns:
+            List of grid positions
+        """
+        if not path:
+            return path
+
+        cells = [path[0]]
+        for (ar, ac), (br, bc) in zip(path, path[1:]):
+            # Move along the row first, then the column (both stay inside one rectangle)
+            step = 1 if bc > ac else -1
+            for c in range(ac + step, bc + step, step) if ac != bc else ():
+                cells.append((ar, c))
+            step = 1 if br > ar else -1
+            for r in range(ar + step, br + step, step) if ar != br else ():
+                cells.append((r, bc))
+
+        return cells
@@ -0,0 +1,320 @@
+"""
+Simple Subgoal Graph
+Places subgoals next to convex obstacle corners, links subgoals that reach
+each other along a Manhattan-length path and searches that small graph
+instead of the grid
+"""
+
+import heapq
+import time
+
+# Diagonal quadrants explored from a cell
+QUADRANTS = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+
+class SubgoalGraph:
+    """
+    Subgoal graph of a 4-directional unit-cost grid
+
+    A free cell is a subgoal when a diagonal neighbor is an obstacle while
+    both cells beside that corner are free: shortest paths only need to
+    turn at such cells. Two cells are h-reachable when a monotone path
+    (moving only towards the target) connects them, i.e. their distance is
+    the Manhattan distance. Subgoals are linked when they are directly
+    h-reachable, meaning no other subgoal is needed on the way.
+    """
+
+    def __init__(self, grid):
+        """
+        Place subgoals and link them
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+        """
+        self.grid = grid
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+        self.subgoals = set()
+        self.edges = {}
+
+        self._place_subgoals()
+        for subgoal in self.subgoals:
+            self.edges[subgoal] = [(other, self.h(subgoal, other))
+                                   for other in self.direct_h_reachable(subgoal)]
+
+    @classmethod
+    def for_grid(cls, grid):
+        """
+        Get the subgoal graph for a grid, reusing the cached one on a Grid
+
+        Args:
+            grid: 2D list or utils.grid.Grid
+
+        Returns:
+            SubgoalGraph instance
+        """
+        if hasattr(grid, 'cached'):
+            return grid.cached('subgoal_graph', lambda: cls(grid))
+        return cls(grid)
+
+    def is_free(self, row, col):
+        """Check whether a cell is inside the grid and not an obstacle"""
+        return 0 <= row < self.rows and 0 <= col < self.cols and self.grid[row][col] != 1
+
+    def _place_subgoals(self):
+        """Mark free cells diagonally touching a convex obstacle corner"""
+        for row in range(self.rows):
+            for col in range(self.cols):
+                if not self.is_free(row, col):
+                    continue
+                for dr, dc in QUADRANTS:
+                    r, c = row + dr, col + dc
+                    if (0 <= r < self.rows and 0 <= c < self.cols and self.grid[r][c] == 1
+                            and self.is_free(r, col) and self.is_free(row, c)):
+                        self.subgoals.add((row, col))
+                        break
+
+    @staticmethod
+    def h(a, b):
+        """Manhattan distance"""
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    def monotone_region(self, source, quadrant, stop=(), bound=None):
+        """
+        Cells reachable from source by moving only in a quadrant's two directions
+
+        Args:
+            source: (row, col) tuple
+            quadrant: (dr, dc) with dr, dc in {-1, 1}
+            stop: Cells that are reached but not expanded further
+            bound: Optional (row, col) limiting the exploration to the box
+                   between source and bound
+
+        Returns:
+            Set of reached cells (including source)
+        """
+        dr, dc = quadrant
+        source_row, source_col = source
+        max_i = self.rows if bound is None else abs(bound[0] - source_row) + 1
+        max_j = self.cols if bound is None else abs(bound[1] - source_col) + 1
+
+        reached = set()
+        previous = set()   # Expandable column offsets of the previous row
+        for i in range(max_i):
+            row = source_row + i * dr
+            if not 0 <= row < self.rows:
+                break
+
+            current = set()
+            from_left = False
+            last = max(previous) if previous else 0
+            for j in range(max_j):
+                if j > last and not from_left:
+                    break
+                col = source_col + j * dc
+                if not 0 <= col < self.cols or self.grid[row][col] == 1:
+                    from_left = False
+                    continue
+
+                if (i == 0 and j == 0) or from_left or j in previous:
+                    reached.add((row, col))
+                    from_left = (row, col) not in stop or (i == 0 and j == 0)
+                    if from_left:
+                        current.add(j)
+                else:
+                    from_left = False
+
+            if not current:
+                break
+            previous = current
+
+        return reached
+
+    def direct_h_reachable(self, source, extra=()):
+        """
+        Subgoals (and extra cells) directly h-reachable from source
+
+        Args:
+            source: (row, col) tuple
+            extra: Further cells to report when reached (e.g. the goal)
+
+        Returns:
+            Set of cells
+        """
+        targets = self.subgoals | set(extra)
+        found = set()
+        for quadrant in QUADRANTS:
+            found |= self.monotone_region(source, quadrant, stop=targets) & targets
+        found.discard(source)
+        return found
+
+    def monotone_path(self, a, b):
+        """
+        A Manhattan-length path between two h-reachable cells
+
+        Args:
+            a: (row, col) tuple
+            b: (row, col) tuple h-reachable from a
+
+        Returns:
+            List of positions from a to b
+        """
+        dr = 1 if b[0] >= a[0] else -1
+        dc = 1 if b[1] >= a[1] else -1
+        region = self.monotone_region(a, (dr, dc), bound=b)
+
+        path = [b]
+        row, col = b
+        while (row, col) != a:
+            if row != a[0] and (row - dr, col) in region:
+                row -= dr
+            else:
+                col -= dc
+            path.append((row, col))
+        path.reverse()
+        return path
+
+
+class SubgoalGraphVisualizer:
+    """
+    Subgoal graph search with visualization capabilities
+    Start and end are linked to their directly h-reachable subgoals, then
+    A* runs on the subgoal graph. Paths are optimal.
+    """
+
+    def __init__(self, grid, start, end, subgoal_graph=None):
+        """
+        Initialize search
+
+        Args:
+            grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+            start: (row, col) tuple for start position
+            end: (row, col) tuple for end position
+            subgoal_graph: Prebuilt SubgoalGraph (built and cached on a Grid
+                           when omitted)
+        """
+        self.grid = grid
+        self.start = start
+        self.end = end
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+
+        # Statistics
+        self.nodes_explored = 0
+        self.start_time = time.time()
+        self.end_time = None
+
+        self.subgoal_graph = subgoal_graph or SubgoalGraph.for_grid(grid)
+
+        # Link the endpoints into the graph for this query only
+        self.start_edges = []
+        self.end_edges = {}
+        if self.subgoal_graph.is_free(*start) and self.subgoal_graph.is_free(*end):
+            h = SubgoalGraph.h
+            self.start_edges = [(cell, h(start, cell))
+                                for cell in self.subgoal_graph.direct_h_reachable(start, extra=[end])]
+            for cell in self.subgoal_graph.direct_h_reachable(end):
+                self.end_edges[cell] = h(cell, end)
+
+        # Algorithm state
+        self.visited = set()
+        self.parent = {}
+        self.g_score = {start: 0}
+        self.open_set = [(SubgoalGraph.h(start, end), 0, start)]
+        self.current = None
+        self.found_path = False
+
+    def get_neighbors(self, pos):
+        """
+        Get subgoal-graph neighbors with edge costs
+
+        Args:
+            pos: Graph node (start, end or a subgoal)
+
+        Returns:
+            List of (node, cost) tuples
+        """
+        if pos == self.start:
+            neighbors = list(self.start_edges)
+        else:
+            neighbors = list(self.subgoal_graph.edges.get(pos, []))
+        if pos in self.end_edges:
+            neighbors.append((self.end, self.end_edges[pos]))
+        return neighbors
+
+    def step(self):
+        """
+        Expand one node of the subgoal graph
+
+        Returns:
+            True if algorithm should continue, False if complete
+        """
+        if not self.open_set:
+            self.end_time = time.time()
+            return False
+
+        _, g, current = heapq.heappop(self.open_set)
+        if current in self.visited:
+            return True
+
+        self.visited.add(current)
+        self.current = current
+        self.nodes_explored += 1
+
+        if current == self.end:
+            self.found_path = True
+            self.end_time = time.time()
+            return False
+
+        for neighbor, cost in self.get_neighbors(current):
+            if neighbor in self.visited:
+                continue
+            tentative_g = g + cost
+            if tentative_g < self.g_score.get(neighbor, tentative_g + 1):
+                self.g_score[neighbor] = tentative_g
+                self.parent[neighbor] = current
+                f = tentative_g + SubgoalGraph.h(neighbor, self.end)
+                heapq.heappush(self.open_set, (f, tentative_g, neighbor))
+
+        return True
+
+    def get_visited(self):
+        """Get set of expanded graph nodes"""
+        return self.visited.copy()
+
+    def get_path(self):
+        """
+        Reconstruct the cell-by-cell path from start to end
+
+        Returns:
+            List of positions forming the path, or empty list if no path
+        """
+        if not self.found_path:
+            return []
+
+        nodes = [self.end]
+        while nodes[-1] in self.parent:
+            nodes.append(self.parent[nodes[-1]])
+        nodes.reverse()
+
+        path = [nodes[0]]
+        for a, b in zip(nodes, nodes[1:]):
+            path.extend(self.subgoal_graph.monotone_path(a, b)[1:])
+        return path
+
+    def get_stats(self):
+        """
+        Get algorithm performance statistics
+
+        Returns:
+            Dictionary with performance metrics
+        """
+        path = self.get_path()
+        time_ms = (self.end_time - self.start_time) * 1000 if self.end_time else 0
+
+        return {
+            'nodes_explored': self.nodes_explored,
+            'path_length': len(path) if path else 0,
+            'time_ms': time_ms,
+            'found_path': self.found_path
+        }
@@ -0,0 +1,59 @@
+"""
+Aligned Array Files
+Layout shared by the binary table formats: a header followed by flat
+little-endian arrays, each starting on an 8-byte boundary so it can be
+memory-mapped in place
+"""
+
+import numpy as np
+
+
+def layout(start, fields):
+    """
+    Byte offset, dtype and length of each array
+
+    Args:
+        start: Bytes before the first array (header and any name)
+        fields: List of (name, dtype, count) in file order
+
+    Returns:
+        Dict of name -> (offset, little-endian dtype, count)
+    """
+    offsets = {}
+    offset = start
+    for name, dtype, count in fields:
+        dtype = np.dtype(dtype).newbyteorder('<')
+        offset = -(-offset // 8) * 8
+        offsets[name] = (offset, dtype, count)
+        offset += dtype.itemsize * count
+    return offsets
+
+
+def write_arrays(f, offsets, arrays):
+    """
+    Write arrays at their offsets (the file must be positioned before them)
+
+    Args:
+        f: File opened for binary writing
+        offsets: Dict returned by layout()
+        arrays: Dict of name -> array
+    """
+    for name, (offset, dtype, _) in offsets.items():
+        f.write(b'\0' * (offset - f.tell()))
+        f.write(np.ascontiguousarray(arrays[name], dtype=dtype).tobytes())
+
+
+def map_arrays(path, offsets):
+    """
+    Memory-map every array of a file read-only
+
+    Args:
+        path: File path
+        offsets: Dict returned by layout()
+
+    Returns:
+        Dict of name -> array (empty arrays are not mapped)
+    """
+    return {name: np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(count,))
+            if count else np.zeros(0, dtype=dtype)
+            for name, (offset, dtype, count) in offsets.items()}
@@ -5,24 +5,110 @@ Runs large-scale algorithm comparisons
 
 import os
 import csv
+import queue
 import time
 from datetime import datetime
+from multiprocessing import get_context
+
 from algorithms.dijkstra import DijkstraVisualizer
 from algorithms.astar import AStarVisualizer
 from algorithms.greedy import GreedyVisualizer
+from utils.corpus import iter_corpus, read_index
+from utils.grid import Grid
 from utils.map_generator import MapGenerator
+from utils.trace import write_trace
+
+RESULT_FIELDS = [
+    'trial', 'map_size', 'obstacle_density', 'map_type',
+    'algorithm', 'nodes_explored', 'path_length', 'time_ms',
+    'found_path', 'seed'
+]
+
+
+def _generate_stage(jobs, maps, results):
+    """
+    Pipeline stage: generate maps and pick start/end until a None job
+
+    Every job yields one item on the maps queue; maps without a connected
+    start/end pair are passed on with start and end set to None.
+    """
+    items, busy = 0, 0.0
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        started = time.perf_counter()
+        trial, map_size, density, map_type, seed = job
+        grid = MapGenerator.generate(map_type, map_size, density, seed, as_array=True)
+        start, end = MapGenerator.select_start_end(grid, seed=seed)
+        busy += time.perf_counter() - started
+        maps.put((job, grid, start, end))
+        items += 1
+    results.put(('stats', 'generate', items, busy))
+
+
+def _search_stage(algorithms, maps, results):
+    """
+    Pipeline stage: run every algorithm on each map until a None map
+
+    Puts one list of result rows per map (empty for unsolvable maps) on
+    the results queue.
+    """
+    items, busy = 0, 0.0
+    while True:
+        item = maps.get()
+        if item is None:
+            break
+        started = time.perf_counter()
+        (trial, map_size, density, map_type, seed), grid, start, end = item
+        rows = []
+        if start is not None:
+            grid = grid.tolist()
+            grid[start[0]][start[1]] = 2
+            grid[end[0]][end[1]] = 3
+            for algo_name, algo_class in algorithms.items():
+                visualizer = algo_class(grid, start, end)
+                while visualizer.step():
+                    pass
+                stats = visualizer.get_stats()
+                rows.append({
+                    'trial': trial,
+                    'map_size': map_size,
+                    'obstacle_density': density,
+                    'map_type': map_type,
+                    'algorithm': algo_name,
+                    'nodes_explored': stats['nodes_explored'],
+                    'path_length': stats['path_length'],
+                    'time_ms': stats['time_ms'],
+                    'found_path': stats['found_path'],
+                    'seed': seed
+                })
+        busy += time.perf_counter() - started
+        results.put(('rows', rows))
+        items += 1
+    results.put(('stats', 'search', items, busy))
+
 
 class BatchTester:
     """Runs batch tests and collects performance data"""
 
-    def __init__(self, output_dir="data/results"):
+    def __init__(self, output_dir="data/results", cache=None, trace_dir=None):
         """
         Initialize batch tester
 
         Args:
             output_dir: Directory to save results
+            cache: Optional QueryCache; repeated queries on an unchanged map
+                   then reuse the stored path and stats (including time_ms)
+            trace_dir: Optional directory; every run is then recorded as an
+                       execution trace (see utils.trace), bypassing the cache.
+                       The reported stats come from a separate untraced run.
         """
         self.output_dir = output_dir
+        self.cache = cache
+        self.trace_dir = trace_dir
+        self.trace_count = 0
+        self.pipeline_stats = None
         self.algorithms = {
             'Dijkstra': DijkstraVisualizer,
             'A*': AStarVisualizer,
@@ -31,8 +117,10 @@ class BatchTester:
 
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
+        if trace_dir:
+            os.makedirs(trace_dir, exist_ok=True)
 
-    def run_single_test(self, algorithm_name, grid, start, end):
+    def run_single_test(self, algorithm_name, grid, start, end, seed=None):
         """
         Run a single test
 
@@ -41,18 +129,31 @@ class BatchTester:
             grid: Map grid
             start: Start position
             end: End position
+            seed: Map seed (recorded in traces)
 
         Returns:
             Dictionary with test results
         """
         algo_class = self.algorithms[algorithm_name]
-        visualizer = algo_class(grid, start, end)
 
-        # Run algorithm to completion
-        while visualizer.step():
-            pass
+        if self.trace_dir:
+            self.trace_count += 1
+            name = f"{self.trace_count:06d}_{algorithm_name.replace('*', 'star')}_{seed}.trace"
+            write_trace(os.path.join(self.trace_dir, name),
+                        algo_class(grid, start, end), algorithm_name, seed)
+
+        if self.cache is not None and not self.trace_dir:
+            _, stats = self.cache.run(algorithm_name, algo_class, grid, start, end)
+        else:
+            # Traced runs are timed again untraced, so time_ms never
+            # includes the recording overhead
+            visualizer = algo_class(grid, start, end)
 
-        stats = visualizer.get_stats()
+            # Run algorithm to completion
+            while visualizer.step():
+                pass
+
+            stats = visualizer.get_stats()
 
         return {
             'algorithm': algorithm_name,
@@ -85,11 +186,7 @@ class BatchTester:
 
         # Create CSV file
         with open(results_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=[
-                'trial', 'map_size', 'obstacle_density', 'map_type',
-                'algorithm', 'nodes_explored', 'path_length', 'time_ms',
-                'found_path', 'seed'
-            ])
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
             writer.writeheader()
 
             total_tests = (len(map_sizes) * len(obstacle_densities) *
@@ -105,17 +202,10 @@ class BatchTester:
                             seed = trial + int(time.time() * 1000) % 100000
 
                             # Generate map
-                            if map_type == 'random':
-                                grid = MapGenerator.generate_random_map(map_size, density, seed)
-                            elif map_type == 'clustered':
-                                grid = MapGenerator.generate_clustered_map(map_size, density, seed)
-                            elif map_type == 'maze':
-                                grid = MapGenerator.generate_maze_map(map_size, density, seed)
-                            elif map_type == 'mixed':
-                                grid = MapGenerator.generate_mixed_map(map_size, density, seed)
-
-                            # Get start and end positions
-                            start, end = MapGenerator.get_valid_start_end(grid, map_size)
+                            grid = MapGenerator.generate(map_type, map_size, density, seed)
+
+                            # Get connected start and end positions
+                            start, end = MapGenerator.select_start_end(grid, seed=seed)
 
                             if start is None or end is None:
                                 continue
@@ -124,9 +214,13 @@ class BatchTester:
                             grid[start[0]][start[1]] = 2
                             grid[end[0]][end[1]] = 3
 
+                            # Hash the map once for all the cached queries on it
+                            if self.cache is not None:
+                                grid = Grid(grid)
+
                             # Test each algorithm
                             for algo_name in self.algorithms.keys():
-                                result = self.run_single_test(algo_name, grid, start, end)
+                                result = self.run_single_test(algo_name, grid, start, end, seed)
 
                                 # Write result
                                 writer.writerow({
@@ -150,6 +244,196 @@ class BatchTester:
 
         return results_file
 
+    def run_pipelined_suite(self, map_sizes=[50, 100, 200],
+                            obstacle_densities=[0.1, 0.25, 0.4, 0.55, 0.7],
+                            map_types=['random', 'clustered', 'maze', 'mixed'],
+                            trials_per_config=100, seed=0,
+                            generate_workers=1, search_workers=None, queue_size=8,
+                            progress_callback=None):
+        """
+        Run the test suite as a producer/consumer pipeline
+
+        Generator processes fill a bounded queue of maps ahead of the search
+        processes, whose result rows go through a second bounded queue to
+        the writer stage (this process), so map generation and CSV writes
+        overlap with searching. Map seeds are spawned from seed, so the
+        same rows come out for any number of workers, though they are
+        written in completion order. The cache and traces are not used.
+
+        Stage statistics are stored in ``pipeline_stats``: per stage the
+        maps processed, busy seconds and maps per busy second (the stage's
+        capacity; the lowest one is the bottleneck), plus the mean and
+        maximum depth of both queues as sampled by the writer.
+
+        Args:
+            map_sizes: List of grid sizes to test
+            obstacle_densities: List of obstacle densities
+            map_types: List of map types
+            trials_per_config: Number of trials per configuration
+            seed: Root seed of the map seeds
+            generate_workers: Map generation processes
+            search_workers: Search processes (defaults to the remaining CPUs)
+            queue_size: Capacity of the map and result queues
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            Path to results file
+        """
+        jobs = [(trial, map_size, density, map_type)
+                for map_size in map_sizes
+                for density in obstacle_densities
+                for map_type in map_types
+                for trial in range(trials_per_config)]
+        jobs = [job + (map_seed,) for job, map_seed in zip(jobs, MapGenerator.spawn_seeds(seed, len(jobs)))]
+        generate_workers = max(1, generate_workers)
+        search_workers = max(1, search_workers or (os.cpu_count() or 1) - generate_workers)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results_file = os.path.join(self.output_dir, f"pipeline_results_{timestamp}.csv")
+
+        context = get_context()
+        job_queue = context.Queue()
+        map_queue = context.Queue(queue_size)
+        result_queue = context.Queue(queue_size)
+        for job in jobs + [None] * generate_workers:
+            job_queue.put(job)
+
+        workers = ([context.Process(target=_generate_stage, args=(job_queue, map_queue, result_queue),
+                                    daemon=True) for _ in range(generate_workers)] +
+                   [context.Process(target=_search_stage, args=(self.algorithms, map_queue, result_queue),
+                                    daemon=True) for _ in range(search_workers)])
+
+        stages = {name: {'items': 0, 'busy_s': 0.0} for name in ('generate', 'search', 'write')}
+        depths = {'maps': [], 'results': []}
+        total_tests = len(jobs) * len(self.algorithms)
+        completed_tests = 0
+        maps_done = 0
+        reports = 0
+        started = time.perf_counter()
+
+        try:
+            for worker in workers:
+                worker.start()
+            if not jobs:
+                # No map will ever arrive to trigger the sentinels below
+                for _ in range(search_workers):
+                    map_queue.put(None)
+
+            with open(results_file, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+                writer.writeheader()
+
+                while reports < len(workers):
+                    try:
+                        message = result_queue.get(timeout=1)
+                    except queue.Empty:
+                        if any(worker.exitcode not in (None, 0) for worker in workers):
+                            raise RuntimeError("Pipeline worker process failed")
+                        continue
+
+                    if message[0] == 'stats':
+                        _, stage, items, busy = message
+                        stages[stage]['items'] += items
+                        stages[stage]['busy_s'] += busy
+                        reports += 1
+                        continue
+
+                    for name, pending in (('maps', map_queue), ('results', result_queue)):
+                        try:
+                            depths[name].append(pending.qsize())
+                        except NotImplementedError:   # macOS
+                            pass
+
+                    write_started = time.perf_counter()
+                    writer.writerows(message[1])
+                    stages['write']['items'] += 1
+                    stages['write']['busy_s'] += time.perf_counter() - write_started
+
+                    # Unsolvable maps count as skipped tests
+                    completed_tests += len(self.algorithms)
+                    if progress_callback:
+                        progress_callback(completed_tests, total_tests)
+
+                    maps_done += 1
+                    if maps_done == len(jobs):
+                        # Every map is through, so the map queue is empty
+                        for _ in range(search_workers):
+                            map_queue.put(None)
+
+            for worker in workers:
+                worker.join()
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+
+        elapsed = time.perf_counter() - started
+        for stats in stages.values():
+            stats['per_s'] = stats['items'] / stats['busy_s'] if stats['busy_s'] else 0.0
+        stages['queue_depth'] = {
+            name: {'mean': sum(samples) / len(samples) if samples else 0.0,
+                   'max': max(samples, default=0)}
+            for name, samples in depths.items()
+        }
+        stages['elapsed_s'] = elapsed
+        self.pipeline_stats = stages
+
+        return results_file
+
+    def run_corpus(self, corpus_dir, progress_callback=None):
+        """
+        Run every algorithm on the solvable maps of a prebuilt corpus
+
+        Maps are streamed from disk one at a time (see utils.corpus), so
+        no generation happens during the run and repeated runs see
+        identical inputs.
+
+        Args:
+            corpus_dir: Directory written by utils.corpus.build_corpus
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            Path to results file
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results_file = os.path.join(self.output_dir, f"corpus_results_{timestamp}.csv")
+
+        with open(results_file, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+            writer.writeheader()
+
+            total_tests = (sum(entry['solvable'] for entry in read_index(corpus_dir)) *
+                           len(self.algorithms))
+            completed_tests = 0
+
+            for entry, grid in iter_corpus(corpus_dir):
+                start, end = entry['start'], entry['end']
+                grid[start[0]][start[1]] = 2
+                grid[end[0]][end[1]] = 3
+                if self.cache is not None:
+                    grid = Grid(grid)
+
+                for algo_name in self.algorithms.keys():
+                    result = self.run_single_test(algo_name, grid, start, end, entry['seed'])
+                    writer.writerow({
+                        'trial': entry['trial'],
+                        'map_size': entry['map_size'],
+                        'obstacle_density': entry['obstacle_density'],
+                        'map_type': entry['map_type'],
+                        'algorithm': algo_name,
+                        'nodes_explored': result['nodes_explored'],
+                        'path_length': result['path_length'],
+                        'time_ms': result['time_ms'],
+                        'found_path': result['found_path'],
+                        'seed': entry['seed']
+                    })
+
+                    completed_tests += 1
+                    if progress_callback:
+                        progress_callback(completed_tests, total_tests)
+
+        return results_file
+
     def run_quick_test(self, num_trials=10, progress_callback=None):
         """
         Run a quick test for demonstration
@@ -0,0 +1,185 @@
+"""
+Dynamic Connectivity
+Keeps free-space components of a grid current while obstacles are added
+and removed, so impossible queries can be rejected without a search
+"""
+
+from collections import deque
+
+import numpy as np
+from scipy import ndimage
+
+
+class DynamicConnectivity:
+    """
+    Component labels for the free cells of a grid under cell edits
+
+    Freeing a cell unions its neighbors' components (union-find, near
+    constant time). Blocking a cell may split its component: a BFS is
+    started from each free neighbor in lock-step, searches that meet are
+    merged, and it stops as soon as only one search is still running. Every
+    search that ran out of cells is a separated piece and gets a new label,
+    so the work is proportional to the smaller pieces, not the whole map.
+    """
+
+    def __init__(self, grid, attach=True):
+        """
+        Label the grid's components
+
+        Args:
+            grid: 2D list or utils.grid.Grid (0=empty, 1=obstacle, 2=start, 3=end)
+            attach: Follow the edits of a Grid automatically
+        """
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+
+        free = np.asarray(grid).reshape(self.rows, self.cols) != 1
+        labels, count = ndimage.label(free)
+        self.free = free.ravel().tolist()
+        self.label = (labels.ravel() - 1).tolist()  # -1 for obstacles
+        self.parent = list(range(count))            # Union-find over labels
+
+        if attach and hasattr(grid, 'add_listener'):
+            grid.add_listener(self._on_change)
+
+    def _on_change(self, row, col, was_blocked, is_blocked):
+        """Grid listener: apply an obstacle edit"""
+        if is_blocked:
+            self.block((row, col))
+        else:
+            self.unblock((row, col))
+
+    def _find(self, label):
+        """Union-find root of a label (with path halving)"""
+        parent = self.parent
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    def _adjacent(self, index):
+        """Free 4-directional neighbors of a flat cell index"""
+        row, col = divmod(index, self.cols)
+        neighbors = []
+        if row > 0 and self.free[index - self.cols]:
+            neighbors.append(index - self.cols)
+        if row < self.rows - 1 and self.free[index + self.cols]:
+            neighbors.append(index + self.cols)
+        if col > 0 and self.free[index - 1]:
+            neighbors.append(index - 1)
+        if col < self.cols - 1 and self.free[index + 1]:
+            neighbors.append(index + 1)
+        return neighbors
+
+    def component(self, pos):
+        """
+        Component id of a cell
+
+        Args:
+            pos: (row, col) tuple
+
+        Returns:
+            Component id, or None for obstacles and out-of-grid cells
+        """
+        row, col = pos
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return None
+        index = row * self.cols + col
+        if not self.free[index]:
+            return None
+        return self._find(self.label[index])
+
+    def connected(self, a, b):
+        """
+        Check whether a path exists between two cells
+
+        Args:
+            a: (row, col) tuple
+            b: (row, col) tuple
+
+        Returns:
+            True if both cells are free and in the same component
+        """
+        component = self.component(a)
+        return component is not None and component == self.component(b)
+
+    def unblock(self, pos):
+        """
+        Record that a cell became free
+
+        Args:
+            pos: (row, col) tuple
+        """
+        index = pos[0] * self.cols + pos[1]
+        if self.free[index]:
+            return
+
+        self.free[index] = True
+        new_label = len(self.parent)
+        self.parent.append(new_label)
+        self.label[index] = new_label
+
+        for neighbor in self._adjacent(index):
+            root = self._find(self.label[neighbor])
+            if root != new_label:
+                self.parent[root] = new_label
+
+    def block(self, pos):
+        """
+        Record that a cell became an obstacle
+
+        Args:
+            pos: (row, col) tuple
+        """
+        index = pos[0] * self.cols + pos[1]
+        if not self.free[index]:
+            return
+
+        self.free[index] = False
+        self.label[index] = -1
+        sources = self._adjacent(index)
+        if len(sources) <= 1:
+            return
+
+        # Lock-step BFS from each former neighbor
+        owner = {source: i for i, source in enumerate(sources)}
+        group = list(range(len(sources)))     # Search id -> merged search id
+        frontier = {i: deque([source]) for i, source in enumerate(sources)}
+        cells = {i: [source] for i, source in enumerate(sources)}
+
+        def root(i):
+            while group[i] != i:
+                i = group[i]
+            return i
+
+        while len(frontier) > 1:
+            for i in list(frontier):
+                if i not in frontier:
+                    continue
+                queue = frontier[i]
+                if not queue:
+                    # Exhausted: a separated piece
+                    del frontier[i]
+                    new_label = len(self.parent)
+                    self.parent.append(new_label)
+                    for cell in cells.pop(i):
+                        self.label[cell] = new_label
+                    continue
+
+                current = queue.popleft()
+                for neighbor in self._adjacent(current):
+                    other = owner.get(neighbor)
+                    if other is None:
+                        owner[neighbor] = i
+                        cells[i].append(neighbor)
+                        queue.append(neighbor)
+                        continue
+                    other = root(other)
+                    if other != i:
+                        # Searches met: same piece, continue as one search
+                        group[other] = i
+                        queue.extend(frontier.pop(other))
+                        cells[i].extend(cells.pop(other))
+
+                if len(frontier) == 1:
+                    break
@@ -0,0 +1,128 @@
+"""
+Map Corpus
+Generates the benchmark maps once into a directory of binary map files
+with an index, so repeated batch runs stream identical inputs from disk
+"""
+
+import csv
+import os
+
+from utils.map_file import EXTENSION
+from utils.map_generator import MapGenerator
+
+INDEX_FILE = 'index.csv'
+INDEX_FIELDS = ['file', 'trial', 'map_size', 'obstacle_density', 'map_type', 'seed',
+                'start_row', 'start_col', 'end_row', 'end_col', 'solvable']
+
+
+def build_corpus(directory, map_sizes=[50, 100, 200],
+                 obstacle_densities=[0.1, 0.25, 0.4, 0.55, 0.7],
+                 map_types=['random', 'clustered', 'maze', 'mixed'],
+                 trials_per_config=100, seed=0, policy='corners',
+                 progress_callback=None):
+    """
+    Generate every size x density x type x trial map and index it
+
+    Map i is generated from the i-th seed spawned from seed, so a corpus
+    depends only on its parameters. Start and end come from
+    MapGenerator.select_start_end; maps without a connected pair are kept
+    but marked unsolvable.
+
+    Args:
+        directory: Output directory (created if missing)
+        map_sizes: List of grid sizes
+        obstacle_densities: List of obstacle densities
+        map_types: List of map types
+        trials_per_config: Maps per configuration
+        seed: Root seed of the corpus
+        policy: Start/end policy passed to select_start_end
+        progress_callback: Optional callback(done, total)
+
+    Returns:
+        Path to the index file
+    """
+    os.makedirs(directory, exist_ok=True)
+    configs = [(size, density, map_type, trial)
+               for size in map_sizes
+               for density in obstacle_densities
+               for map_type in map_types
+               for trial in range(trials_per_config)]
+    seeds = MapGenerator.spawn_seeds(seed, len(configs))
+
+    index_path = os.path.join(directory, INDEX_FILE)
+    with open(index_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=INDEX_FIELDS)
+        writer.writeheader()
+
+        for number, ((size, density, map_type, trial), map_seed) in enumerate(zip(configs, seeds)):
+            grid = MapGenerator.generate(map_type, size, density, map_seed, as_array=True)
+            start, end = MapGenerator.select_start_end(grid, policy, seed=map_seed)
+
+            name = f"{number:06d}{EXTENSION}"
+            MapGenerator.save_map(grid, os.path.join(directory, name),
+                                  seed=map_seed, map_type=map_type, density=density)
+            writer.writerow({
+                'file': name,
+                'trial': trial,
+                'map_size': size,
+                'obstacle_density': density,
+                'map_type': map_type,
+                'seed': map_seed,
+                'start_row': start[0] if start else '',
+                'start_col': start[1] if start else '',
+                'end_row': end[0] if end else '',
+                'end_col': end[1] if end else '',
+                'solvable': int(start is not None)
+            })
+
+            if progress_callback:
+                progress_callback(number + 1, len(configs))
+
+    return index_path
+
+
+def read_index(directory):
+    """
+    Read a corpus index
+
+    Args:
+        directory: Corpus directory
+
+    Returns:
+        List of dicts with typed index fields (start/end as (row, col)
+        tuples, None for unsolvable maps)
+    """
+    entries = []
+    with open(os.path.join(directory, INDEX_FILE), newline='') as f:
+        for row in csv.DictReader(f):
+            solvable = row['solvable'] == '1'
+            entries.append({
+                'file': row['file'],
+                'trial': int(row['trial']),
+                'map_size': int(row['map_size']),
+                'obstacle_density': float(row['obstacle_density']),
+                'map_type': row['map_type'],
+                'seed': int(row['seed']),
+                'start': (int(row['start_row']), int(row['start_col'])) if solvable else None,
+                'end': (int(row['end_row']), int(row['end_col'])) if solvable else None,
+                'solvable': solvable
+            })
+    return entries
+
+
+def iter_corpus(directory, solvable_only=True):
+    """
+    Stream the maps of a corpus one at a time
+
+    Args:
+        directory: Corpus directory
+        solvable_only: Skip maps without a connected start/end pair
+
+    Yields:
+        (entry, grid) tuples, entry as returned by read_index and grid a
+        2D list
+    """
+    for entry in read_index(directory):
+        if solvable_only and not entry['solvable']:
+            continue
+        yield entry, MapGenerator.load_map(os.path.join(directory, entry['file']))
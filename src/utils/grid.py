@@ -0,0 +1,161 @@
+"""
+Grid
+Drop-in replacement for the list-of-lists grid that notices cell edits,
+so per-map preprocessing can be cached on the grid itself
+"""
+
+import numpy as np
+
+# Seed of the Zobrist keys; fixed so equal maps hash equally across runs
+ZOBRIST_SEED = 0x5EED
+
+_ZOBRIST_KEYS = {}
+
+
+def zobrist_keys(rows, cols):
+    """
+    Random 64-bit key per cell, shared by every grid of the same shape
+
+    Args:
+        rows: Number of rows
+        cols: Number of columns
+
+    Returns:
+        Flat list of int keys (row-major)
+    """
+    if (rows, cols) not in _ZOBRIST_KEYS:
+        rng = np.random.default_rng([ZOBRIST_SEED, rows, cols])
+        keys = rng.integers(0, 2**64, size=rows * cols, dtype=np.uint64)
+        _ZOBRIST_KEYS[rows, cols] = keys
+    return _ZOBRIST_KEYS[rows, cols]
+
+
+def grid_hash(grid):
+    """
+    Zobrist hash of a grid's obstacle layout
+
+    Free for a Grid, which keeps its hash current; a plain 2D list is
+    hashed from scratch.
+
+    Args:
+        grid: 2D list or Grid
+
+    Returns:
+        64-bit int
+    """
+    if isinstance(grid, Grid):
+        return grid.hash
+    return _full_hash(grid)
+
+
+def _full_hash(grid):
+    """XOR of the keys of all obstacle cells"""
+    rows = len(grid)
+    cols = len(grid[0]) if grid else 0
+    blocked = (np.asarray(grid) == 1).ravel()
+    return int(np.bitwise_xor.reduce(zobrist_keys(rows, cols)[blocked]))
+
+
+class GridRow(list):
+    """One row of a Grid; reports every write back to the grid"""
+
+    def __init__(self, grid, index, values):
+        super().__init__(values)
+        self.grid = grid
+        self.index = index
+
+    def __setitem__(self, col, value):
+        if isinstance(col, slice):
+            old = list.__getitem__(self, col)
+            list.__setitem__(self, col, value)
+            for c, before in zip(range(*col.indices(len(self))), old):
+                self.grid.cell_changed(self.index, c, before, list.__getitem__(self, c))
+            return
+
+        old = list.__getitem__(self, col)
+        list.__setitem__(self, col, value)
+        self.grid.cell_changed(self.index, col % len(self), old, value)
+
+
+class Grid(list):
+    """
+    2D grid (0=empty, 1=obstacle, 2=start, 3=end) that tracks edits
+
+    Indexing works exactly like the plain list-of-lists grid, so every
+    visualizer accepts it. ``version`` increases whenever a cell switches
+    between obstacle and free; that also clears ``cache`` and XORs the
+    cell's Zobrist key into ``hash``, so equal obstacle layouts always have
+    equal hashes without rehashing the map. Moving the start/end markers
+    does not count as an obstacle change.
+    """
+
+    def __init__(self, rows=()):
+        """
+        Initialize grid
+
+        Args:
+            rows: Iterable of rows (e.g. an existing 2D list)
+        """
+        super().__init__(GridRow(self, i, row) for i, row in enumerate(rows))
+        self.version = 0
+        self.cache = {}
+        self.listeners = []
+
+        cols = len(self[0]) if self else 0
+        self.keys = zobrist_keys(len(self), cols).tolist()
+        self.hash = _full_hash(self)
+
+    def __setitem__(self, index, row):
+        if isinstance(index, slice):
+            raise TypeError("Grid rows cannot be replaced by slice")
+        index %= len(self)
+        old = list.__getitem__(self, index)
+        list.__setitem__(self, index, GridRow(self, index, row))
+        for col, (before, after) in enumerate(zip(old, row)):
+            self.cell_changed(index, col, before, after)
+
+    def cell_changed(self, row, col, old, new):
+        """
+        Record a cell edit (called by the rows)
+
+        Args:
+            row: Row index
+            col: Column index
+            old: Previous cell value
+            new: New cell value
+        """
+        if (old == 1) == (new == 1):
+            return
+        self.version += 1
+        self.hash ^= self.keys[row * len(self[0]) + col]
+        self.cache.clear()
+        for listener in self.listeners:
+            listener(row, col, old == 1, new == 1)
+
+    def add_listener(self, callback):
+        """
+        Call callback(row, col, was_blocked, is_blocked) on obstacle changes
+
+        Args:
+            callback: Function to call
+        """
+        self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Stop calling a listener registered with add_listener()"""
+        self.listeners.remove(callback)
+
+    def cached(self, key, builder):
+        """
+        Get a cached per-map result, building it if missing or stale
+
+        Args:
+            key: Cache key
+            builder: Zero-argument function computing the result
+
+        Returns:
+            Cached or freshly built result
+        """
+        if key not in self.cache:
+            self.cache[key] = builder()
+        return self.cache[key]
@@ -0,0 +1,137 @@
+"""
+Binary Map Files
+Stores a grid as one bit per cell (or one byte per cell for grids with
+markers or terrain weights) behind a small header, memory-mapped on load
+"""
+
+import math
+import struct
+
+import numpy as np
+
+from utils.grid import zobrist_keys
+
+# File header: magic, format version, bits per cell, padding, rows, cols,
+# seed (see pack_seed), Zobrist hash of the obstacles, density (NaN if
+# unknown), map type length
+HEADER = struct.Struct('<4sHBBII16sQdH')
+MAGIC = b'GMAP'
+VERSION = 2
+
+# Seeds are stored as 16 little-endian bytes, wide enough for the 128-bit
+# seeds of MapGenerator.spawn_seeds; all ones marks an unknown seed
+SEED_BYTES = 16
+_NO_SEED = b'\xff' * SEED_BYTES
+
+# Extension that MapGenerator.save_map/load_map treat as binary
+EXTENSION = '.gmap'
+
+
+def _data_offset(type_length):
+    """Byte offset of the cell data (8-byte aligned)"""
+    return -(-(HEADER.size + type_length) // 8) * 8
+
+
+def pack_seed(seed):
+    """Header bytes of a seed (None if unknown)"""
+    return _NO_SEED if seed is None else int(seed).to_bytes(SEED_BYTES, 'little')
+
+
+def unpack_seed(raw):
+    """Seed from header bytes written by pack_seed() (None if unknown)"""
+    return None if raw == _NO_SEED else int.from_bytes(raw, 'little')
+
+
+def _obstacle_hash(cells):
+    """Zobrist hash of a (rows, cols) array, equal to utils.grid.grid_hash"""
+    keys = zobrist_keys(*cells.shape)
+    return int(np.bitwise_xor.reduce(keys[(cells == 1).ravel()]))
+
+
+def write_map(path, grid, seed=None, map_type='', density=None, bits=None):
+    """
+    Write a grid to a binary map file
+
+    With one bit per cell, each row is packed separately (MSB first), so a
+    row can be unpacked on its own.
+
+    Args:
+        path: Output file path
+        grid: 2D list, array or Grid
+        seed: Generator seed stored in the header
+        map_type: Generator name stored in the header (e.g. 'maze')
+        density: Generator density stored in the header
+        bits: 1 or 8 bits per cell; by default 1 if the grid only holds
+              0 and 1, else 8
+    """
+    cells = np.asarray(grid, dtype=np.uint8)
+    rows, cols = cells.shape
+    if bits is None:
+        bits = 1 if cells.max(initial=0) <= 1 else 8
+    if bits == 1:
+        data = np.packbits(cells == 1, axis=1)
+    elif bits == 8:
+        data = cells
+    else:
+        raise ValueError("bits must be 1 or 8")
+
+    name = map_type.encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, bits, 0, rows, cols, pack_seed(seed),
+                            _obstacle_hash(cells), math.nan if density is None else density, len(name)))
+        f.write(name)
+        f.write(b'\0' * (_data_offset(len(name)) - f.tell()))
+        f.write(np.ascontiguousarray(data).tobytes())
+
+
+class MapFile:
+    """
+    Memory-mapped view of a map written by write_map()
+
+    ``data`` is a zero-copy (rows, cols) uint8 view for byte maps and a
+    (rows, ceil(cols / 8)) view of the packed rows for bit maps.
+    """
+
+    def __init__(self, path):
+        """
+        Open a map file and map its cells
+
+        Args:
+            path: Map file path
+        """
+        with open(path, 'rb') as f:
+            (magic, version, self.bits, _, self.rows, self.cols, seed, self.hash,
+             density, type_length) = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a binary map")
+            self.map_type = f.read(type_length).decode('utf-8')
+
+        self.seed = unpack_seed(seed)
+        self.density = None if math.isnan(density) else density
+
+        stride = self.cols if self.bits == 8 else -(-self.cols // 8)
+        if self.rows and stride:
+            self.data = np.memmap(path, dtype=np.uint8, mode='r', offset=_data_offset(type_length),
+                                  shape=(self.rows, stride))
+        else:
+            self.data = np.zeros((self.rows, stride), dtype=np.uint8)
+
+    def row(self, index):
+        """Cells of one row as a uint8 array"""
+        if self.bits == 8:
+            return self.data[index]
+        return np.unpackbits(self.data[index], count=self.cols)
+
+    def array(self):
+        """
+        All cells as a (rows, cols) uint8 array
+
+        Zero-copy for byte maps; bit maps are unpacked into memory.
+        """
+        if self.bits == 8:
+            return self.data
+        return np.unpackbits(self.data, axis=1, count=self.cols)
+
+    def verify(self):
+        """Check the obstacles against the hash stored in the header"""
+        return _obstacle_hash(self.array()) == self.hash
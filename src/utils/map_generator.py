@@ -3,177 +3,300 @@ Map Generator
 Creates different types of maps for testing
 """
 
-import random
 import json
+from collections import OrderedDict
+from itertools import combinations
+
+import numpy as np
+from scipy import ndimage
+
+from utils.map_file import EXTENSION, MapFile, write_map
 
 class MapGenerator:
-    """Generates various map configurations for testing"""
+    """
+    Generates various map configurations for testing
+
+    Generators never touch global random state: each call draws from its own
+    NumPy Generator built from seed, which may be an int, None, a
+    SeedSequence or a Generator (e.g. one returned by spawn_streams()).
+    """
+
+    @staticmethod
+    def spawn_streams(seed, n):
+        """
+        Create independent random streams for parallel map generation
+
+        Stream i depends only on seed and i, so giving map i stream i yields
+        the same maps however they are split across workers.
+
+        Args:
+            seed: Root seed (int, None or SeedSequence)
+            n: Number of streams
+
+        Returns:
+            List of n NumPy Generators
+        """
+        root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        return [np.random.default_rng(child) for child in root.spawn(n)]
 
     @staticmethod
-    def generate_random_map(size, density, seed=None):
+    def spawn_seeds(seed, n):
+        """
+        Like spawn_streams(), but as plain int seeds that can be stored
+
+        Each seed is the full 128-bit state drawn from a spawned child, so
+        distinct maps do not collide the way 32-bit seeds start to after
+        tens of thousands of maps.
+
+        Args:
+            seed: Root seed (int, None or SeedSequence)
+            n: Number of seeds
+
+        Returns:
+            List of n non-negative ints below 2**128
+        """
+        root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        return [int.from_bytes(child.generate_state(4).astype('<u4').tobytes(), 'little')
+                for child in root.spawn(n)]
+
+    @staticmethod
+    def generate_random_map(size, density, seed=None, as_array=False):
         """
         Generate random obstacle map
 
+        Each cell is an obstacle with probability density, drawn in one
+        vectorized call from a NumPy Generator seeded with seed.
+
         Args:
             size: Grid size (size x size)
             density: Obstacle density (0.0 to 1.0)
-            seed: Random seed for reproducibility
+            seed: Random seed for reproducibility (int, SeedSequence or Generator)
+            as_array: Return a uint8 NumPy array instead of a 2D list
 
         Returns:
-            2D list representing the map
+            2D list (or array) representing the map
         """
-        if seed is not None:
-            random.seed(seed)
-
-        grid = [[0 for _ in range(size)] for _ in range(size)]
-
-        # Place obstacles randomly
-        for i in range(size):
-            for j in range(size):
-                if random.random() < density:
-                    grid[i][j] = 1
+        rng = np.random.default_rng(seed)
+        grid = (rng.random((size, size)) < density).astype(np.uint8)
 
-        return grid
+        return grid if as_array else grid.tolist()
 
     @staticmethod
-    def generate_clustered_map(size, density, seed=None):
+    def _cluster_coverage(size, density, rng):
         """
-        Generate map with clustered obstacles
+        Number of clusters covering each cell
+
+        Draws size * size * density / 10 clusters with uniform centers and
+        half-widths 3..8 (squares of rows center - k .. center + k - 1) and
+        counts them per cell with a corner difference array and two
+        cumulative sums.
 
         Args:
             size: Grid size
             density: Obstacle density
-            seed: Random seed
+            rng: NumPy Generator
 
         Returns:
-            2D list with clustered obstacles
+            int32 array of shape (size, size)
         """
-        if seed is not None:
-            random.seed(seed)
+        num_clusters = int(size * size * density / 10)
+        centers = rng.integers(0, size, size=(num_clusters, 2))
+        half_widths = rng.integers(3, 9, size=num_clusters)
 
-        grid = [[0 for _ in range(size)] for _ in range(size)]
+        r0, r1 = (np.clip(centers[:, 0] + d, 0, size) for d in (-half_widths, half_widths))
+        c0, c1 = (np.clip(centers[:, 1] + d, 0, size) for d in (-half_widths, half_widths))
+        width = size + 1
+        cells = width * width
+        corners = (np.bincount(r0 * width + c0, minlength=cells) - np.bincount(r0 * width + c1, minlength=cells)
+                   - np.bincount(r1 * width + c0, minlength=cells) + np.bincount(r1 * width + c1, minlength=cells))
 
-        # Create clusters
-        num_clusters = int(size * size * density / 10)
+        coverage = corners.reshape(width, width).cumsum(axis=0).cumsum(axis=1)[:size, :size]
+        return coverage.astype(np.int32)
 
-        for _ in range(num_clusters):
-            # Random cluster center
-            center_row = random.randint(0, size - 1)
-            center_col = random.randint(0, size - 1)
+    @staticmethod
+    def generate_clustered_map(size, density, seed=None, as_array=False):
+        """
+        Generate map with clustered obstacles
 
-            # Random cluster size
-            cluster_size = random.randint(3, 8)
+        Each cluster fills every cell of its square with probability 0.7,
+        so a cell covered by c clusters stays free with probability 0.3**c;
+        that is drawn once per cell.
 
-            # Fill cluster
-            for i in range(center_row - cluster_size, center_row + cluster_size):
-                for j in range(center_col - cluster_size, center_col + cluster_size):
-                    if 0 <= i < size and 0 <= j < size:
-                        if random.random() < 0.7:  # 70% fill within cluster
-                            grid[i][j] = 1
+        Args:
+            size: Grid size
+            density: Obstacle density
+            seed: Random seed (int, SeedSequence or Generator)
+            as_array: Return a uint8 NumPy array instead of a 2D list
+
+        Returns:
+            2D list (or array) with clustered obstacles
+        """
+        rng = np.random.default_rng(seed)
+        coverage = MapGenerator._cluster_coverage(size, density, rng)
+        free = 0.3 ** np.arange(coverage.max(initial=0) + 1)
+        grid = (rng.random((size, size)) >= free[coverage]).astype(np.uint8)
 
-        return grid
+        return grid if as_array else grid.tolist()
 
     @staticmethod
-    def generate_maze_map(size, density, seed=None):
+    def generate_maze_map(size, density, seed=None, as_array=False):
         """
         Generate maze-like map with corridors
 
+        Recursive division without recursion: all chambers of one level are
+        split at once, each by a horizontal or vertical wall with a single
+        gap, and walls are written as flat index ranges. Subdivision stops
+        once the walls reach size * size * density cells; on the last level
+        only a random subset of chambers is split. Very high densities are
+        capped at what full subdivision reaches.
+
         Args:
             size: Grid size
             density: Wall density
-            seed: Random seed
+            seed: Random seed (int, SeedSequence or Generator)
+            as_array: Return a uint8 NumPy array instead of a 2D list
 
         Returns:
-            2D list with maze pattern
-        """
-        if seed is not None:
-            random.seed(seed)
-
-        grid = [[1 for _ in range(size)] for _ in range(size)]
-
-        # Create corridors using recursive division
-        def divide(x1, y1, x2, y2):
-            if x2 - x1 < 3 or y2 - y1 < 3:
-                return
-
-            # Create horizontal or vertical wall with gap
-            if random.random() < 0.5:
-                # Horizontal wall
-                wall_row = random.randint(y1 + 1, y2 - 1)
-                gap_col = random.randint(x1, x2)
-
-                for col in range(x1, x2 + 1):
-                    if col != gap_col:
-                        grid[wall_row][col] = 1
-                    else:
-                        grid[wall_row][col] = 0
-
-                divide(x1, y1, x2, wall_row - 1)
-                divide(x1, wall_row + 1, x2, y2)
-            else:
-                # Vertical wall
-                wall_col = random.randint(x1 + 1, x2 - 1)
-                gap_row = random.randint(y1, y2)
-
-                for row in range(y1, y2 + 1):
-                    if row != gap_row:
-                        grid[row][wall_col] = 1
-                    else:
-                        grid[row][wall_col] = 0
-
-                divide(x1, y1, wall_col - 1, y2)
-                divide(wall_col + 1, y1, x2, y2)
-
-        # Clear initial grid
-        for i in range(size):
-            for j in range(size):
-                grid[i][j] = 0
-
-        # Create maze
-        divide(0, 0, size - 1, size - 1)
-
-        return grid
+            2D list (or array) with maze pattern
+        """
+        rng = np.random.default_rng(seed)
+        grid = np.zeros(size * size, dtype=np.uint8)
+        budget = int(size * size * density)
+
+        # Chambers as inclusive bounds (x = column, y = row)
+        x1, y1 = np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64)
+        x2, y2 = np.full(1, size - 1, dtype=np.int64), np.full(1, size - 1, dtype=np.int64)
+
+        while len(x1) and budget > 0:
+            # A wall needs a row/column strictly inside the chamber
+            keep = (x2 - x1 >= 2) & (y2 - y1 >= 2)
+            x1, y1, x2, y2 = x1[keep], y1[keep], x2[keep], y2[keep]
+            horizontal = rng.random(len(x1)) < 0.5
+            length = np.where(horizontal, x2 - x1 + 1, y2 - y1 + 1)
+
+            # Spend the remaining budget on a random subset of chambers
+            if (length - 1).sum() > budget:
+                order = rng.permutation(len(x1))
+                chosen = order[np.cumsum(length[order] - 1) <= budget]
+                x1, y1, x2, y2 = x1[chosen], y1[chosen], x2[chosen], y2[chosen]
+                horizontal, length = horizontal[chosen], length[chosen]
+            if not len(x1):
+                break
+
+            # Wall line strictly inside, gap anywhere along it
+            line = np.where(horizontal, rng.integers(y1 + 1, y2), rng.integers(x1 + 1, x2))
+            gap = np.where(horizontal, rng.integers(x1, x2 + 1), rng.integers(y1, y2 + 1))
+
+            first = np.where(horizontal, line * size + x1, y1 * size + line)
+            stride = np.where(horizontal, 1, size)
+            ends = np.cumsum(length)
+            offsets = np.arange(ends[-1]) - np.repeat(ends - length, length)
+            grid[np.repeat(first, length) + offsets * np.repeat(stride, length)] = 1
+            grid[np.where(horizontal, line * size + gap, gap * size + line)] = 0
+            budget -= int((length - 1).sum())
+
+            # Two children per chamber, on either side of the wall
+            x1, y1, x2, y2 = (
+                np.concatenate([x1, np.where(horizontal, x1, line + 1)]),
+                np.concatenate([y1, np.where(horizontal, line + 1, y1)]),
+                np.concatenate([np.where(horizontal, x2, line - 1), x2]),
+                np.concatenate([np.where(horizontal, line - 1, y2), y2]),
+            )
+
+        grid = grid.reshape(size, size)
+        return grid if as_array else grid.tolist()
 
     @staticmethod
-    def generate_mixed_map(size, density, seed=None):
+    def generate_mixed_map(size, density, seed=None, as_array=False):
         """
         Generate map with mixed obstacle patterns
 
+        Random obstacles at half the density, overlaid with clusters at the
+        other half; a cell stays free only if both leave it free, so one
+        draw per cell decides it.
+
         Args:
             size: Grid size
             density: Obstacle density
-            seed: Random seed
+            seed: Random seed (int, SeedSequence or Generator)
+            as_array: Return a uint8 NumPy array instead of a 2D list
 
         Returns:
-            2D list with mixed patterns
+            2D list (or array) with mixed patterns
         """
-        if seed is not None:
-            random.seed(seed)
+        rng = np.random.default_rng(seed)
+        coverage = MapGenerator._cluster_coverage(size, density / 2, rng)
+        free = (1 - density / 2) * 0.3 ** np.arange(coverage.max(initial=0) + 1)
+        grid = (rng.random((size, size)) >= free[coverage]).astype(np.uint8)
 
-        # Combine random and clustered
-        grid1 = MapGenerator.generate_random_map(size, density / 2, seed)
-        grid2 = MapGenerator.generate_clustered_map(size, density / 2, seed + 1 if seed else None)
+        return grid if as_array else grid.tolist()
 
-        # Merge grids
-        grid = [[0 for _ in range(size)] for _ in range(size)]
-        for i in range(size):
-            for j in range(size):
-                if grid1[i][j] == 1 or grid2[i][j] == 1:
-                    grid[i][j] = 1
+    @staticmethod
+    def generate(map_type, size, density, seed=None, as_array=False):
+        """
+        Generate a map of a named type
 
-        return grid
+        Args:
+            map_type: 'random', 'clustered', 'maze' or 'mixed'
+            size: Grid size
+            density: Obstacle density
+            seed: Random seed (int, SeedSequence or Generator)
+            as_array: Return a uint8 NumPy array instead of a 2D list
+
+        Returns:
+            2D list (or array)
+        """
+        generators = {
+            'random': MapGenerator.generate_random_map,
+            'clustered': MapGenerator.generate_clustered_map,
+            'maze': MapGenerator.generate_maze_map,
+            'mixed': MapGenerator.generate_mixed_map,
+        }
+        if map_type not in generators:
+            raise ValueError(f"Unknown map type: {map_type}")
+        return generators[map_type](size, density, seed, as_array=as_array)
 
     @staticmethod
-    def save_map(grid, filename):
-        """Save map to JSON file"""
+    def save_map(grid, filename, seed=None, map_type='', density=None):
+        """
+        Save map to a file
+
+        Files ending in .gmap use the bit-packed binary format (see
+        utils.map_file), which also records the generator parameters;
+        anything else is written as JSON.
+
+        Args:
+            grid: 2D list, array or Grid
+            filename: Output path
+            seed: Generator seed (binary format only)
+            map_type: Generator name (binary format only)
+            density: Generator density (binary format only)
+        """
+        if filename.endswith(EXTENSION):
+            write_map(filename, grid, seed=seed, map_type=map_type, density=density)
+            return
         with open(filename, 'w') as f:
-            json.dump(grid, f)
+            json.dump(grid if isinstance(grid, list) else np.asarray(grid).tolist(), f)
 
     @staticmethod
-    def load_map(filename):
-        """Load map from JSON file"""
+    def load_map(filename, as_array=False):
+        """
+        Load map from a binary (.gmap) or JSON file
+
+        Args:
+            filename: Map path
+            as_array: Return a uint8 NumPy array instead of a 2D list;
+                      memory-mapped without copying for byte maps
+
+        Returns:
+            2D list (or array)
+        """
+        if filename.endswith(EXTENSION):
+            grid = MapFile(filename).array()
+            return grid if as_array else grid.tolist()
         with open(filename, 'r') as f:
-            return json.load(f)
+            grid = json.load(f)
+        return np.array(grid, dtype=np.uint8) if as_array else grid
 
     @staticmethod
     def get_valid_start_end(grid, size):
@@ -203,3 +326,212 @@ class MapGenerator:
 
         # No valid path possible
         return None, None
+
+    @staticmethod
+    def select_start_end(grid, policy='corners', min_distance=0, seed=None, attempts=32):
+        """
+        Pick start and end positions that are guaranteed to be connected
+
+        Free cells are labeled into 4-connected components once, so a
+        solvable pair is found without running a search. Policies:
+
+        - 'corners': the farthest-apart pair of connected free corners,
+          falling back to 'farthest' when there is none
+        - 'farthest': the connected pair with the largest Manhattan
+          separation (deterministic)
+        - 'random': a random free cell, then a random cell of its component
+        - 'largest': a random pair inside the largest component
+
+        Args:
+            grid: 2D list, array or Grid (0=empty, 1=obstacle)
+            policy: 'corners', 'farthest', 'random' or 'largest'
+            min_distance: Minimum Manhattan distance between start and end
+            seed: Random seed (int, SeedSequence or Generator)
+            attempts: Start cells tried before giving up
+
+        Returns:
+            Tuple of (start_pos, end_pos), or (None, None) if no pair exists
+        """
+        if policy not in ('corners', 'farthest', 'random', 'largest'):
+            raise ValueError(f"Unknown start/end policy: {policy}")
+
+        labels, count = ndimage.label(np.asarray(grid) != 1)
+        rows, cols = labels.shape
+        min_distance = max(min_distance, 1)
+
+        if policy == 'corners':
+            corners = [(0, 0), (0, cols - 1), (rows - 1, 0), (rows - 1, cols - 1)]
+            pairs = sorted(combinations(corners, 2),
+                           key=lambda p: -(abs(p[0][0] - p[1][0]) + abs(p[0][1] - p[1][1])))
+            for a, b in pairs:
+                if (labels[a] and labels[a] == labels[b]
+                        and abs(a[0] - b[0]) + abs(a[1] - b[1]) >= min_distance):
+                    return a, b
+            policy = 'farthest'
+
+        # Cells grouped by component: order[bounds[k]:bounds[k + 1]] has label k
+        flat = labels.ravel()
+        sizes = np.bincount(flat, minlength=count + 1)
+        order = np.argsort(flat, kind='stable')
+        bounds = np.concatenate([[0], np.cumsum(sizes)])
+        sizes[0] = 0  # Obstacles
+
+        if policy == 'farthest':
+            # Manhattan distance is max(|d(r + c)|, |d(r - c)|), so the
+            # farthest pair of a component sits at extremes of r + c or r - c
+            free = order[bounds[1]:]
+            if not free.size:
+                return None, None
+            starts = bounds[1:-1] - bounds[1]
+            best = None
+            for key in (free // cols + free % cols, free // cols - free % cols):
+                spread = np.maximum.reduceat(key, starts) - np.minimum.reduceat(key, starts)
+                label = int(spread.argmax())
+                if best is None or spread[label] > best[0]:
+                    segment = slice(starts[label], starts[label] + sizes[label + 1])
+                    cells = free[segment]
+                    best = (spread[label], int(cells[key[segment].argmin()]), int(cells[key[segment].argmax()]))
+            if best[0] < min_distance:
+                return None, None
+            return divmod(best[1], cols), divmod(best[2], cols)
+
+        if policy == 'largest':
+            largest = sizes.argmax()
+            candidates = order[bounds[largest]:bounds[largest + 1]] if sizes[largest] >= 2 else order[:0]
+        else:
+            candidates = np.flatnonzero(sizes[flat] >= 2)
+
+        rng = np.random.default_rng(seed)
+        for _ in range(attempts if candidates.size else 0):
+            start = int(rng.choice(candidates))
+            label = flat[start]
+            same = order[bounds[label]:bounds[label + 1]]
+            far = same[np.abs(same // cols - start // cols) + np.abs(same % cols - start % cols)
+                       >= min_distance]
+            if far.size:
+                end = int(rng.choice(far))
+                return divmod(start, cols), divmod(end, cols)
+
+        return None, None
+
+
+class ProceduralRow:
+    """One row of a ProceduralMap; cells are read from its chunks"""
+
+    def __init__(self, world, index):
+        self.world = world
+        self.index = index
+
+    def __len__(self):
+        return self.world.cols
+
+    def __getitem__(self, col):
+        return self.world.cell(self.index, col)
+
+    def __setitem__(self, col, value):
+        self.world.set_cell(self.index, col, value)
+
+    def __iter__(self):
+        return (self.world.cell(self.index, col) for col in range(self.world.cols))
+
+
+class ProceduralMap:
+    """
+    Very large grid whose chunks are generated on demand
+
+    Chunk (chunk_row, chunk_col) is a chunk_size x chunk_size map of the
+    chosen style, generated from its own stream of
+    SeedSequence([seed, chunk_row, chunk_col]), so any chunk is the same
+    whenever and in whatever order it is built. Only the most recently used
+    chunks are kept. Indexing works like the list-of-lists grid
+    (``world[row][col]``, ``len(world)``), so every visualizer can search
+    it without the full map ever existing. Clusters and maze chambers do
+    not cross chunk borders.
+    """
+
+    def __init__(self, style='random', density=0.25, seed=0, size=1_000_000,
+                 chunk_size=64, max_chunks=256):
+        """
+        Initialize map
+
+        Args:
+            style: Map type used for each chunk ('random', 'clustered',
+                   'maze' or 'mixed')
+            density: Obstacle density
+            seed: Map seed (non-negative int)
+            size: Extent in cells (size x size); only bounds the searches
+            chunk_size: Cells per chunk side
+            max_chunks: Number of chunks kept in the cache
+        """
+        self.style = style
+        self.density = density
+        self.seed = seed
+        self.rows = self.cols = size
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.chunks = OrderedDict()   # LRU: key -> list of rows
+        self.edits = {}               # key -> {(row, col): value} within the chunk
+        self.generated = 0
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, row):
+        if not 0 <= row < self.rows:
+            raise IndexError("row out of range")
+        return ProceduralRow(self, row)
+
+    def __iter__(self):
+        return (ProceduralRow(self, row) for row in range(self.rows))
+
+    def chunk(self, chunk_row, chunk_col):
+        """
+        Cells of a chunk, generating it on a cache miss
+
+        Args:
+            chunk_row: Chunk row index
+            chunk_col: Chunk column index
+
+        Returns:
+            chunk_size x chunk_size 2D list
+        """
+        key = (chunk_row, chunk_col)
+        cells = self.chunks.get(key)
+        if cells is not None:
+            self.chunks.move_to_end(key)
+            return cells
+
+        rng = np.random.default_rng(np.random.SeedSequence([self.seed, chunk_row, chunk_col]))
+        cells = MapGenerator.generate(self.style, self.chunk_size, self.density, rng)
+        for (row, col), value in self.edits.get(key, {}).items():
+            cells[row][col] = value
+        self.generated += 1
+
+        self.chunks[key] = cells
+        if len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+        return cells
+
+    def cell(self, row, col):
+        """Value of a cell (0=empty, 1=obstacle, 2=start, 3=end)"""
+        if not 0 <= col < self.cols:
+            raise IndexError("column out of range")
+        chunk_row, r = divmod(row, self.chunk_size)
+        chunk_col, c = divmod(col, self.chunk_size)
+        return self.chunk(chunk_row, chunk_col)[r][c]
+
+    def set_cell(self, row, col, value):
+        """
+        Overwrite a cell (e.g. to mark start/end); kept across evictions
+
+        Args:
+            row: Row index
+            col: Column index
+            value: New cell value
+        """
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise IndexError("cell out of range")
+        chunk_row, r = divmod(row, self.chunk_size)
+        chunk_col, c = divmod(col, self.chunk_size)
+        self.edits.setdefault((chunk_row, chunk_col), {})[r, c] = value
+        self.chunk(chunk_row, chunk_col)[r][c] = value
@@ -0,0 +1,122 @@
+"""
+Query Cache
+LRU cache of finished searches keyed by (grid shape, grid hash, start,
+end, algorithm)
+"""
+
+from collections import OrderedDict
+
+from utils.grid import grid_hash
+
+
+class QueryCache:
+    """
+    Least-recently-used cache of paths and stats
+
+    The key uses the grid's Zobrist hash, which a utils.grid.Grid keeps
+    current on every edit, so a lookup costs O(1) no matter how large the
+    map is. Plain 2D lists are hashed on every lookup instead. The shape is
+    part of the key because obstacle-free grids of any size hash to 0.
+    """
+
+    def __init__(self, max_entries=1024):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Entries kept before the least recently used one
+                         is evicted
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, grid, start, end, algorithm):
+        """Cache key of one query"""
+        shape = (len(grid), len(grid[0]) if len(grid) else 0)
+        return (shape, grid_hash(grid), tuple(start), tuple(end), algorithm)
+
+    def get(self, grid, start, end, algorithm):
+        """
+        Look up a query
+
+        Args:
+            grid: 2D list or Grid
+            start: (row, col) tuple for start position
+            end: (row, col) tuple for end position
+            algorithm: Algorithm name
+
+        Returns:
+            (path, stats) tuple, or None on a miss
+        """
+        return self._lookup(self.key(grid, start, end, algorithm))
+
+    def _lookup(self, key):
+        """get() for an already computed key"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        path, stats = entry
+        return list(path), dict(stats)
+
+    def put(self, grid, start, end, algorithm, path, stats):
+        """
+        Store a finished query, evicting the least recently used entry
+
+        Args:
+            grid: 2D list or Grid
+            start: (row, col) tuple for start position
+            end: (row, col) tuple for end position
+            algorithm: Algorithm name
+            path: Path returned by get_path()
+            stats: Dictionary returned by get_stats()
+        """
+        self._store(self.key(grid, start, end, algorithm), path, stats)
+
+    def _store(self, key, path, stats):
+        """put() for an already computed key"""
+        self.entries[key] = (list(path), dict(stats))
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def run(self, algorithm, algo_class, grid, start, end):
+        """
+        Answer a query from the cache, or run the visualizer and store it
+
+        The grid is hashed once per call, even on a miss.
+
+        Args:
+            algorithm: Algorithm name
+            algo_class: Visualizer class to run on a miss
+            grid: 2D list or Grid
+            start: (row, col) tuple for start position
+            end: (row, col) tuple for end position
+
+        Returns:
+            (path, stats) tuple
+        """
+        key = self.key(grid, start, end, algorithm)
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry
+
+        visualizer = algo_class(grid, start, end)
+        while visualizer.step():
+            pass
+
+        path, stats = visualizer.get_path(), visualizer.get_stats()
+        self._store(key, path, stats)
+        return path, stats
+
+    def clear(self):
+        """Drop all entries"""
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
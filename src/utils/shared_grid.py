@@ -0,0 +1,151 @@
+"""
+Shared Grid
+NumPy arrays in shared memory so worker processes can read a map (and
+write per-cell search state) without pickling it per task
+"""
+
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+
+# Per-process state of pool workers, set up by the pool initializer
+worker_state = {}
+
+
+class SharedArray:
+    """NumPy array backed by a multiprocessing shared memory block"""
+
+    def __init__(self, shm, shape, dtype, owner, readonly=False):
+        """
+        Wrap a shared memory block (use create() or attach() instead)
+
+        Args:
+            shm: SharedMemory instance
+            shape: Array shape
+            dtype: NumPy dtype
+            owner: True if this process created (and must unlink) the block
+            readonly: Mark the NumPy view read-only
+        """
+        self.shm = shm
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.owner = owner
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf)
+        if readonly:
+            self.array.flags.writeable = False
+
+    @classmethod
+    def create(cls, shape, dtype, fill=0):
+        """
+        Allocate a new shared array
+
+        Args:
+            shape: Array shape
+            dtype: NumPy dtype
+            fill: Initial value for every element
+
+        Returns:
+            SharedArray owned by the calling process
+        """
+        size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        shared = cls(shm, shape, dtype, owner=True)
+        shared.array.fill(fill)
+        return shared
+
+    @classmethod
+    def attach(cls, handle, readonly=False):
+        """
+        Attach to an array created by another process
+
+        Args:
+            handle: Tuple returned by handle()
+            readonly: Mark the NumPy view read-only
+
+        Returns:
+            SharedArray that does not own the block
+        """
+        name, shape, dtype = handle
+        return cls(shared_memory.SharedMemory(name=name), shape, dtype,
+                   owner=False, readonly=readonly)
+
+    def flat_view(self):
+        """
+        Flat memoryview over the array's elements
+
+        Indexing a memoryview from Python is much cheaper than indexing a
+        NumPy array, which matters in per-cell search loops. Release the
+        view before calling close().
+        """
+        nbytes = int(np.prod(self.shape)) * self.dtype.itemsize
+        return self.shm.buf[:nbytes].cast(self.dtype.char)
+
+    def handle(self):
+        """Picklable description used to attach from another process"""
+        return (self.shm.name, self.shape, self.dtype.str)
+
+    def close(self):
+        """Release this process's view (and the block itself if owned)"""
+        self.array = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def share_grid(grid):
+    """
+    Copy a grid's obstacle layout into shared memory
+
+    Args:
+        grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+
+    Returns:
+        SharedArray of uint8 with 1 for obstacles and 0 for free cells
+    """
+    blocked = np.asarray(grid) == 1
+    shared = SharedArray.create(blocked.shape, np.uint8)
+    shared.array[...] = blocked
+    return shared
+
+
+def _init_worker(handle, setup, setup_args):
+    """Attach the pool worker to the shared read-only grid, then run setup"""
+    shared = SharedArray.attach(handle, readonly=True)
+    worker_state['shared'] = shared
+    worker_state['blocked'] = shared.array
+    if setup is not None:
+        worker_state.update(setup(shared, *setup_args))
+
+
+def pool_map(grid, task, items, num_workers, setup=None, setup_args=()):
+    """
+    Map a task over items in a pool whose workers share the grid read-only
+
+    The grid is copied once into shared memory; tasks read it from
+    ``worker_state['blocked']`` instead of receiving it pickled.
+
+    Args:
+        grid: 2D list where 0=empty, 1=obstacle, 2=start, 3=end
+        task: Module-level function called with each item
+        items: List of task arguments
+        num_workers: Pool size
+        setup: Optional module-level function(shared, *setup_args) run once
+               per worker; the dict it returns is merged into worker_state
+        setup_args: Extra arguments for setup
+
+    Returns:
+        List of task results, in item order
+    """
+    shared = share_grid(grid)
+    try:
+        with get_context().Pool(num_workers, initializer=_init_worker,
+                                initargs=(shared.handle(), setup, setup_args)) as pool:
+            return pool.map(task, items)
+    finally:
+        shared.close()
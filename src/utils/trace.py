@@ -0,0 +1,150 @@
+"""
+Execution Traces
+Records a search run as packed arrays in a single file and replays it
+through a memory map, without re-running the search
+"""
+
+import struct
+from array import array
+
+import numpy as np
+
+from algorithms.events import expansion_events
+from utils.aligned_file import layout, map_arrays, write_arrays
+from utils.map_file import pack_seed, unpack_seed
+
+# File header: magic, format version, algorithm name length, rows, cols,
+# expansions, pushes, path cells, seed (see utils.map_file.pack_seed)
+HEADER = struct.Struct('<4sHHIIIII16s')
+MAGIC = b'TRCE'
+VERSION = 2
+
+
+def _offsets(name_length, expansions, pushes, path_cells):
+    """Byte offset, dtype and length of each array (8-byte aligned)"""
+    return layout(HEADER.size + name_length, [('push_offsets', '<i8', expansions + 1),
+                                              ('expanded', '<i4', expansions),
+                                              ('pushed', '<i4', pushes),
+                                              ('path', '<i4', path_cells)])
+
+
+def write_trace(path, visualizer, algorithm, seed=None):
+    """
+    Run a visualizer to completion and write its trace
+
+    Cells are stored as int32 flat indices (row * cols + col). Expansion
+    i pushed the cells pushed[push_offsets[i]:push_offsets[i + 1]].
+
+    Args:
+        path: Output file path
+        visualizer: Freshly constructed visualizer
+        algorithm: Algorithm name stored in the header
+        seed: Map seed stored in the header
+
+    Returns:
+        The visualizer (finished, so get_path()/get_stats() are available)
+    """
+    cols = visualizer.cols
+    expanded = array('i')
+    pushed = array('i')
+    push_offsets = array('q', [0])
+    final_path = []
+
+    for event in expansion_events(visualizer):
+        if event.path is not None:
+            final_path = event.path
+            continue
+        expanded.append(event.cell[0] * cols + event.cell[1])
+        pushed.extend(row * cols + col for row, col in event.pushed)
+        push_offsets.append(len(pushed))
+
+    name = algorithm.encode('utf-8')
+    path_cells = np.array([row * cols + col for row, col in final_path], dtype='<i4')
+    arrays = {
+        'push_offsets': np.frombuffer(push_offsets, dtype=np.int64),
+        'expanded': np.frombuffer(expanded, dtype=np.int32),
+        'pushed': np.frombuffer(pushed, dtype=np.int32),
+        'path': path_cells,
+    }
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(name), visualizer.rows, cols, len(expanded),
+                            len(pushed), len(path_cells), pack_seed(seed)))
+        f.write(name)
+        write_arrays(f, _offsets(len(name), len(expanded), len(pushed), len(path_cells)), arrays)
+
+    return visualizer
+
+
+class TraceReader:
+    """
+    Memory-mapped view of a trace written by write_trace()
+
+    Only the parts that are accessed are read from disk, so traces of
+    800x800 runs can be scrubbed through without loading them.
+    """
+
+    def __init__(self, path):
+        """
+        Open a trace
+
+        Args:
+            path: Trace file path
+        """
+        with open(path, 'rb') as f:
+            (magic, version, name_length, self.rows, self.cols, expansions,
+             pushes, path_cells, seed) = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not an execution trace")
+            self.algorithm = f.read(name_length).decode('utf-8')
+
+        self.seed = unpack_seed(seed)
+        arrays = map_arrays(path, _offsets(name_length, expansions, pushes, path_cells))
+        for name, values in arrays.items():
+            setattr(self, name, values)
+
+    def __len__(self):
+        """Number of expansion steps"""
+        return len(self.expanded)
+
+    def cell(self, step):
+        """(row, col) settled at a step"""
+        return divmod(int(self.expanded[step]), self.cols)
+
+    def pushed_at(self, step):
+        """List of (row, col) cells pushed while expanding a step"""
+        start, end = int(self.push_offsets[step]), int(self.push_offsets[step + 1])
+        return [divmod(int(index), self.cols) for index in self.pushed[start:end]]
+
+    def visited_mask(self, step):
+        """
+        Cells settled before a step
+
+        Args:
+            step: Number of expansions to replay (0..len(trace))
+
+        Returns:
+            Boolean array of shape (rows, cols)
+        """
+        mask = np.zeros(self.rows * self.cols, dtype=bool)
+        mask[self.expanded[:step]] = True
+        return mask.reshape(self.rows, self.cols)
+
+    def frontier_mask(self, step):
+        """
+        Cells pushed but not yet settled before a step
+
+        Args:
+            step: Number of expansions to replay (0..len(trace))
+
+        Returns:
+            Boolean array of shape (rows, cols)
+        """
+        mask = np.zeros(self.rows * self.cols, dtype=bool)
+        mask[self.pushed[:int(self.push_offsets[step])]] = True
+        mask[self.expanded[:step]] = False
+        return mask.reshape(self.rows, self.cols)
+
+    def get_path(self):
+        """Final path as a list of (row, col) tuples"""
+        return [divmod(int(index), self.cols) for index in self.path]
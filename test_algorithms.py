@@ -9,6 +9,23 @@ sys.path.insert(0, 'src')
 from algorithms.dijkstra import DijkstraVisualizer
 from algorithms.astar import AStarVisualizer
 from algorithms.bidirectional import BidirectionalVisualizer
+from algorithms.greedy import GreedyVisualizer
+from algorithms.block_astar import BlockAStarVisualizer, LocalDistanceDatabase
+from algorithms.quadtree import QuadtreeVisualizer, QuadtreeDecomposition
+from algorithms.rsr import RSRGraph
+from algorithms.hda_star import HDAStarVisualizer
+from algorithms.distance_matrix import compute_distance_matrix
+from algorithms.goal_bounding import GoalBounds, GoalBoundingGraph
+from algorithms.dead_ends import DeadEndAnalysis, DeadEndPruningGraph
+from algorithms.corridor import CorridorAStarVisualizer
+from algorithms.dijkstra_tree import DijkstraTree
+from algorithms.contraction import ContractionHierarchy, ContractionHierarchyVisualizer
+from algorithms.subgoal_graph import SubgoalGraph, SubgoalGraphVisualizer
+from algorithms.cpd import CompressedPathDatabase, CPDVisualizer
+from utils.connectivity import DynamicConnectivity
+from utils.query_cache import QueryCache
+from utils.trace import TraceReader, write_trace
+from utils.grid import Grid, grid_hash
 
 def test_simple_path():
     """Test basic pathfinding with no obstacles"""
@@ -186,6 +203,761 @@ def test_performance_ordering():
     print(f"  ✓ Bidirectional explored {nodes_explored['Dijkstra'] - nodes_explored['Bidirectional']} fewer nodes than Dijkstra")
     print()
 
+def test_block_astar():
+    """Test that Block A* matches Dijkstra's optimal path length"""
+    print("Testing Block A*...")
+
+    import random
+    random.seed(7)
+    lddb = LocalDistanceDatabase.build(4)
+
+    for trial in range(20):
+        size = random.randint(10, 30)
+        grid = [[1 if random.random() < 0.3 else 0 for _ in range(size)] for _ in range(size)]
+        start, end = (0, 0), (size - 1, random.randint(0, size - 1))
+        grid[start[0]][start[1]] = 0
+        grid[end[0]][end[1]] = 0
+
+        block = BlockAStarVisualizer(grid, start, end, lddb=lddb)
+        while block.step():
+            pass
+        dijkstra = DijkstraVisualizer(grid, start, end)
+        while dijkstra.step():
+            pass
+
+        path = block.get_path()
+        assert block.found_path == dijkstra.found_path, "Block A* should agree on reachability"
+        assert len(path) == len(dijkstra.get_path()), "Block A* should find optimal path"
+        for a, b in zip(path, path[1:]):
+            assert abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1, "Block A* path should be contiguous"
+            assert grid[b[0]][b[1]] != 1, "Block A* path should not go through obstacles"
+
+    print(f"  ✓ Block A* matched Dijkstra on 20 random maps")
+    print()
+
+def test_quadtree_search():
+    """Test quadtree search on an open map with one wall"""
+    print("Testing quadtree search...")
+
+    grid = [[0 for _ in range(64)] for _ in range(64)]
+    for i in range(60):
+        grid[i][32] = 1
+    start, end = (0, 0), (0, 63)
+
+    tree = QuadtreeDecomposition(grid)
+    assert len(tree.leaves) < 64 * 64 // 10, "Open space should collapse into few leaves"
+
+    visualizer = QuadtreeVisualizer(grid, start, end, decomposition=tree)
+    while visualizer.step():
+        pass
+
+    path = visualizer.get_path()
+    assert visualizer.found_path, "Quadtree search should find path around wall"
+    assert path[0] == start and path[-1] == end, "Path should connect start and end"
+    for a, b in zip(path, path[1:]):
+        assert abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1, "Path should be contiguous"
+        assert grid[b[0]][b[1]] != 1, "Path should not go through obstacles"
+
+    exact = AStarVisualizer(grid, start, end)
+    while exact.step():
+        pass
+    assert len(path) >= len(exact.get_path()), "Approximate path cannot beat the optimal one"
+
+    print(f"  ✓ {len(tree.leaves)} leaves, {visualizer.nodes_explored} leaf expansions, path {len(path)} cells")
+    print()
+
+def test_rsr_graph():
+    """Test that RSR keeps paths optimal while pruning open space"""
+    print("Testing Rectangular Symmetry Reduction...")
+
+    grid = [[0 for _ in range(30)] for _ in range(30)]
+    for i in range(5, 25):
+        grid[i][10] = 1
+        grid[15][i] = 1
+    start, end = (12, 4), (20, 20)
+
+    rsr = RSRGraph(grid)
+    assert rsr.node_count() < 30 * 30 // 2, "RSR should prune interior cells"
+
+    for name, algo_class in [('Dijkstra', DijkstraVisualizer),
+                             ('A*', AStarVisualizer),
+                             ('Bidirectional', BidirectionalVisualizer)]:
+        plain = algo_class(grid, start, end)
+        while plain.step():
+            pass
+        reduced = algo_class(grid, start, end, graph=rsr)
+        while reduced.step():
+            pass
+
+        path = reduced.get_path()
+        assert path[0] == start and path[-1] == end, f"{name} path should connect start and end"
+        for a, b in zip(path, path[1:]):
+            assert abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1, f"{name} path should be contiguous"
+            assert grid[b[0]][b[1]] != 1, f"{name} path should not go through obstacles"
+        assert len(path) == len(plain.get_path()), f"{name} should stay optimal on RSR graph"
+        assert reduced.nodes_explored < plain.nodes_explored, f"{name} should explore fewer nodes"
+
+    print(f"  ✓ RSR kept {rsr.node_count()} of {30 * 30} cells and preserved optimal paths")
+    print()
+
+def test_hda_star():
+    """Test that parallel HDA* returns the same path cost as A*"""
+    print("Testing HDA* (parallel A*)...")
+
+    import random
+    random.seed(11)
+    grid = [[1 if random.random() < 0.25 else 0 for _ in range(40)] for _ in range(40)]
+    start, end = (0, 0), (39, 39)
+    grid[0][0] = 0
+    grid[39][39] = 0
+
+    astar = AStarVisualizer(grid, start, end)
+    while astar.step():
+        pass
+
+    for workers in (1, 3):
+        hda = HDAStarVisualizer(grid, start, end, num_workers=workers, batch_size=8)
+        while hda.step():
+            pass
+
+        path = hda.get_path()
+        assert hda.found_path == astar.found_path, "HDA* should agree on reachability"
+        assert len(path) == len(astar.get_path()), "HDA* should find the optimal path cost"
+        for a, b in zip(path, path[1:]):
+            assert abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1, "HDA* path should be contiguous"
+
+    print(f"  ✓ HDA* matched A* path length ({len(astar.get_path())} cells)")
+    print()
+
+def test_distance_matrix():
+    """Test many-to-many distances against individual Dijkstra runs"""
+    print("Testing distance matrix...")
+
+    grid = [[0 for _ in range(12)] for _ in range(12)]
+    for i in range(10):
+        grid[i][6] = 1
+    points = [(0, 0), (0, 11), (11, 0), (5, 8)]
+
+    matrix, paths = compute_distance_matrix(grid, points, return_paths=True, num_workers=2)
+
+    for i, a in enumerate(points):
+        for j, b in enumerate(points):
+            visualizer = DijkstraVisualizer(grid, a, b)
+            while visualizer.step():
+                pass
+            expected = len(visualizer.get_path()) - 1
+            assert matrix[i][j] == expected, "Matrix entry should equal shortest path cost"
+            assert len(paths[i][j]) == expected + 1, "Returned path should be a shortest path"
+
+    print(f"  ✓ {len(points)}x{len(points)} matrix matched Dijkstra")
+    print()
+
+def test_goal_bounding():
+    """Test that goal-bounding pruning keeps A* optimal and saves expansions"""
+    print("Testing goal bounding...")
+
+    import os
+    import random
+    import tempfile
+    random.seed(5)
+    grid = [[1 if random.random() < 0.2 else 0 for _ in range(15)] for _ in range(15)]
+    grid[0][0] = 0
+    grid[14][14] = 0
+
+    bounds = GoalBounds.build(grid, num_workers=1)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'map.gbnd')
+        bounds.save(path)
+        bounds = GoalBounds.load(path)
+    graph = GoalBoundingGraph(grid, bounds)
+
+    plain = AStarVisualizer(grid, (0, 0), (14, 14))
+    while plain.step():
+        pass
+    pruned = AStarVisualizer(grid, (0, 0), (14, 14), graph=graph)
+    while pruned.step():
+        pass
+
+    assert pruned.found_path == plain.found_path, "Pruning should not change reachability"
+    assert len(pruned.get_path()) == len(plain.get_path()), "Pruning should keep paths optimal"
+    assert pruned.nodes_explored <= plain.nodes_explored, "Pruning should not add expansions"
+
+    print(f"  ✓ A* explored {pruned.nodes_explored} nodes with goal bounding vs {plain.nodes_explored}")
+    print()
+
+def test_dead_end_pruning():
+    """Test that an enclosed room is skipped and the cache follows edits"""
+    print("Testing dead-end and swamp pruning...")
+
+    grid = Grid([[0 for _ in range(20)] for _ in range(20)])
+    # Room in the top-right corner with a single doorway at (6, 14)
+    for i in range(7):
+        grid[i][13] = 1
+    for j in range(13, 20):
+        grid[6][j] = 1
+    grid[6][14] = 0
+    start, end = (0, 0), (19, 19)
+
+    analysis = DeadEndAnalysis.for_grid(grid)
+    assert analysis.is_skippable((2, 17), start, end), "Room cells should be skippable"
+    assert not analysis.is_skippable((2, 17), (2, 17), end), "Room with an endpoint must be searched"
+    assert DeadEndAnalysis.for_grid(grid) is analysis, "Analysis should be cached on the grid"
+
+    pruned = GreedyVisualizer(grid, (10, 10), (0, 12), graph=DeadEndPruningGraph(grid))
+    while pruned.step():
+        pass
+    assert pruned.found_path, "Pruned search should still find the path"
+    assert not any(cell[1] > 13 and cell[0] < 6 for cell in pruned.get_visited()), "Room should not be explored"
+
+    grid[3][13] = 0  # Second doorway: the room is no longer a swamp
+    assert DeadEndAnalysis.for_grid(grid) is not analysis, "Editing an obstacle should invalidate the cache"
+    assert not DeadEndAnalysis.for_grid(grid).is_skippable((2, 17), start, end), "Room should be searchable again"
+
+    print(f"  ✓ Room pruned, cache invalidated on edit")
+    print()
+
+def test_corridor_search():
+    """Test coarse-to-fine search around a wall and with an unreachable goal"""
+    print("Testing coarse-to-fine corridor search...")
+
+    grid = [[0 for _ in range(40)] for _ in range(40)]
+    # Wall whose only gap is far from the straight route
+    for j in range(39):
+        grid[20][j] = 1
+    start, end = (0, 0), (39, 0)
+
+    visualizer = CorridorAStarVisualizer(grid, start, end, factor=4, radius=1)
+    while visualizer.step():
+        pass
+
+    path = visualizer.get_path()
+    assert visualizer.found_path, "Corridor search should find path through the gap"
+    assert path[0] == start and path[-1] == end, "Path should connect start and end"
+    for a, b in zip(path, path[1:]):
+        assert abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1, "Path should be contiguous"
+        assert grid[b[0]][b[1]] != 1, "Path should not go through obstacles"
+
+    # A zero-width corridor must still widen when it fails: the start's
+    # pocket only opens into the coarse cell below the coarse path
+    pocket = [[0 for _ in range(8)] for _ in range(8)]
+    for i in range(4):
+        pocket[i][1] = 1
+    narrow = CorridorAStarVisualizer(pocket, (0, 0), (0, 7), factor=4, radius=0)
+    for _ in range(10000):
+        if not narrow.step():
+            break
+    assert narrow.found_path and narrow.fine_attempts == 2, "Radius 0 should widen and succeed"
+
+    for j in range(40):
+        grid[20][j] = 1
+    blocked = CorridorAStarVisualizer(grid, start, end)
+    while blocked.step():
+        pass
+    assert not blocked.found_path, "Coarse search should reject unreachable goals"
+
+    print(f"  ✓ Path {len(path)} cells after {visualizer.fine_attempts} fine attempt(s)")
+    print()
+
+def test_dynamic_connectivity():
+    """Test that components split and merge as obstacles are edited"""
+    print("Testing dynamic connectivity...")
+
+    grid = Grid([[0 for _ in range(15)] for _ in range(15)])
+    connectivity = DynamicConnectivity(grid)
+    start, end = (0, 0), (14, 14)
+    assert connectivity.connected(start, end), "Empty grid should be connected"
+
+    for i in range(14):
+        grid[i][7] = 1
+    assert connectivity.connected(start, end), "Gap at the bottom should keep the halves connected"
+
+    grid[14][7] = 1  # Close the gap
+    assert not connectivity.connected(start, end), "Closed wall should split the grid"
+    assert connectivity.connected(start, (14, 6)), "Left half should stay connected"
+    assert connectivity.component((3, 7)) is None, "Obstacles have no component"
+
+    grid[5][7] = 0  # Open a door
+    assert connectivity.connected(start, end), "Opening a door should merge the halves"
+
+    print(f"  ✓ Split and merge tracked across {grid.version} edits")
+    print()
+
+def test_dijkstra_tree():
+    """Test that repeated goals from one start reuse the search"""
+    print("Testing resumable Dijkstra tree...")
+
+    grid = Grid([[0 for _ in range(20)] for _ in range(20)])
+    for i in range(15):
+        grid[i][10] = 1
+    start = (0, 0)
+
+    tree = DijkstraTree.for_grid(grid, start)
+    near = tree.query((5, 5))
+    assert len(near) == 11, "First goal should get its shortest path"
+
+    far = tree.query((0, 19))
+    resumed = tree.nodes_explored
+    assert len(far) == 50, f"Path around the wall should be 50 cells, got {len(far)}"
+    assert 0 < resumed < 400, "Unsettled goal should continue from the frontier"
+
+    tree.query((3, 4))
+    assert tree.nodes_explored == 0, "Settled goal should not expand any cell"
+    assert DijkstraTree.for_grid(grid, start) is tree, "Tree should be cached per start"
+
+    grid[19][10] = 1
+    assert DijkstraTree.for_grid(grid, start) is not tree, "Obstacle edit should drop the tree"
+
+    print(f"  ✓ Second goal resumed with {resumed} expansions, settled goal free")
+    print()
+
+def test_query_cache():
+    """Test incremental grid hashing and LRU query caching"""
+    print("Testing Zobrist hash and query cache...")
+
+    plain = [[0 for _ in range(20)] for _ in range(20)]
+    grid = Grid(plain)
+    empty_hash = grid.hash
+    grid[4][7] = 1
+    assert grid.hash != empty_hash, "Obstacle edit should change the hash"
+    plain[4][7] = 1
+    assert grid.hash == grid_hash(plain), "Incremental hash should match a full rehash"
+    grid[4][7] = 0
+    assert grid.hash == empty_hash, "Undoing the edit should restore the hash"
+
+    cache = QueryCache(max_entries=2)
+    path, stats = cache.run('A*', AStarVisualizer, grid, (0, 0), (19, 19))
+    cached_path, cached_stats = cache.run('A*', AStarVisualizer, grid, (0, 0), (19, 19))
+    assert cache.hits == 1 and cached_path == path, "Repeated query should hit the cache"
+
+    grid[10][10] = 1
+    cache.run('A*', AStarVisualizer, grid, (0, 0), (19, 19))
+    assert cache.misses == 2, "Edited map should miss the cache"
+
+    cache.run('A*', AStarVisualizer, grid, (0, 0), (5, 5))
+    assert len(cache) == 2, "Cache should evict beyond max_entries"
+    grid[10][10] = 0
+    assert cache.get(grid, (0, 0), (19, 19), 'A*') is None, "Least recently used entry should be evicted"
+
+    # Obstacle-free grids all hash to 0; the shape keeps them apart
+    small, large = Grid([[0] * 10 for _ in range(10)]), Grid([[0] * 50 for _ in range(50)])
+    assert small.hash == large.hash == 0
+    cache.run('A*', AStarVisualizer, small, (0, 0), (5, 5))
+    assert cache.get(large, (0, 0), (5, 5), 'A*') is None, "Grids of different shapes should not collide"
+
+    print(f"  ✓ {cache.hits} hit(s), {cache.misses} miss(es), {len(cache)} entries kept")
+    print()
+
+def test_contraction_hierarchy():
+    """Test that CH queries are optimal and survive a save/load round trip"""
+    print("Testing contraction hierarchies...")
+
+    import os
+    import tempfile
+    from utils.map_generator import MapGenerator
+
+    grid = MapGenerator.generate_maze_map(30, 0.3, seed=7)
+    start, end = MapGenerator.get_valid_start_end(grid, 30)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        map_path = os.path.join(tmp, 'maze.json')
+        MapGenerator.save_map(grid, map_path)
+        ContractionHierarchy.for_map_file(map_path)
+        assert os.path.exists(ContractionHierarchy.sidecar_path(map_path)), "Hierarchy should be saved next to the map"
+        hierarchy = ContractionHierarchy.for_map_file(map_path)
+
+    ch = ContractionHierarchyVisualizer(grid, start, end, hierarchy=hierarchy)
+    dijkstra = DijkstraVisualizer(grid, start, end)
+    for visualizer in (ch, dijkstra):
+        while visualizer.step():
+            pass
+
+    path = ch.get_path()
+    assert ch.found_path == dijkstra.found_path, "CH should agree on reachability"
+    assert len(path) == len(dijkstra.get_path()), "CH path should be optimal"
+    for a, b in zip(path, path[1:]):
+        assert abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1, "Unpacked path should be contiguous"
+        assert grid[b[0]][b[1]] != 1, "Path should not go through obstacles"
+
+    print(f"  ✓ {hierarchy.shortcut_count()} shortcuts, {ch.nodes_explored} vs {dijkstra.nodes_explored} nodes")
+    print()
+
+def test_subgoal_graph():
+    """Test subgoal placement and optimal subgoal-graph queries"""
+    print("Testing simple subgoal graph...")
+
+    grid = [[0 for _ in range(12)] for _ in range(12)]
+    # Single obstacle block: its four outer diagonal cells are the subgoals
+    for i in range(4, 8):
+        for j in range(4, 8):
+            grid[i][j] = 1
+    graph = SubgoalGraph(grid)
+    assert graph.subgoals == {(3, 3), (3, 8), (8, 3), (8, 8)}, "Subgoals should sit at the block's corners"
+
+    start, end = (5, 0), (6, 11)
+    subgoal = SubgoalGraphVisualizer(grid, start, end, subgoal_graph=graph)
+    dijkstra = DijkstraVisualizer(grid, start, end)
+    for visualizer in (subgoal, dijkstra):
+        while visualizer.step():
+            pass
+
+    path = subgoal.get_path()
+    assert len(path) == len(dijkstra.get_path()), "Subgoal path should be optimal"
+    for a, b in zip(path, path[1:]):
+        assert abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1, "Path should be contiguous"
+        assert grid[b[0]][b[1]] != 1, "Path should not go through obstacles"
+
+    print(f"  ✓ Path {len(path)} cells via {subgoal.nodes_explored} graph nodes ({dijkstra.nodes_explored} for Dijkstra)")
+    print()
+
+def test_cpd():
+    """Test CPD lookups against Dijkstra, from a memory-mapped file"""
+    print("Testing compressed path database...")
+
+    import os
+    import tempfile
+    from utils.map_generator import MapGenerator
+
+    grid = MapGenerator.generate_random_map(25, 0.3, seed=11)
+    start, end = MapGenerator.get_valid_start_end(grid, 25)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'map.cpd')
+        CompressedPathDatabase.build(grid, num_workers=1).save(path)
+        cpd = CompressedPathDatabase.load(path)
+
+        lookup = CPDVisualizer(grid, start, end, cpd=cpd)
+        dijkstra = DijkstraVisualizer(grid, start, end)
+        for visualizer in (lookup, dijkstra):
+            while visualizer.step():
+                pass
+
+        assert lookup.found_path == dijkstra.found_path, "CPD should agree on reachability"
+        assert len(lookup.get_path()) == len(dijkstra.get_path()), "CPD path should be optimal"
+        assert cpd.path(start, end) == lookup.get_path(), "Direct extraction should match the visualizer"
+        runs = cpd.run_count()
+        del cpd, lookup  # Release the memory map before the directory is removed
+
+    print(f"  ✓ {runs} runs, path read with {len(dijkstra.get_path())} lookups")
+    print()
+
+def test_expansion_events():
+    """Test that the event stream reproduces the visited set and path"""
+    print("Testing expansion event streams...")
+
+    grid = [[0 for _ in range(15)] for _ in range(15)]
+    for i in range(12):
+        grid[i][7] = 1
+    start, end = (0, 0), (0, 14)
+
+    for algo_class in (DijkstraVisualizer, AStarVisualizer, GreedyVisualizer, BidirectionalVisualizer):
+        events = list(algo_class(grid, start, end).iter_events())
+        reference = algo_class(grid, start, end)
+        while reference.step():
+            pass
+
+        expansions, final = events[:-1], events[-1]
+        assert len(expansions) == reference.nodes_explored, "One event per settled cell"
+        assert {event.cell for event in expansions} == reference.get_visited(), "Events should rebuild the visited set"
+        assert final.cell is None and final.path == reference.get_path(), "Last event should carry the path"
+        pushed = [cell for event in expansions for cell in event.pushed]
+        assert all(grid[r][c] != 1 for r, c in pushed), "Pushed cells should be free"
+
+    print(f"  ✓ Event streams match step() for all four algorithms")
+    print()
+
+def test_execution_trace():
+    """Test writing a trace and seeking through it via the memory map"""
+    print("Testing execution traces...")
+
+    import os
+    import tempfile
+
+    grid = [[0 for _ in range(20)] for _ in range(20)]
+    for i in range(15):
+        grid[i][10] = 1
+    start, end = (0, 0), (0, 19)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'run.trace')
+        visualizer = write_trace(path, AStarVisualizer(grid, start, end), 'A*', seed=42)
+        trace = TraceReader(path)
+
+        assert (trace.rows, trace.cols, trace.algorithm, trace.seed) == (20, 20, 'A*', 42), "Header should round-trip"
+        assert len(trace) == visualizer.nodes_explored, "One step per expansion"
+        assert trace.cell(0) == start, "First expansion is the start"
+        assert trace.get_path() == visualizer.get_path(), "Path should round-trip"
+        assert trace.visited_mask(len(trace)).sum() == len(visualizer.get_visited()), "Full replay should match visited set"
+        assert not (trace.frontier_mask(10) & trace.visited_mask(10)).any(), "Frontier excludes settled cells"
+        steps = len(trace)
+        del trace  # Release the memory maps before the directory is removed
+
+        # BatchTester records the trace but reports an untraced run
+        from utils.batch_tester import BatchTester
+        tester = BatchTester(output_dir=tmp, trace_dir=os.path.join(tmp, 'traces'))
+        result = tester.run_single_test('A*', grid, start, end, seed=42)
+        assert len(os.listdir(tester.trace_dir)) == 1, "Run should be traced"
+        assert result['nodes_explored'] == visualizer.nodes_explored, "Stats should match the traced run"
+
+    print(f"  ✓ {steps} steps recorded and replayed")
+    print()
+
+def test_random_map_generation():
+    """Test vectorized random maps: reproducible seeds and both output types"""
+    print("Testing random map generation...")
+
+    from utils.map_generator import MapGenerator
+
+    grid = MapGenerator.generate_random_map(100, 0.3, seed=5)
+    array = MapGenerator.generate_random_map(100, 0.3, seed=5, as_array=True)
+    assert isinstance(grid, list) and grid == array.tolist(), "List and array forms should hold the same map"
+    assert grid != MapGenerator.generate_random_map(100, 0.3, seed=6), "Different seeds should give different maps"
+    density = array.mean()
+    assert 0.27 < density < 0.33, f"Obstacle share {density:.3f} should be close to 0.3"
+
+    print(f"  ✓ Seeded maps reproducible, density {density:.3f}")
+    print()
+
+def test_clustered_map_generation():
+    """Test vectorized clustered and mixed maps"""
+    print("Testing clustered and mixed map generation...")
+
+    import numpy as np
+    from utils.map_generator import MapGenerator
+
+    for generate in (MapGenerator.generate_clustered_map, MapGenerator.generate_mixed_map):
+        array = generate(120, 0.2, seed=3, as_array=True)
+        assert generate(120, 0.2, seed=3) == array.tolist(), "Seeded maps should be reproducible"
+        assert 0 < array.mean() < 1, "Map should contain both obstacles and free cells"
+
+    # A single cluster covers at most a 16 x 16 square
+    coverage = MapGenerator._cluster_coverage(100, 0.001, np.random.default_rng(0))
+    assert coverage.max() == 1 and 0 < coverage.sum() <= 16 * 16, "Coverage should count one square cluster"
+
+    print(f"  ✓ Clustered and mixed maps reproducible")
+    print()
+
+def test_maze_generation():
+    """Test iterative maze generation"""
+    print("Testing maze generation...")
+
+    from utils.map_generator import MapGenerator
+
+    array = MapGenerator.generate_maze_map(60, 0.3, seed=5, as_array=True)
+    assert MapGenerator.generate_maze_map(60, 0.3, seed=5) == array.tolist(), "Seeded mazes should be reproducible"
+
+    # Walls stop at the density budget
+    for density in (0.1, 0.25):
+        walls = MapGenerator.generate_maze_map(100, density, seed=1, as_array=True).mean()
+        assert density - 0.02 <= walls <= density, f"Density {walls} should track {density}"
+
+    large = MapGenerator.generate_maze_map(2000, 0.4, seed=1, as_array=True)
+    assert large.shape == (2000, 2000) and 0.39 <= large.mean() <= 0.4, "Large mazes should not need recursion"
+
+    print(f"  ✓ Mazes reproducible and honor density")
+    print()
+
+def test_spawned_streams():
+    """Test independent per-map random streams"""
+    print("Testing spawned random streams...")
+
+    from concurrent.futures import ThreadPoolExecutor
+    from utils.map_generator import MapGenerator
+
+    def generate(rng):
+        return MapGenerator.generate_random_map(40, 0.3, seed=rng)
+
+    serial = [generate(rng) for rng in MapGenerator.spawn_streams(11, 6)]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        threaded = list(executor.map(generate, MapGenerator.spawn_streams(11, 6)))
+    assert serial == threaded, "Maps should not depend on how streams are scheduled"
+    assert len({str(grid) for grid in serial}) == 6, "Streams should be independent"
+
+    # Streams are prefix-stable: more workers do not change earlier streams
+    more = MapGenerator.spawn_streams(11, 10)
+    assert generate(more[5]) == serial[5], "Stream i should depend only on seed and i"
+
+    # Stored seeds keep each child's full 128-bit state
+    seeds = MapGenerator.spawn_seeds(11, 6)
+    assert seeds == MapGenerator.spawn_seeds(11, 6), "Seeds should be reproducible"
+    assert max(seeds) >= 2 ** 64 and len(set(seeds)) == 6, "Seeds should not be truncated"
+    assert generate(seeds[0]) == generate(seeds[0]), "Maps should be reproducible from a stored seed"
+
+    print(f"  ✓ Streams reproducible across scheduling")
+    print()
+
+def test_select_start_end():
+    """Test reachability-guaranteed start/end selection"""
+    print("Testing start/end selection...")
+
+    from utils.map_generator import MapGenerator
+
+    # Two free corners, but separated by a wall
+    grid = [[0, 1, 0],
+            [0, 1, 0],
+            [0, 1, 0]]
+    assert MapGenerator.select_start_end(grid) == ((0, 0), (2, 0)), "Should pick connected corners"
+    assert MapGenerator.select_start_end([[0, 1], [1, 0]]) == (None, None), "No connected pair exists"
+
+    # Corners blocked: fall back to the farthest connected pair, not a random one
+    grid = [[1, 0, 0, 0, 1],
+            [0, 0, 1, 0, 0],
+            [1, 0, 0, 0, 1]]
+    start, end = MapGenerator.select_start_end(grid)
+    assert abs(start[0] - end[0]) + abs(start[1] - end[1]) == 4, "Fallback should maximize separation"
+
+    grid = MapGenerator.generate_random_map(40, 0.35, seed=4)
+    for policy in ('corners', 'farthest', 'random', 'largest'):
+        start, end = MapGenerator.select_start_end(grid, policy, min_distance=20, seed=1)
+        assert abs(start[0] - end[0]) + abs(start[1] - end[1]) >= 20, "Separation should be honored"
+        dijkstra = DijkstraVisualizer(grid, start, end)
+        while dijkstra.step():
+            pass
+        assert dijkstra.found_path, f"Policy {policy} should return a solvable pair"
+
+    print(f"  ✓ Selected pairs are connected")
+    print()
+
+def test_binary_map_format():
+    """Test bit-packed binary maps alongside JSON"""
+    print("Testing binary map format...")
+
+    import os
+    import tempfile
+    from utils.grid import grid_hash
+    from utils.map_file import MapFile
+    from utils.map_generator import MapGenerator
+
+    grid = MapGenerator.generate_random_map(37, 0.3, seed=8)
+    marked = [row[:] for row in grid]
+    marked[0][0], marked[36][36] = 2, 3
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, cells in (('map.json', grid), ('map.gmap', grid), ('marked.gmap', marked)):
+            path = os.path.join(tmp, name)
+            MapGenerator.save_map(cells, path, seed=8, map_type='random', density=0.3)
+            assert MapGenerator.load_map(path) == cells, f"{name} should round-trip"
+
+        packed = MapFile(os.path.join(tmp, 'map.gmap'))
+        assert packed.bits == 1 and packed.data.shape == (37, 5), "Obstacle maps should use one bit per cell"
+        assert (packed.seed, packed.map_type, packed.density) == (8, 'random', 0.3), "Header should keep params"
+        assert packed.hash == grid_hash(grid) and packed.verify(), "Header hash should match the grid"
+        assert packed.row(4).tolist() == grid[4], "Rows should unpack on their own"
+
+        spawned = MapGenerator.spawn_seeds(8, 1)[0]
+        MapGenerator.save_map(grid, os.path.join(tmp, 'spawned.gmap'), seed=spawned)
+        assert MapFile(os.path.join(tmp, 'spawned.gmap')).seed == spawned, "128-bit seeds should round-trip"
+
+        marked_file = MapFile(os.path.join(tmp, 'marked.gmap'))
+        assert marked_file.bits == 8 and marked_file.array().tolist() == marked, "Markers need a byte per cell"
+        del packed, marked_file
+
+    print(f"  ✓ JSON and binary maps round-trip")
+    print()
+
+def test_map_corpus():
+    """Test building a corpus and streaming it through BatchTester"""
+    print("Testing map corpus...")
+
+    import csv
+    import os
+    import tempfile
+    from utils.batch_tester import BatchTester
+    from utils.corpus import build_corpus, iter_corpus, read_index
+
+    params = dict(map_sizes=[20], obstacle_densities=[0.25, 0.7],
+                  map_types=['random', 'maze'], trials_per_config=2, seed=5)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        first, second = os.path.join(tmp, 'a'), os.path.join(tmp, 'b')
+        build_corpus(first, **params)
+        build_corpus(second, **params)
+
+        entries = read_index(first)
+        assert len(entries) == 8, "Corpus should cover size x density x type x trial"
+        assert entries == read_index(second), "Corpora should depend only on their parameters"
+        for (entry, grid), (_, again) in zip(iter_corpus(first, solvable_only=False),
+                                             iter_corpus(second, solvable_only=False)):
+            assert grid == again, "Maps should be identical across builds"
+            if entry['solvable']:
+                start, end = entry['start'], entry['end']
+                assert grid[start[0]][start[1]] != 1 and grid[end[0]][end[1]] != 1
+
+        tester = BatchTester(output_dir=os.path.join(tmp, 'results'))
+        with open(tester.run_corpus(first), newline='') as f:
+            rows = list(csv.DictReader(f))
+        solvable = sum(entry['solvable'] for entry in entries)
+        assert len(rows) == solvable * len(tester.algorithms), "Every solvable map should be run"
+        assert all(row['found_path'] == 'True' for row in rows), "Indexed pairs should be solvable"
+
+    print(f"  ✓ {solvable}/{len(entries)} solvable maps streamed")
+    print()
+
+def test_procedural_map():
+    """Test lazily generated chunked maps"""
+    print("Testing procedural maps...")
+
+    from utils.map_generator import ProceduralMap
+
+    world = ProceduralMap('random', 0.3, seed=9, size=10**9, chunk_size=16, max_chunks=4)
+    start, end = (3, 5), (70, 90)
+    world[start[0]][start[1]] = 2
+    world[end[0]][end[1]] = 3
+    assert len(world) == 10**9 and len(world[0]) == 10**9, "Map should report its full extent"
+
+    # Same cells after eviction, in any order, with edits kept
+    copy = [[world[r][c] for c in range(100)] for r in range(100)]
+    assert len(world.chunks) == 4, "Cache should stay bounded"
+    fresh = ProceduralMap('random', 0.3, seed=9, size=10**9, chunk_size=16)
+    assert all(fresh[r][c] == copy[r][c] for r in reversed(range(100)) for c in range(100)
+               if (r, c) not in (start, end)), "Chunks should not depend on generation order"
+    assert world[start[0]][start[1]] == 2 and world[end[0]][end[1]] == 3, "Edits should survive eviction"
+
+    lazy = AStarVisualizer(world, start, end)
+    full = AStarVisualizer(copy, start, end)
+    for visualizer in (lazy, full):
+        while visualizer.step():
+            pass
+    assert lazy.found_path and lazy.get_path() == full.get_path(), "Search should read cells transparently"
+
+    print(f"  ✓ Path of {len(lazy.get_path())} cells, {world.generated} chunks generated")
+    print()
+
+def test_pipelined_suite():
+    """Test the pipelined batch runner"""
+    print("Testing pipelined batch runner...")
+
+    import csv
+    import tempfile
+    from utils.batch_tester import BatchTester
+
+    def run(tester, **workers):
+        path = tester.run_pipelined_suite([20], [0.2, 0.6], ['random', 'maze'], trials_per_config=3,
+                                          seed=4, queue_size=2, **workers)
+        with open(path, newline='') as f:
+            rows = list(csv.DictReader(f))
+        for row in rows:
+            del row['time_ms']
+        return sorted(rows, key=lambda row: (row['seed'], row['algorithm']))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tester = BatchTester(output_dir=tmp)
+        rows = run(tester, generate_workers=1, search_workers=1)
+        assert rows == run(tester, generate_workers=2, search_workers=3), "Rows should not depend on workers"
+
+    stats = tester.pipeline_stats
+    assert stats['generate']['items'] == stats['search']['items'] == stats['write']['items'] == 12
+
+    with tempfile.TemporaryDirectory() as tmp:
+        empty = BatchTester(output_dir=tmp)
+        empty.run_pipelined_suite([20], [0.2], ['random'], trials_per_config=0, search_workers=3, queue_size=1)
+        assert empty.pipeline_stats['search']['items'] == 0, "An empty suite should finish"
+    assert len(rows) % len(tester.algorithms) == 0 and rows, "Each solvable map should be searched"
+    assert all(row['found_path'] == 'True' for row in rows), "Selected pairs should be solvable"
+    assert stats['queue_depth']['maps']['max'] <= 2, "Queues should stay bounded"
+
+    print(f"  ✓ {len(rows)} rows, search {stats['search']['per_s']:.0f} maps/s")
+    print()
+
 def run_all_tests():
     """Run all algorithm tests"""
     print("=" * 80)
@@ -199,6 +971,31 @@ def run_all_tests():
         test_no_path()
         test_optimal_path()
         test_performance_ordering()
+        test_block_astar()
+        test_quadtree_search()
+        test_rsr_graph()
+        test_hda_star()
+        test_distance_matrix()
+        test_goal_bounding()
+        test_dead_end_pruning()
+        test_corridor_search()
+        test_dynamic_connectivity()
+        test_dijkstra_tree()
+        test_query_cache()
+        test_contraction_hierarchy()
+        test_subgoal_graph()
+        test_cpd()
+        test_expansion_events()
+        test_execution_trace()
+        test_random_map_generation()
+        test_clustered_map_generation()
+        test_maze_generation()
+        test_spawned_streams()
+        test_select_start_end()
+        test_binary_map_format()
+        test_map_corpus()
+        test_procedural_map()
+        test_pipelined_suite()
 
         print("=" * 80)
         print("✓✓✓ ALL TESTS PASSED ✓✓✓")